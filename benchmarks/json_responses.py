@@ -0,0 +1,106 @@
+"""Benchmark of serializing /contacts responses.
+
+Compares FastAPI's default path, which validates the content against the
+route's return type, serializes it with pydantic and encodes it with
+``json``, with the fast path that returns a ``FastJSONResponse``. Every case
+starts from the ``Contact`` models a route gets from its service, so the
+work of turning them into dicts is timed too. Each is timed both end to end
+through an ASGI app and for serialization alone.
+
+Usage:
+    PYTHONPATH=. python benchmarks/json_responses.py
+"""
+
+import asyncio
+import json
+import time
+import timeit
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+from pydantic import TypeAdapter
+
+from src.domain.types.hubspot import Contact
+from src.presentation import responses
+from src.presentation.responses import FastJSONResponse
+from src.presentation.routers.contacts import project
+
+SIZES = (100, 10_000)
+
+
+def make_contacts(count: int) -> List[Contact]:
+    """Build the contacts of a response."""
+    return [
+        Contact(
+            id=str(index),
+            name=f"First{index} Last{index}",
+            email=f"contact{index}@example.com",
+            phone=f"+1 555 {index:07d}",
+        )
+        for index in range(count)
+    ]
+
+
+def make_app(contacts: List[Contact]) -> FastAPI:
+    """Create an app serving the contacts by each path."""
+    app = FastAPI()
+
+    @app.get("/default")
+    async def default() -> List[dict]:
+        return [project(contact, None) for contact in contacts]
+
+    @app.get("/fast")
+    async def fast() -> List[dict]:
+        return FastJSONResponse(contacts)
+
+    return app
+
+
+async def time_requests(app: FastAPI, path: str, rounds: int) -> float:
+    """Get the mean seconds per request to a path."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get(path)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await client.get(path)
+        return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    """Print the time per response of each path for each response size."""
+    serializer = "orjson" if responses.orjson is not None else "json (no orjson)"
+    print(f"fast path serializer: {serializer}")
+    for size in SIZES:
+        contacts = make_contacts(size)
+        rounds = max(10, 100_000 // size)
+        app = make_app(contacts)
+        print(f"\n{size:,} contacts, {rounds} rounds")
+
+        adapter = TypeAdapter(List[dict])
+
+        def default_encode() -> bytes:
+            content = [project(contact, None) for contact in contacts]
+            return json.dumps(
+                adapter.dump_python(adapter.validate_python(content), mode="json")
+            ).encode()
+
+        cases = {
+            "default encode (project + validate + json)": default_encode,
+            "fast encode of dicts (project + dumps)": lambda: responses.dumps(
+                [project(contact, None) for contact in contacts]
+            ),
+            "fast encode of models (dumps)": lambda: responses.dumps(contacts),
+        }
+        for name, func in cases.items():
+            elapsed = timeit.timeit(func, number=rounds) / rounds
+            print(f"  {name:44s} {elapsed * 1000:10.3f} ms")
+        for path in ("/default", "/fast"):
+            elapsed = asyncio.run(time_requests(app, path, rounds))
+            name = f"request {path}"
+            print(f"  {name:44s} {elapsed * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
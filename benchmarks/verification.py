@@ -0,0 +1,84 @@
+"""Microbenchmark of HubSpot request signature verification.
+
+Compares the previous string-based verifier with the current bytes-based one.
+
+Usage:
+    PYTHONPATH=. python benchmarks/verification.py
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+import timeit
+
+from src.domain.constants import URL_DECODE_MAP
+from src.domain.services.verification import HubSpotRequestVerifier
+
+SECRET = "benchmark-secret"
+METHOD = "POST"
+URL = "https://example.com/contacts/123/companies%3FportalId%3D456%26limit%3D10"
+DECODED_URL = "https://example.com/contacts/123/companies?portalId=456&limit=10"
+BODY = '{"properties": {"email": "someone@example.com", "firstname": "Some"}}' * 8
+ROUNDS = 100_000
+
+
+def legacy_verify(method: str, url: str, body: str, timestamp: str, signature: str):
+    """The string-based verification used before the bytes-based verifier."""
+    if not timestamp:
+        return False
+    if int(time.time() * 1000) - int(timestamp) > 300000:
+        return False
+    request_uri = url
+    for encoded, decoded in URL_DECODE_MAP.items():
+        request_uri = request_uri.replace(encoded, decoded)
+    raw_string = f"{method}{request_uri}{body}{timestamp}"
+    computed_signature = hmac.new(
+        SECRET.encode(), raw_string.encode(), hashlib.sha256
+    ).digest()
+    computed_signature = base64.b64encode(computed_signature).decode()
+    return hmac.compare_digest(computed_signature, signature)
+
+
+def main() -> None:
+    """Print verifications per second for each implementation."""
+    verifier = HubSpotRequestVerifier(SECRET)
+    timestamp = str(int(time.time() * 1000))
+    raw_string = f"{METHOD}{DECODED_URL}{BODY}{timestamp}"
+    signature = base64.b64encode(
+        hmac.new(SECRET.encode(), raw_string.encode(), hashlib.sha256).digest()
+    ).decode()
+
+    method_bytes, url_bytes, body_bytes = METHOD.encode(), URL.encode(), BODY.encode()
+    timestamp_bytes, signature_bytes = timestamp.encode(), signature.encode()
+    assert legacy_verify(METHOD, URL, BODY, timestamp, signature)
+    assert verifier.verify(
+        method_bytes, url_bytes, body_bytes, timestamp_bytes, signature_bytes
+    )
+
+    async def run_async() -> None:
+        for _ in range(ROUNDS):
+            await verifier.verify_request(METHOD, URL, BODY, timestamp, signature)
+
+    cases = {
+        "legacy (str, per-call key)": lambda: legacy_verify(
+            METHOD, URL, BODY, timestamp, signature
+        ),
+        "verify (bytes, sync)": lambda: verifier.verify(
+            method_bytes, url_bytes, body_bytes, timestamp_bytes, signature_bytes
+        ),
+    }
+    for name, func in cases.items():
+        elapsed = timeit.timeit(func, number=ROUNDS)
+        print(f"{name:32s} {ROUNDS / elapsed:12,.0f} verifications/s")
+
+    start = time.perf_counter()
+    asyncio.run(run_async())
+    elapsed = time.perf_counter() - start
+    name = "verify_request (str, async)"
+    print(f"{name:32s} {ROUNDS / elapsed:12,.0f} verifications/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,11 @@ from datetime import datetime, timedelta
 from src.domain.interfaces.hubspot import IHubSpotAuth
 from src.domain.interfaces.repository import IHubSpotOAuthRepository
 from src.domain.types.hubspot import HubSpotOAuthData, UserInfo
-from src.domain.exceptions import HubSpotOperationError
+from src.domain.exceptions import (
+    HubSpotAuthenticationError,
+    HubSpotOperationError,
+    StaleOAuthDataError,
+)
 
 
 class AuthService:
@@ -51,7 +55,7 @@ class AuthService:
         except Exception as e:
             raise HubSpotOperationError(f"Failed to handle OAuth callback: {str(e)}")
 
-    async def refresh_token(self, hub_id: str) -> None:
+    async def refresh_token(self, hub_id: str) -> HubSpotOAuthData:
         """Refresh access token for a HubSpot installation."""
         try:
             # Get existing OAuth data
@@ -60,7 +64,7 @@ class AuthService:
                 raise HubSpotOperationError(f"No OAuth data found for hub ID: {hub_id}")
 
             # Refresh token
-            token_response = await self.auth_client.refresh_token(
+            token_response = await self.auth_client.refresh_access_token(
                 oauth_data.refresh_token
             )
 
@@ -75,8 +79,12 @@ class AuthService:
                 installed_at=oauth_data.installed_at,
                 user_id=oauth_data.user_id,
                 app_id=oauth_data.app_id,
+                version=oauth_data.version + 1,
             )
 
             await self.repository.update(updated_data)
+            return updated_data
+        except (HubSpotAuthenticationError, StaleOAuthDataError):
+            raise
         except Exception as e:
             raise HubSpotOperationError(f"Failed to refresh token: {str(e)}")
@@ -0,0 +1,372 @@
+"""Service wrappers that share identical concurrent HubSpot reads."""
+
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from src.domain.interfaces.hubspot import (
+    IHubSpotCompanyService,
+    IHubSpotContactService,
+    IHubSpotPropertyService,
+)
+from src.domain.services.request_context import current_portal
+from src.domain.services.single_flight import SingleFlight
+from src.domain.types.hubspot import AssociationResult, Company, Contact
+
+
+class _Coalescer:
+    """Share one call between concurrent reads of the same portal and params.
+
+    Reads are keyed by the portal set by ``portal_context``, or the access
+    token when no portal is set, plus the operation and its parameters.
+    Every waiter receives the shared result or exception, so results must
+    not be mutated. A waiter being cancelled leaves the call running for
+    the others, and the call is cancelled once all of them have gone.
+    """
+
+    def __init__(self):
+        """Initialize the coalescer with no reads in flight."""
+        self._reads: SingleFlight[Any] = SingleFlight()
+
+    def read(
+        self,
+        access_token: str,
+        operation: str,
+        params: Tuple[Hashable, ...],
+        load: Callable[[], Awaitable[Any]],
+    ) -> Awaitable[Any]:
+        """Run a read, or join the identical read already in flight."""
+        key = (current_portal() or access_token, operation, params)
+        return self._reads.do(key, load)
+
+
+def _fields_key(fields: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    """Make a list of requested fields hashable."""
+    return tuple(fields) if fields is not None else None
+
+
+class CoalescingContactService(IHubSpotContactService):
+    """Contact service whose identical concurrent page reads share one call.
+
+    Streams are not shared and go straight to the wrapped service.
+    """
+
+    def __init__(self, service: IHubSpotContactService):
+        """Initialize the wrapper.
+
+        Args:
+            service (IHubSpotContactService): The service making the calls.
+        """
+        self.service = service
+        self._coalescer = _Coalescer()
+
+    async def get_contacts(
+        self,
+        access_token: str,
+        limit: int = 10,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Contact]:
+        """Get a page of contacts, sharing an identical read in flight.
+
+        Args:
+            access_token (str): The access token.
+            limit (int): The maximum number of contacts to return.
+            after (Optional[str]): The cursor to start after.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every contact field.
+
+        Returns:
+            List[Contact]: The contacts, shared with the other waiters.
+        """
+        return await self._coalescer.read(
+            access_token,
+            "get_contacts",
+            (limit, after, _fields_key(fields)),
+            lambda: self.service.get_contacts(access_token, limit, after, fields),
+        )
+
+    def iter_contacts(
+        self,
+        access_token: str,
+        page_size: int = 100,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Contact]]:
+        """Iterate over every contact through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            page_size (int): The number of contacts per page.
+            after (Optional[str]): The cursor to start after.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every contact field.
+
+        Returns:
+            AsyncIterator[List[Contact]]: The contacts of each page.
+        """
+        return self.service.iter_contacts(access_token, page_size, after, fields)
+
+    def iter_modified_contacts(
+        self,
+        access_token: str,
+        since: datetime,
+        page_size: int = 100,
+    ) -> AsyncIterator[List[Contact]]:
+        """Iterate over modified contacts through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            since (datetime): The earliest modification to return.
+            page_size (int): The number of contacts per page.
+
+        Returns:
+            AsyncIterator[List[Contact]]: The contacts of each page.
+        """
+        return self.service.iter_modified_contacts(access_token, since, page_size)
+
+
+class CoalescingCompanyService(IHubSpotCompanyService):
+    """Company service whose identical concurrent reads share one call.
+
+    Association changes and streams go straight to the wrapped service. A
+    read is only joined while it is in flight, so a read started after a
+    change completes always sees it.
+    """
+
+    def __init__(self, service: IHubSpotCompanyService):
+        """Initialize the wrapper.
+
+        Args:
+            service (IHubSpotCompanyService): The service making the calls.
+        """
+        self.service = service
+        self._coalescer = _Coalescer()
+
+    async def get_companies_associated_with_contact(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        after: Optional[str] = None,
+    ) -> List[Company]:
+        """Get a contact's companies, sharing an identical read in flight.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+            after (Optional[str]): The associations cursor to start after.
+
+        Returns:
+            List[Company]: The companies, shared with the other waiters.
+        """
+        companies, _ = await self.get_companies_page(
+            access_token, contact_id, limit=limit, after=after, fields=fields
+        )
+        return companies
+
+    async def get_companies_page(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Company], Optional[str]]:
+        """Get a page of a contact's companies, sharing an identical read.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            after (Optional[str]): The associations cursor to start after.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Returns:
+            Tuple[List[Company], Optional[str]]: The companies, and the cursor
+                of the next page if there are more.
+        """
+        return await self._coalescer.read(
+            access_token,
+            "get_companies_page",
+            (contact_id, limit, after, _fields_key(fields)),
+            lambda: self.service.get_companies_page(
+                access_token, contact_id, limit=limit, after=after, fields=fields
+            ),
+        )
+
+    async def get_companies_for_contacts(
+        self,
+        access_token: str,
+        contact_ids: List[str],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, List[Company]]:
+        """Get the companies of several contacts, sharing an identical read.
+
+        Args:
+            access_token (str): The access token.
+            contact_ids (List[str]): The IDs of the contacts.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Returns:
+            Dict[str, List[Company]]: The companies of each contact, keyed by
+                contact ID.
+        """
+        return await self._coalescer.read(
+            access_token,
+            "get_companies_for_contacts",
+            (tuple(contact_ids), _fields_key(fields)),
+            lambda: self.service.get_companies_for_contacts(
+                access_token, contact_ids, fields=fields
+            ),
+        )
+
+    def iter_companies(
+        self,
+        access_token: str,
+        page_size: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over every company through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            page_size (int): The number of companies per page.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Returns:
+            AsyncIterator[List[Company]]: The companies of each page.
+        """
+        return self.service.iter_companies(access_token, page_size, fields)
+
+    def iter_modified_companies(
+        self,
+        access_token: str,
+        since: datetime,
+        page_size: int = 100,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over modified companies through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            since (datetime): The earliest modification to return.
+            page_size (int): The number of companies per page.
+
+        Returns:
+            AsyncIterator[List[Company]]: The companies of each page.
+        """
+        return self.service.iter_modified_companies(access_token, since, page_size)
+
+    async def create_association(
+        self,
+        access_token: str,
+        contact_id: str,
+        company_id: str,
+    ) -> None:
+        """Create an association through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            company_id (str): The ID of the company.
+        """
+        await self.service.create_association(access_token, contact_id, company_id)
+
+    async def remove_association(
+        self,
+        access_token: str,
+        contact_id: str,
+        company_id: str,
+    ) -> None:
+        """Remove an association through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            company_id (str): The ID of the company.
+        """
+        await self.service.remove_association(access_token, contact_id, company_id)
+
+    async def create_associations(
+        self,
+        access_token: str,
+        pairs: List[Tuple[str, str]],
+    ) -> List[AssociationResult]:
+        """Create many associations through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            pairs (List[Tuple[str, str]]): The (contact ID, company ID) pairs
+                to associate.
+
+        Returns:
+            List[AssociationResult]: The outcome of each distinct pair.
+        """
+        return await self.service.create_associations(access_token, pairs)
+
+    async def remove_associations(
+        self,
+        access_token: str,
+        pairs: List[Tuple[str, str]],
+    ) -> List[AssociationResult]:
+        """Remove many associations through the wrapped service.
+
+        Args:
+            access_token (str): The access token.
+            pairs (List[Tuple[str, str]]): The (contact ID, company ID) pairs
+                to dissociate.
+
+        Returns:
+            List[AssociationResult]: The outcome of each distinct pair.
+        """
+        return await self.service.remove_associations(access_token, pairs)
+
+
+class CoalescingPropertyService(IHubSpotPropertyService):
+    """Property service whose concurrent schema reads share one call."""
+
+    def __init__(self, service: IHubSpotPropertyService):
+        """Initialize the wrapper.
+
+        Args:
+            service (IHubSpotPropertyService): The service making the calls.
+        """
+        self.service = service
+        self._coalescer = _Coalescer()
+
+    async def get_property_names(
+        self, access_token: str, object_type: str
+    ) -> List[str]:
+        """Get an object type's property names, sharing a read in flight.
+
+        Args:
+            access_token (str): The access token.
+            object_type (str): The object type, e.g. "contacts" or "companies".
+
+        Returns:
+            List[str]: The property names, shared with the other waiters.
+        """
+        return await self._coalescer.read(
+            access_token,
+            "get_property_names",
+            (object_type,),
+            lambda: self.service.get_property_names(access_token, object_type),
+        )
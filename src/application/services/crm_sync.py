@@ -0,0 +1,326 @@
+"""Background sync of each portal's contacts and companies into a local mirror."""
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from src.application.services.token_manager import TokenManager
+from src.domain.exceptions import HubSpotException
+from src.domain.interfaces.hubspot import IHubSpotCompanyService, IHubSpotContactService
+from src.domain.interfaces.repository import ICrmMirrorRepository
+from src.domain.services.request_context import Priority, priority_context
+from src.domain.types.hubspot import Company, Contact, HubSpotOAuthData
+
+logger = logging.getLogger(__name__)
+
+CONTACTS = "contacts"
+COMPANIES = "companies"
+
+# Last-modified properties carried in the ``properties`` of synced objects
+CONTACT_MODIFIED_PROPERTY = "lastmodifieddate"
+COMPANY_MODIFIED_PROPERTY = "hs_lastmodifieddate"
+
+# Start of a search that returns every object
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Sync state of the last pass removing objects HubSpot no longer has
+RECONCILED = "reconciled"
+# The only property needed to tell which objects still exist
+ID_FIELDS = ["hs_object_id"]
+
+
+def _latest_modification(
+    items: List, modified_property: str, current: datetime
+) -> datetime:
+    """Get the latest last-modified time of contacts or companies."""
+    for item in items:
+        value = item.properties.get(modified_property)
+        if value:
+            current = max(current, datetime.fromisoformat(value))
+    return current
+
+
+async def _collect_ids(pages: AsyncIterator[List]) -> Set[str]:
+    """Collect the IDs of pages of contacts or companies."""
+    ids: Set[str] = set()
+    async with contextlib.aclosing(pages):
+        async for page in pages:
+            ids.update(item.id for item in page)
+    return ids
+
+
+class CrmSyncService:
+    """Mirror every portal's contacts, companies and associations locally.
+
+    A portal's contacts are first backfilled by listing every contact, with
+    the associations of each page read in one batch. After that, each round
+    searches for contacts and companies whose last-modified date is at or
+    after the stored watermark, less ``overlap_seconds`` to absorb search
+    index lag, and refreshes the associations of the modified contacts.
+    Companies are backfilled with a search from the epoch. Deleted and
+    merged objects never show up in those searches, so every
+    ``reconcile_interval_seconds`` the IDs of all contacts and companies
+    are listed and mirrored objects missing from the lists are removed.
+    Portals are synced side by side, at most ``concurrency`` at once, and
+    sync calls run at background priority, behind interactive requests.
+    """
+
+    def __init__(
+        self,
+        token_manager: TokenManager,
+        contact_service: IHubSpotContactService,
+        company_service: IHubSpotCompanyService,
+        mirror: ICrmMirrorRepository,
+        interval_seconds: float = 300.0,
+        overlap_seconds: float = 60.0,
+        reconcile_interval_seconds: float = 86400.0,
+        page_size: int = 100,
+        concurrency: int = 4,
+    ):
+        """Initialize the sync service.
+
+        Args:
+            token_manager (TokenManager): Provides and refreshes access tokens.
+            contact_service (IHubSpotContactService): Reads contacts.
+            company_service (IHubSpotCompanyService): Reads companies.
+            mirror (ICrmMirrorRepository): Stores the mirrored objects.
+            interval_seconds (float): Delay between sync rounds.
+            overlap_seconds (float): How far before the watermark each
+                incremental search starts.
+            reconcile_interval_seconds (float): Delay between passes removing
+                objects deleted or merged away in HubSpot.
+            page_size (int): Number of objects per page.
+            concurrency (int): Maximum number of portals synced at once.
+        """
+        self.token_manager = token_manager
+        self.repository = token_manager.repository
+        self.contact_service = contact_service
+        self.company_service = company_service
+        self.mirror = mirror
+        self.interval_seconds = interval_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.reconcile_interval = timedelta(seconds=reconcile_interval_seconds)
+        self.page_size = page_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._syncing: Set[str] = set()
+        self._runner: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start syncing in the background."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop syncing, abandoning the round in progress."""
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def run(self) -> None:
+        """Sync every portal every ``interval_seconds`` until cancelled."""
+        while True:
+            await self.sync_all()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def sync_all(self) -> None:
+        """Sync every installed portal once."""
+        with priority_context(Priority.BACKGROUND):
+            await self._sync_all()
+
+    async def _sync_all(self) -> None:
+        """Sync every installed portal once at the current priority."""
+        try:
+            installations = await self.repository.list_all()
+        except HubSpotException as e:
+            logger.warning("Failed to load installations: %s", e)
+            return
+        await asyncio.gather(
+            *(self._sync_portal_logged(oauth_data) for oauth_data in installations)
+        )
+
+    async def _sync_portal_logged(self, oauth_data: HubSpotOAuthData) -> None:
+        """Sync a portal once a slot is free, logging a failure."""
+        async with self._semaphore:
+            try:
+                await self.sync_portal(oauth_data)
+            except HubSpotException as e:
+                logger.warning("Failed to sync hub %s: %s", oauth_data.hub_id, e)
+
+    async def is_ready(self, hub_id: str) -> bool:
+        """Check whether a portal's contacts have been backfilled.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+
+        Returns:
+            bool: Whether the mirror can serve the portal's reads.
+        """
+        return await self.mirror.get_synced_until(hub_id, CONTACTS) is not None
+
+    async def sync_portal(self, oauth_data: HubSpotOAuthData) -> None:
+        """Bring a portal's mirror up to date.
+
+        Args:
+            oauth_data (HubSpotOAuthData): The portal's OAuth data.
+        """
+        hub_id = oauth_data.hub_id
+        if hub_id in self._syncing:
+            return
+        self._syncing.add(hub_id)
+        try:
+            await self._sync_contacts(oauth_data)
+            await self._sync_companies(oauth_data)
+            await self._reconcile(oauth_data)
+        finally:
+            self._syncing.discard(hub_id)
+
+    async def _sync_contacts(self, oauth_data: HubSpotOAuthData) -> None:
+        """Backfill or incrementally sync a portal's contacts."""
+        hub_id = oauth_data.hub_id
+        synced_until = await self.mirror.get_synced_until(hub_id, CONTACTS)
+
+        if synced_until is None:
+
+            async def backfill(access_token: str) -> datetime:
+                started = datetime.now(timezone.utc)
+                await self._store_contacts(
+                    hub_id,
+                    access_token,
+                    self.contact_service.iter_contacts(
+                        access_token, page_size=self.page_size
+                    ),
+                )
+                return started
+
+            synced_until = await self.token_manager.call_with_token(
+                oauth_data, backfill
+            )
+            # Nothing deleted before the backfill started is mirrored
+            await self.mirror.set_synced_until(hub_id, RECONCILED, synced_until)
+            logger.info("Backfilled contacts of hub %s", hub_id)
+        else:
+            since = synced_until - self.overlap
+
+            async def incremental(access_token: str) -> datetime:
+                contacts = await self._store_contacts(
+                    hub_id,
+                    access_token,
+                    self.contact_service.iter_modified_contacts(
+                        access_token, since, page_size=self.page_size
+                    ),
+                )
+                return _latest_modification(
+                    contacts, CONTACT_MODIFIED_PROPERTY, synced_until
+                )
+
+            synced_until = await self.token_manager.call_with_token(
+                oauth_data, incremental
+            )
+        await self.mirror.set_synced_until(hub_id, CONTACTS, synced_until)
+
+    async def _store_contacts(
+        self,
+        hub_id: str,
+        access_token: str,
+        pages: AsyncIterator[List[Contact]],
+    ) -> List[Contact]:
+        """Store pages of contacts together with their associations.
+
+        Returns:
+            List[Contact]: The last page of contacts stored.
+        """
+        contacts: List[Contact] = []
+        async with contextlib.aclosing(pages):
+            async for page in pages:
+                if not page:
+                    continue
+                # Complete lists, every association page included, since
+                # they replace what is mirrored
+                companies_by_contact = (
+                    await self.company_service.get_companies_for_contacts(
+                        access_token, [contact.id for contact in page]
+                    )
+                )
+                companies: Dict[str, Company] = {
+                    company.id: company
+                    for page_companies in companies_by_contact.values()
+                    for company in page_companies
+                }
+                await self.mirror.upsert_companies(hub_id, list(companies.values()))
+                await self.mirror.upsert_contacts(hub_id, page)
+                await self.mirror.replace_contact_companies(
+                    hub_id,
+                    {
+                        contact_id: [company.id for company in page_companies]
+                        for contact_id, page_companies in companies_by_contact.items()
+                    },
+                )
+                contacts = page
+        return contacts
+
+    async def _sync_companies(self, oauth_data: HubSpotOAuthData) -> None:
+        """Backfill or incrementally sync a portal's companies."""
+        hub_id = oauth_data.hub_id
+        synced_until = await self.mirror.get_synced_until(hub_id, COMPANIES)
+        since = EPOCH if synced_until is None else synced_until - self.overlap
+        started = datetime.now(timezone.utc)
+
+        async def sync(access_token: str) -> datetime:
+            latest = synced_until or EPOCH
+            pages = self.company_service.iter_modified_companies(
+                access_token, since, page_size=self.page_size
+            )
+            async with contextlib.aclosing(pages):
+                async for page in pages:
+                    await self.mirror.upsert_companies(hub_id, page)
+                    latest = _latest_modification(
+                        page, COMPANY_MODIFIED_PROPERTY, latest
+                    )
+            # A backfill has seen everything up to when it started
+            return max(latest, started) if synced_until is None else latest
+
+        synced_until = await self.token_manager.call_with_token(oauth_data, sync)
+        await self.mirror.set_synced_until(hub_id, COMPANIES, synced_until)
+
+    async def _reconcile(self, oauth_data: HubSpotOAuthData) -> None:
+        """Remove mirrored objects HubSpot no longer has, when a pass is due.
+
+        The pass lists IDs in ID order rather than searching, since search
+        pages shift while objects are modified and could skip one that
+        still exists.
+        """
+        hub_id = oauth_data.hub_id
+        reconciled = await self.mirror.get_synced_until(hub_id, RECONCILED)
+        started = datetime.now(timezone.utc)
+        if reconciled is not None and started - reconciled < self.reconcile_interval:
+            return
+
+        async def list_ids(access_token: str) -> Dict[str, Set[str]]:
+            return {
+                CONTACTS: await _collect_ids(
+                    self.contact_service.iter_contacts(
+                        access_token, page_size=self.page_size, fields=ID_FIELDS
+                    )
+                ),
+                COMPANIES: await _collect_ids(
+                    self.company_service.iter_companies(
+                        access_token, page_size=self.page_size, fields=ID_FIELDS
+                    )
+                ),
+            }
+
+        existing = await self.token_manager.call_with_token(oauth_data, list_ids)
+        for object_type, ids in existing.items():
+            deleted = await self.mirror.list_ids(hub_id, object_type) - ids
+            if deleted:
+                await self.mirror.delete_objects(hub_id, object_type, deleted)
+                logger.info(
+                    "Removed %d deleted %s of hub %s", len(deleted), object_type, hub_id
+                )
+        await self.mirror.set_synced_until(hub_id, RECONCILED, started)
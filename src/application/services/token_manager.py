@@ -0,0 +1,173 @@
+"""Access token lifecycle management."""
+
+import contextlib
+import time
+from datetime import datetime
+from typing import (
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from src.application.services.auth_service import AuthService
+from src.domain.exceptions import (
+    HubSpotAuthenticationError,
+    HubSpotException,
+    HubSpotOperationError,
+    StaleOAuthDataError,
+)
+from src.domain.services.request_context import portal_context
+from src.domain.services.single_flight import SingleFlight
+from src.domain.types.hubspot import HubSpotOAuthData
+
+T = TypeVar("T")
+
+
+@contextlib.asynccontextmanager
+async def _unlocked(hub_id: str) -> AsyncIterator[None]:
+    """Stand in for the lock of a repository that has none."""
+    yield
+
+
+class TokenManager:
+    """Refresh HubSpot access tokens with at most one refresh per portal.
+
+    HubSpot rotates refresh tokens, so concurrent refreshes for the same
+    portal are coalesced into a single call whose result every caller
+    receives. If the repository exposes ``lock(hub_id)`` (as the file
+    repository does), the refresh also holds that lock, shared with other
+    worker processes, and reuses a token another process refreshed while
+    it waited. After a failed refresh, further attempts for that portal
+    fail fast until ``failure_backoff_seconds`` have passed.
+    """
+
+    def __init__(
+        self,
+        auth_service: AuthService,
+        failure_backoff_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the token manager.
+
+        Args:
+            auth_service (AuthService): Performs the refresh and persists it.
+            failure_backoff_seconds (float): How long refreshes for a portal
+                fail fast after a failed refresh.
+            clock (Callable[[], float]): Monotonic clock, mainly for tests.
+        """
+        self.auth_service = auth_service
+        self.repository = auth_service.repository
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self._clock = clock
+        # A refresh must not be abandoned half way: HubSpot may already have
+        # rotated the refresh token we are about to persist.
+        self._refreshes: SingleFlight[HubSpotOAuthData] = SingleFlight(
+            cancel_when_abandoned=False
+        )
+        self._failures: Dict[str, Tuple[float, str]] = {}
+        self._lock: Callable[[str], AsyncContextManager[None]] = getattr(
+            self.repository, "lock", _unlocked
+        )
+
+    async def refresh(
+        self, hub_id: str, stale_access_token: Optional[str] = None
+    ) -> HubSpotOAuthData:
+        """Refresh the access token of a portal, joining any refresh in flight.
+
+        Args:
+            hub_id (str): The hub ID of the installation.
+            stale_access_token (Optional[str]): The access token the caller
+                found expired or rejected. If the stored token has already
+                been replaced, the stored data is returned without refreshing.
+
+        Returns:
+            HubSpotOAuthData: The OAuth data with a valid access token.
+
+        Raises:
+            HubSpotAuthenticationError: If the refresh token is rejected or the
+                portal is backing off after a failed refresh.
+            HubSpotOperationError: If the token cannot be refreshed.
+        """
+        return await self._refreshes.do(
+            hub_id, lambda: self._refresh(hub_id, stale_access_token)
+        )
+
+    async def _refresh(
+        self, hub_id: str, stale_access_token: Optional[str]
+    ) -> HubSpotOAuthData:
+        """Refresh the access token of a portal."""
+        failure = self._failures.get(hub_id)
+        if failure is not None:
+            failed_until, reason = failure
+            if self._clock() < failed_until:
+                raise HubSpotAuthenticationError(
+                    f"Token refresh for hub ID {hub_id} recently failed: {reason}"
+                )
+            del self._failures[hub_id]
+
+        async with self._lock(hub_id):
+            # Read after taking the lock to see refreshes by other processes
+            oauth_data = await self.repository.get_by_hub_id(hub_id)
+            if not oauth_data:
+                raise HubSpotOperationError(
+                    f"No OAuth data found for hub ID: {hub_id}"
+                )
+
+            # Another caller already replaced the token we were asked to refresh
+            if (
+                stale_access_token is not None
+                and oauth_data.access_token != stale_access_token
+                and datetime.now() < oauth_data.expires_at
+            ):
+                return oauth_data
+
+            try:
+                return await self.auth_service.refresh_token(hub_id)
+            except StaleOAuthDataError:
+                # Newer data was written meanwhile, e.g. by a reinstall
+                newer = await self.repository.get_by_hub_id(hub_id)
+                if newer is not None:
+                    return newer
+                raise
+            except HubSpotException as e:
+                self._failures[hub_id] = (
+                    self._clock() + self.failure_backoff_seconds,
+                    str(e),
+                )
+                raise
+
+    async def call_with_token(
+        self,
+        oauth_data: HubSpotOAuthData,
+        func: Callable[[str], Awaitable[T]],
+    ) -> T:
+        """Call HubSpot with a portal's token, refreshing and retrying once on 401.
+
+        The calls made by ``func`` are attributed to the portal for rate
+        limiting.
+
+        Args:
+            oauth_data (HubSpotOAuthData): The OAuth data of the portal.
+            func (Callable[[str], Awaitable[T]]): Makes the call with an access
+                token.
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            HubSpotAuthenticationError: If the call is rejected again after the
+                token was refreshed, or the refresh fails.
+        """
+        with portal_context(oauth_data.hub_id):
+            try:
+                return await func(oauth_data.access_token)
+            except HubSpotAuthenticationError:
+                refreshed = await self.refresh(
+                    oauth_data.hub_id, stale_access_token=oauth_data.access_token
+                )
+                return await func(refreshed.access_token)
@@ -0,0 +1,176 @@
+"""Proactive background refresh of HubSpot access tokens."""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.application.services.token_manager import TokenManager
+from src.domain.exceptions import HubSpotException
+from src.domain.types.hubspot import HubSpotOAuthData
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefreshScheduler:
+    """Refresh every installation's token shortly before it expires.
+
+    Installations are kept in a min-heap keyed by the time their token should
+    be refreshed (``expires_at`` minus ``margin_seconds``). Due refreshes run
+    through the ``TokenManager``, so they are coalesced with any refresh the
+    request path starts, with at most ``concurrency`` running at once. The
+    heap is resynchronised with the repository every ``resync_seconds`` to
+    pick up new and removed installations. Only installations due before
+    the next resync are loaded, through the repository's
+    ``list_expiring(before)`` when it has one (as the SQLite repository
+    does, from its expiry index).
+    """
+
+    def __init__(
+        self,
+        token_manager: TokenManager,
+        margin_seconds: float = 300.0,
+        concurrency: int = 4,
+        resync_seconds: float = 60.0,
+        retry_seconds: float = 30.0,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            token_manager (TokenManager): Performs the refreshes.
+            margin_seconds (float): How long before expiry a token is refreshed.
+            concurrency (int): Maximum number of refreshes running at once.
+            resync_seconds (float): How often the installation list is reloaded.
+            retry_seconds (float): Delay before retrying a failed refresh.
+        """
+        self.token_manager = token_manager
+        self.repository = token_manager.repository
+        self.margin = timedelta(seconds=margin_seconds)
+        self.resync_seconds = resync_seconds
+        self.retry = timedelta(seconds=retry_seconds)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._heap: List[Tuple[datetime, str]] = []
+        self._scheduled: Dict[str, datetime] = {}
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+
+    def schedule(self, oauth_data: HubSpotOAuthData) -> None:
+        """Schedule the refresh of an installation's token.
+
+        Args:
+            oauth_data (HubSpotOAuthData): The installation's current OAuth data.
+        """
+        self._schedule_at(oauth_data.hub_id, oauth_data.expires_at - self.margin)
+
+    def _schedule_at(self, hub_id: str, refresh_at: datetime) -> None:
+        """Schedule a refresh, replacing any earlier schedule for the hub ID."""
+        if self._scheduled.get(hub_id) == refresh_at:
+            return
+        self._scheduled[hub_id] = refresh_at
+        heapq.heappush(self._heap, (refresh_at, hub_id))
+        if self._heap[0] == (refresh_at, hub_id):
+            self._wakeup.set()
+
+    async def _list_due(self, before: datetime) -> List[HubSpotOAuthData]:
+        """List the installations whose token expires at or before a time."""
+        list_expiring = getattr(self.repository, "list_expiring", None)
+        if list_expiring is not None:
+            return await list_expiring(before)
+        installations = await self.repository.list_all()
+        return [data for data in installations if data.expires_at <= before]
+
+    async def resync(self) -> None:
+        """Reload the installations due before the next resync.
+
+        Installations due later are dropped from the heap and loaded again
+        by the resync before they are due.
+        """
+        installations = await self._list_due(
+            datetime.now() + self.margin + timedelta(seconds=self.resync_seconds)
+        )
+        hub_ids = {oauth_data.hub_id for oauth_data in installations}
+        for hub_id in list(self._scheduled):
+            if hub_id not in hub_ids:
+                del self._scheduled[hub_id]
+        for oauth_data in installations:
+            if oauth_data.hub_id not in self._refreshing:
+                self.schedule(oauth_data)
+
+    def start(self) -> None:
+        """Start the scheduler in the background."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler and wait for running refreshes to finish."""
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def run(self) -> None:
+        """Refresh tokens as they become due until cancelled."""
+        loop = asyncio.get_running_loop()
+        next_resync = loop.time()
+        while True:
+            if loop.time() >= next_resync:
+                try:
+                    await self.resync()
+                except HubSpotException as e:
+                    logger.warning("Failed to load installations: %s", e)
+                next_resync = loop.time() + self.resync_seconds
+
+            self._start_due_refreshes()
+
+            timeout = next_resync - loop.time()
+            if self._heap:
+                until_due = (self._heap[0][0] - datetime.now()).total_seconds()
+                timeout = min(timeout, until_due)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+    def _start_due_refreshes(self) -> None:
+        """Pop every due installation and start its refresh."""
+        now = datetime.now()
+        while self._heap and self._heap[0][0] <= now:
+            refresh_at, hub_id = heapq.heappop(self._heap)
+            # Skip entries superseded by a later schedule or a removal
+            if self._scheduled.get(hub_id) != refresh_at:
+                continue
+            del self._scheduled[hub_id]
+            self._refreshing.add(hub_id)
+            task = asyncio.create_task(self._refresh(hub_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, hub_id: str) -> None:
+        """Refresh one installation's token and schedule the next refresh."""
+        try:
+            async with self._semaphore:
+                oauth_data = await self.repository.get_by_hub_id(hub_id)
+                if oauth_data is None:
+                    return
+                # Already refreshed elsewhere, e.g. on the request path
+                if oauth_data.expires_at - self.margin > datetime.now():
+                    self.schedule(oauth_data)
+                    return
+                refreshed = await self.token_manager.refresh(
+                    hub_id, stale_access_token=oauth_data.access_token
+                )
+                self.schedule(refreshed)
+        except HubSpotException as e:
+            logger.warning("Failed to refresh token for hub %s: %s", hub_id, e)
+            self._schedule_at(hub_id, datetime.now() + self.retry)
+        finally:
+            self._refreshing.discard(hub_id)
@@ -14,3 +14,17 @@ class HubSpotOperationError(HubSpotException):
     """Exception raised when HubSpot operations fail."""
 
     pass
+
+
+class StaleOAuthDataError(HubSpotOperationError):
+    """Exception raised when OAuth data is written over a newer version."""
+
+    pass
+
+
+class HubSpotUnavailableError(HubSpotOperationError):
+    """Exception raised when HubSpot calls are shed during an upstream incident."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
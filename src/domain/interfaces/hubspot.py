@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Protocol
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Protocol, Tuple
 
-from src.domain.types.hubspot import UserInfo, Company, Contact
+from src.domain.types.hubspot import AssociationResult, UserInfo, Company, Contact
 
 
 class IHubSpotAuth(Protocol):
@@ -54,7 +55,11 @@ class IHubSpotContactService(ABC):
 
     @abstractmethod
     async def get_contacts(
-        self, access_token: str, limit: int = 10, after: Optional[str] = None
+        self,
+        access_token: str,
+        limit: int = 10,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Contact]:
         """Get contacts from HubSpot.
 
@@ -62,6 +67,50 @@ class IHubSpotContactService(ABC):
             access_token (str): The access token.
             limit (int): The maximum number of contacts to return.
             after (Optional[str]): The ID of the last contact to return.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every contact field.
+        """
+        pass
+
+    @abstractmethod
+    def iter_contacts(
+        self,
+        access_token: str,
+        page_size: int = 100,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Contact]]:
+        """Iterate over every contact in HubSpot, one page at a time.
+
+        Args:
+            access_token (str): The access token.
+            page_size (int): The number of contacts per page.
+            after (Optional[str]): The cursor to start after.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every contact field.
+
+        Returns:
+            AsyncIterator[List[Contact]]: The contacts of each page.
+        """
+        pass
+
+    @abstractmethod
+    def iter_modified_contacts(
+        self,
+        access_token: str,
+        since: datetime,
+        page_size: int = 100,
+    ) -> AsyncIterator[List[Contact]]:
+        """Iterate over contacts modified at or after a time, oldest first.
+
+        Args:
+            access_token (str): The access token.
+            since (datetime): The earliest modification to return.
+            page_size (int): The number of contacts per page.
+
+        Returns:
+            AsyncIterator[List[Contact]]: The contacts of each page, each
+                with its ``lastmodifieddate`` in ``properties``.
         """
         pass
 
@@ -71,14 +120,102 @@ class IHubSpotCompanyService(ABC):
 
     @abstractmethod
     async def get_companies_associated_with_contact(
-        self, access_token: str, contact_id: str, limit: int = 10
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        after: Optional[str] = None,
     ) -> List[Company]:
         """Get companies associated with a contact.
 
         Args:
             access_token: OAuth access token
             contact_id: HubSpot contact ID
-            limit: Maximum number of companies to retrieve (default: 10)
+            limit: Maximum number of companies to retrieve (default: all)
+            fields: Fields to fetch, or None for every company field
+            after: Associations cursor to start after
+        """
+        pass
+
+    @abstractmethod
+    async def get_companies_page(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Company], Optional[str]]:
+        """Get companies associated with a contact and the cursor after them.
+
+        Args:
+            access_token: OAuth access token
+            contact_id: HubSpot contact ID
+            limit: Maximum number of companies to retrieve (default: all)
+            after: Associations cursor to start after
+            fields: Fields to fetch, or None for every company field
+
+        Returns:
+            The companies, and the cursor of the next page if there are more
+        """
+        pass
+
+    @abstractmethod
+    async def get_companies_for_contacts(
+        self,
+        access_token: str,
+        contact_ids: List[str],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, List[Company]]:
+        """Get the companies associated with each of several contacts.
+
+        Args:
+            access_token: OAuth access token
+            contact_ids: HubSpot contact IDs
+            fields: Fields to fetch, or None for every company field
+
+        Returns:
+            The companies of each contact, keyed by contact ID
+        """
+        pass
+
+    @abstractmethod
+    def iter_companies(
+        self,
+        access_token: str,
+        page_size: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over every company in HubSpot, one page at a time.
+
+        Args:
+            access_token: OAuth access token
+            page_size: Number of companies per page
+            fields: Fields to fetch, or None for every company field
+
+        Returns:
+            The companies of each page, in ID order
+        """
+        pass
+
+    @abstractmethod
+    def iter_modified_companies(
+        self,
+        access_token: str,
+        since: datetime,
+        page_size: int = 100,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over companies modified at or after a time, oldest first.
+
+        Args:
+            access_token: OAuth access token
+            since: Earliest modification to return
+            page_size: Number of companies per page
+
+        Returns:
+            The companies of each page, each with its ``hs_lastmodifieddate``
+            in ``properties``
         """
         pass
 
@@ -113,3 +250,56 @@ class IHubSpotCompanyService(ABC):
             company_id (str): The ID of the company.
         """
         pass
+
+    @abstractmethod
+    async def create_associations(
+        self,
+        access_token: str,
+        pairs: List[Tuple[str, str]],
+    ) -> List[AssociationResult]:
+        """Create associations between many contacts and companies.
+
+        Args:
+            access_token: OAuth access token
+            pairs: (contact ID, company ID) pairs to associate
+
+        Returns:
+            The outcome of each distinct pair
+        """
+        pass
+
+    @abstractmethod
+    async def remove_associations(
+        self,
+        access_token: str,
+        pairs: List[Tuple[str, str]],
+    ) -> List[AssociationResult]:
+        """Remove associations between many contacts and companies.
+
+        Args:
+            access_token: OAuth access token
+            pairs: (contact ID, company ID) pairs to dissociate
+
+        Returns:
+            The outcome of each distinct pair
+        """
+        pass
+
+
+class IHubSpotPropertyService(ABC):
+    """Interface for HubSpot property schema operations."""
+
+    @abstractmethod
+    async def get_property_names(
+        self, access_token: str, object_type: str
+    ) -> List[str]:
+        """Get the names of every property defined for an object type.
+
+        Args:
+            access_token (str): The access token.
+            object_type (str): The object type, e.g. "contacts" or "companies".
+
+        Returns:
+            List[str]: The property names.
+        """
+        pass
@@ -1,8 +1,9 @@
 """Repository interfaces for data persistence."""
 
-from typing import Optional, Protocol
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Protocol, Set, Tuple
 
-from src.domain.types.hubspot import HubSpotOAuthData
+from src.domain.types.hubspot import Company, Contact, HubSpotOAuthData
 
 
 class IHubSpotOAuthRepository(Protocol):
@@ -32,6 +33,9 @@ class IHubSpotOAuthRepository(Protocol):
 
         Args:
             data (HubSpotOAuthData): The HubSpot OAuth data to update.
+
+        Raises:
+            StaleOAuthDataError: If the stored data is as new or newer.
         """
         ...
 
@@ -42,3 +46,153 @@ class IHubSpotOAuthRepository(Protocol):
             hub_id (str): The hub ID of the HubSpot OAuth data to delete.
         """
         ...
+
+    async def list_all(self) -> List[HubSpotOAuthData]:
+        """List the HubSpot OAuth data of every installation.
+
+        Returns:
+            List[HubSpotOAuthData]: The HubSpot OAuth data of all installations.
+        """
+        ...
+
+
+class ICrmMirrorRepository(Protocol):
+    """Interface for a local mirror of each portal's CRM objects."""
+
+    async def upsert_contacts(self, hub_id: str, contacts: List[Contact]) -> None:
+        """Insert or replace contacts of a portal.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            contacts (List[Contact]): The contacts to store.
+        """
+        ...
+
+    async def upsert_companies(self, hub_id: str, companies: List[Company]) -> None:
+        """Insert or replace companies of a portal.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            companies (List[Company]): The companies to store.
+        """
+        ...
+
+    async def replace_contact_companies(
+        self, hub_id: str, company_ids_by_contact: Dict[str, List[str]]
+    ) -> None:
+        """Replace the associated companies of contacts.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            company_ids_by_contact (Dict[str, List[str]]): The complete list of
+                associated company IDs of each contact.
+        """
+        ...
+
+    async def list_contacts(
+        self, hub_id: str, limit: int = 10, after: Optional[str] = None
+    ) -> List[Contact]:
+        """List contacts of a portal in numeric ID order.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            limit (int): The maximum number of contacts to return.
+            after (Optional[str]): The ID of the contact to start after.
+
+        Returns:
+            List[Contact]: The contacts.
+
+        Raises:
+            ValueError: If ``after`` is not a contact ID.
+        """
+        ...
+
+    async def get_contact_companies(
+        self, hub_id: str, contact_id: str
+    ) -> List[Company]:
+        """Get the companies associated with a contact.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            contact_id (str): The ID of the contact.
+
+        Returns:
+            List[Company]: The associated companies.
+        """
+        ...
+
+    async def get_contact_companies_page(
+        self,
+        hub_id: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Company], Optional[str]]:
+        """Get a page of the companies associated with a contact.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            after (Optional[str]): The cursor to start after.
+
+        Returns:
+            Tuple[List[Company], Optional[str]]: The companies, and the cursor
+                of the next page if there are more.
+
+        Raises:
+            ValueError: If ``after`` is not a cursor of this mirror.
+        """
+        ...
+
+    async def list_ids(self, hub_id: str, object_type: str) -> Set[str]:
+        """Get the IDs of every mirrored object of a type.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, "contacts" or "companies".
+
+        Returns:
+            Set[str]: The IDs of the objects.
+        """
+        ...
+
+    async def delete_objects(
+        self, hub_id: str, object_type: str, ids: Iterable[str]
+    ) -> None:
+        """Delete mirrored objects together with their associations.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, "contacts" or "companies".
+            ids (Iterable[str]): The IDs of the objects.
+        """
+        ...
+
+    async def get_synced_until(
+        self, hub_id: str, object_type: str
+    ) -> Optional[datetime]:
+        """Get the time up to which an object type of a portal is mirrored.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, e.g. "contacts".
+
+        Returns:
+            Optional[datetime]: The sync watermark, or None before the backfill
+                has completed.
+        """
+        ...
+
+    async def set_synced_until(
+        self, hub_id: str, object_type: str, synced_until: datetime
+    ) -> None:
+        """Record the time up to which an object type of a portal is mirrored.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, e.g. "contacts".
+            synced_until (datetime): The sync watermark.
+        """
+        ...
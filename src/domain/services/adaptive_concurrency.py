@@ -0,0 +1,139 @@
+"""Concurrency limit that adapts to upstream latency and errors."""
+
+import asyncio
+from collections import deque
+from typing import Deque, Optional
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Raised when a call cannot get a slot within the queue limits."""
+
+    pass
+
+
+class AdaptiveConcurrencyLimit:
+    """Cap calls in flight with an additive-increase, multiplicative-decrease limit.
+
+    Each successful call that completes within ``latency_tolerance`` times the
+    baseline latency raises the limit by roughly one per limit's worth of
+    calls. A failed call, or one that took longer than that, multiplies the
+    limit by ``backoff_ratio``. The baseline follows the fastest recent
+    latencies and drifts slowly upwards, so a persistently slower upstream is
+    eventually accepted as normal. Calls over the limit wait in FIFO order;
+    once ``max_queue`` calls are waiting, or a call has waited
+    ``max_wait_seconds``, further calls are rejected instead of piling up.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.9,
+        latency_tolerance: float = 2.0,
+        max_queue: int = 200,
+        max_wait_seconds: Optional[float] = 5.0,
+    ):
+        """Initialize the limit.
+
+        Args:
+            initial_limit (int): Calls allowed in flight at first.
+            min_limit (int): The limit never drops below this.
+            max_limit (int): The limit never rises above this.
+            backoff_ratio (float): Factor applied to the limit on a drop.
+            latency_tolerance (float): How many times the baseline latency a
+                call may take before it counts as a drop.
+            max_queue (int): Maximum number of calls waiting for a slot.
+            max_wait_seconds (Optional[float]): Maximum time a call waits for a
+                slot, or None to wait indefinitely.
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.in_flight = 0
+        self.rejected = 0
+        self.baseline_latency: Optional[float] = None
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        """Get the number of calls waiting for a slot."""
+        return sum(not waiter.done() for waiter in self._waiters)
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting behind earlier calls if the limit is reached.
+
+        Raises:
+            ConcurrencyLimitExceeded: If the queue is full or the wait timed
+                out.
+        """
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise ConcurrencyLimitExceeded(
+                f"{self.queued} calls already waiting for {int(self.limit)} slots"
+            )
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            if not waiter.done():
+                waiter.cancel()
+                self.rejected += 1
+                raise ConcurrencyLimitExceeded(
+                    f"No slot free within {self.max_wait_seconds}s"
+                )
+            # The slot was handed over as the wait timed out
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+            raise
+
+    def release(self, latency: Optional[float] = None, dropped: bool = False) -> None:
+        """Free a slot and adapt the limit to how the call went.
+
+        Args:
+            latency (Optional[float]): How long the call took, or None if it
+                ended without an outcome, e.g. because it was cancelled.
+            dropped (bool): Whether the call failed in a way that indicates
+                upstream overload.
+        """
+        self.in_flight -= 1
+        if latency is not None:
+            self._adapt(latency, dropped)
+        self._wake()
+
+    def _adapt(self, latency: float, dropped: bool) -> None:
+        """Increase or decrease the limit after a call."""
+        baseline = self.baseline_latency
+        if baseline is None or latency < baseline:
+            self.baseline_latency = latency
+        elif not dropped:
+            self.baseline_latency = baseline + (latency - baseline) * 0.01
+
+        if dropped or (
+            baseline is not None and latency > baseline * self.latency_tolerance
+        ):
+            self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _wake(self) -> None:
+        """Hand free slots to waiting calls in arrival order."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
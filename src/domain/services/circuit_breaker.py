@@ -0,0 +1,147 @@
+"""Circuit breaker that stops calls to a failing upstream."""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit is open."""
+
+    def __init__(self, retry_after: float):
+        """Initialize the error.
+
+        Args:
+            retry_after (float): Seconds until probe calls are let through.
+        """
+        super().__init__(f"Circuit open, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while an upstream is failing, then probe for its recovery.
+
+    While closed, the outcomes of the last ``window_size`` calls are kept.
+    Once at least ``min_calls`` outcomes are known and the share of failures
+    reaches ``failure_rate``, the circuit opens and every call is refused
+    for ``open_seconds``. It then half-opens and lets ``probe_calls`` calls
+    through: if they all succeed the circuit closes, and if one fails it
+    opens again.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window_size: int = 20,
+        open_seconds: float = 30.0,
+        probe_calls: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed circuit.
+
+        Args:
+            failure_rate (float): Share of failed calls that opens the circuit.
+            min_calls (int): Outcomes needed before the circuit can open.
+            window_size (int): Number of recent outcomes considered.
+            open_seconds (float): How long the circuit stays open.
+            probe_calls (int): Calls let through while half-open.
+            clock (Callable[[], float]): Monotonic clock, mainly for tests.
+        """
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.probe_calls = probe_calls
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_until = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, half-opening once the open period is over."""
+        if self._state is CircuitState.OPEN and self._clock() >= self._opened_until:
+            self._state = CircuitState.HALF_OPEN
+            self._probes_started = 0
+            self._probes_succeeded = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        """Get the seconds until calls are let through again, 0 if they are."""
+        state = self.state
+        if state is CircuitState.OPEN:
+            return self._opened_until - self._clock()
+        if state is CircuitState.HALF_OPEN and (
+            self._probes_started >= self.probe_calls
+        ):
+            return self.open_seconds
+        return 0.0
+
+    def allow(self) -> bool:
+        """Let a call through or refuse it.
+
+        Returns:
+            bool: Whether the call is a half-open probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every
+                probe already started.
+        """
+        retry_after = self.retry_after()
+        if retry_after > 0:
+            self.rejected += 1
+            raise CircuitOpenError(retry_after)
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_started += 1
+            return True
+        return False
+
+    def record(self, success: Optional[bool], probe: bool) -> None:
+        """Record how a call that was let through went.
+
+        Args:
+            success (Optional[bool]): Whether the call succeeded, or None if
+                it ended without an outcome, e.g. because it was cancelled.
+            probe (bool): Whether the call was a half-open probe.
+        """
+        if probe:
+            if self._state is not CircuitState.HALF_OPEN:
+                return
+            if success is None:
+                self._probes_started -= 1
+            elif not success:
+                self._open()
+            else:
+                self._probes_succeeded += 1
+                if self._probes_succeeded >= self.probe_calls:
+                    self._state = CircuitState.CLOSED
+                    self._outcomes.clear()
+            return
+
+        if success is None or self._state is not CircuitState.CLOSED:
+            return
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and failures / len(self._outcomes) >= self.failure_rate
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        """Refuse calls for ``open_seconds``."""
+        self._state = CircuitState.OPEN
+        self._opened_until = self._clock() + self.open_seconds
+        self._outcomes.clear()
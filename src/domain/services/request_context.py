@@ -0,0 +1,57 @@
+"""Portal and priority of the HubSpot calls made by the current task."""
+
+import contextlib
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Iterator, Optional
+
+
+class Priority(IntEnum):
+    """Scheduling priority of HubSpot calls; lower values go first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_portal: ContextVar[Optional[str]] = ContextVar("hubspot_portal", default=None)
+_priority: ContextVar[Priority] = ContextVar(
+    "hubspot_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_portal() -> Optional[str]:
+    """Get the hub ID the current task is calling HubSpot for, if known."""
+    return _portal.get()
+
+
+def current_priority() -> Priority:
+    """Get the priority of the current task's HubSpot calls."""
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def portal_context(hub_id: str) -> Iterator[None]:
+    """Attribute the HubSpot calls made inside the block to a portal.
+
+    Args:
+        hub_id (str): The hub ID of the portal.
+    """
+    token = _portal.set(hub_id)
+    try:
+        yield
+    finally:
+        _portal.reset(token)
+
+
+@contextlib.contextmanager
+def priority_context(priority: Priority) -> Iterator[None]:
+    """Set the priority of the HubSpot calls made inside the block.
+
+    Args:
+        priority (Priority): The priority of the calls.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
@@ -0,0 +1,268 @@
+"""In-memory cache for upstream read responses."""
+
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from src.domain.services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def approximate_size(value: Any) -> int:
+    """Estimate the memory used by a value and everything it contains.
+
+    Args:
+        value (Any): Built from dicts, lists, tuples, strings, numbers and
+            objects with a ``__dict__`` or ``__slots__``.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            approximate_size(key) + approximate_size(item)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(item) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += approximate_size(vars(value))
+    elif hasattr(type(value), "__slots__"):
+        size += sum(
+            approximate_size(getattr(value, name))
+            for name in type(value).__slots__
+            if hasattr(value, name)
+        )
+    return size
+
+
+@dataclass
+class _Entry(Generic[T]):
+    """A cached value and when it goes stale and expires."""
+
+    value: T
+    size: int
+    fresh_until: float
+    stale_until: float
+    group: Optional[Hashable]
+
+
+class ResponseCache(Generic[T]):
+    """Cache loaded values with a TTL, LRU eviction and a memory cap.
+
+    A value is served from memory for ``ttl_seconds``. For a further
+    ``stale_seconds`` it is still served, while a reload runs in the
+    background. Concurrent misses for the same key share a single load.
+    Entries can be tagged with a group so related keys, such as every page of
+    a contact's companies, are invalidated together. The least recently used
+    entries are evicted once ``max_entries`` or ``max_bytes`` is exceeded.
+    Expired values stay available to ``get_stale`` until they are reloaded
+    or evicted.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        stale_seconds: float = 300.0,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        size_of: Callable[[T], int] = approximate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds (float): How long a value is served without reloading.
+            stale_seconds (float): How long after that a value is still served
+                while it is reloaded in the background.
+            max_entries (int): Maximum number of cached values.
+            max_bytes (int): Maximum approximate memory used by cached values.
+            size_of (Callable[[T], int]): Estimates the size of a value.
+            clock (Callable[[], float]): Monotonic clock, mainly for tests.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry[T]]" = OrderedDict()
+        self._groups: Dict[Hashable, Set[Hashable]] = {}
+        # Invalidation counters, kept only for keys and groups being loaded
+        self._loading: Dict[Hashable, int] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self._loads: SingleFlight[T] = SingleFlight()
+        self._revalidations: Set[asyncio.Task] = set()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        group: Optional[Hashable] = None,
+    ) -> T:
+        """Get a cached value, loading it on a miss.
+
+        Args:
+            key (Hashable): Identifies the value, e.g. (portal, endpoint, params).
+            loader (Callable[[], Awaitable[T]]): Loads the value from upstream.
+            group (Optional[Hashable]): Group to invalidate the value with.
+
+        Returns:
+            T: The cached or freshly loaded value.
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.fresh_until:
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self._revalidate(key, loader, group)
+                return entry.value
+            # Expired entries are kept for get_stale until reloaded or evicted
+
+        return await self._loads.do(key, lambda: self._load(key, loader, group))
+
+    def get_stale(self, key: Hashable) -> Optional[T]:
+        """Get a cached value however old, e.g. while its upstream is down.
+
+        Args:
+            key (Hashable): Identifies the value.
+
+        Returns:
+            Optional[T]: The cached value, or None if there is none.
+        """
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        group: Optional[Hashable],
+    ) -> T:
+        """Load a value and cache it unless it was invalidated meanwhile."""
+        tokens = (key,) if group is None else (key, group)
+        for token in tokens:
+            self._loading[token] = self._loading.get(token, 0) + 1
+        try:
+            generation = [self._generations.get(token, 0) for token in tokens]
+            value = await loader()
+            if [self._generations.get(token, 0) for token in tokens] == generation:
+                self._store(key, value, group)
+            return value
+        finally:
+            for token in tokens:
+                self._loading[token] -= 1
+                if not self._loading[token]:
+                    del self._loading[token]
+                    self._generations.pop(token, None)
+
+    def _revalidate(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        group: Optional[Hashable],
+    ) -> None:
+        """Reload a stale value in the background."""
+        if self._loads.in_flight(key):
+            return
+
+        async def revalidate() -> None:
+            try:
+                await self._loads.do(key, lambda: self._load(key, loader, group))
+            except Exception as e:
+                logger.warning("Failed to revalidate cached response: %s", e)
+
+        task = asyncio.create_task(revalidate())
+        self._revalidations.add(task)
+        task.add_done_callback(self._revalidations.discard)
+
+    def _bump_generation(self, token: Hashable) -> None:
+        """Make loads in flight for a key or group discard their result."""
+        if token in self._loading:
+            self._generations[token] = self._generations.get(token, 0) + 1
+
+    def _store(self, key: Hashable, value: T, group: Optional[Hashable]) -> None:
+        """Cache a value and evict entries over the limits."""
+        self._remove(key)
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        now = self._clock()
+        self._entries[key] = _Entry(
+            value=value,
+            size=size,
+            fresh_until=now + self.ttl_seconds,
+            stale_until=now + self.ttl_seconds + self.stale_seconds,
+            group=group,
+        )
+        self.size += size
+        if group is not None:
+            self._groups.setdefault(group, set()).add(key)
+
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop a cached value."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= entry.size
+        if entry.group is not None:
+            keys = self._groups.get(entry.group)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._groups[entry.group]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a cached value and discard any load of it in flight.
+
+        Args:
+            key (Hashable): The key to invalidate.
+        """
+        self._bump_generation(key)
+        self._remove(key)
+
+    def invalidate_group(self, group: Hashable) -> None:
+        """Drop every cached value of a group and discard loads in flight.
+
+        Args:
+            group (Hashable): The group to invalidate.
+        """
+        self._bump_generation(group)
+        for key in list(self._groups.get(group, ())):
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every cached value and discard loads in flight."""
+        for token in self._loading:
+            self._bump_generation(token)
+        self._entries.clear()
+        self._groups.clear()
+        self.size = 0
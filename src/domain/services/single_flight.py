@@ -0,0 +1,77 @@
+"""Request coalescing for concurrent identical calls."""
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """An in-flight call shared by one or more waiters."""
+
+    def __init__(self, task: "asyncio.Task[T]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time and share its outcome.
+
+    Callers asking for a key that already has a call in flight wait for that
+    call instead of starting their own, and all of them receive its result or
+    exception. A waiter being cancelled never cancels the call for the other
+    waiters; once every waiter has gone, the call itself is cancelled unless
+    ``cancel_when_abandoned`` is False (for calls with side effects that must
+    complete, such as a token refresh).
+    """
+
+    def __init__(self, cancel_when_abandoned: bool = True):
+        """Initialize the group.
+
+        Args:
+            cancel_when_abandoned (bool): Cancel an in-flight call when all of
+                its waiters have been cancelled.
+        """
+        self.cancel_when_abandoned = cancel_when_abandoned
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check whether a call is currently running for a key."""
+        return key in self._calls
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` for ``key``, or join the call already in flight.
+
+        Args:
+            key (Hashable): Identifies calls that may be shared.
+            func (Callable[[], Awaitable[T]]): Starts the call if none is running.
+
+        Returns:
+            T: The result of the shared call.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(functools.partial(self._forget, key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if (
+                call.waiters == 0
+                and self.cancel_when_abandoned
+                and not call.task.done()
+            ):
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call, task: asyncio.Task) -> None:
+        """Remove a finished call so the next caller starts a new one."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Mark the outcome as retrieved even if every waiter has gone
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,144 @@
+"""Token bucket rate limiting with prioritised waiters."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, List, Optional, Tuple
+
+
+class TokenBucket:
+    """Token bucket whose waiters are served in priority order.
+
+    The bucket holds up to ``capacity`` tokens and refills continuously at
+    ``refill_per_second``. A caller that finds no token waits in a queue
+    ordered by priority, then arrival, so a lower priority value is always
+    served first. The limits can be recalibrated at any time, and the
+    bucket can be paused, for example after the server asked to back off.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a full bucket.
+
+        Args:
+            capacity (float): Maximum number of tokens.
+            refill_per_second (float): Tokens added per second.
+            clock (Callable[[], float]): Monotonic clock, mainly for tests.
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def tokens(self) -> float:
+        """Get the number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now = self._clock()
+        if now > self._updated:
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.refill_per_second,
+            )
+            self._updated = now
+
+    def _try_take(self) -> bool:
+        """Take a token if one is available and the bucket is not paused."""
+        self._refill()
+        if self._clock() < self._paused_until or self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _next_token_in(self) -> float:
+        """Get the seconds until a token can next be taken."""
+        wait = self._paused_until - self._clock()
+        if self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self.refill_per_second)
+        return max(wait, 0.0)
+
+    def _dispatch(self) -> None:
+        """Hand out tokens to waiters in order and schedule the next round."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_take():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if self._waiters:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._next_token_in(), self._dispatch
+            )
+
+    async def acquire(self, priority: int = 0) -> None:
+        """Take a token, waiting behind higher-priority and earlier callers.
+
+        Args:
+            priority (int): The caller's priority; lower values go first.
+        """
+        if not self._waiters and self._try_take():
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The token was handed over just before the cancellation
+            if future.done() and not future.cancelled():
+                self._tokens = min(self.capacity, self._tokens + 1)
+                self._dispatch()
+            raise
+
+    def calibrate(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        remaining: Optional[float] = None,
+    ) -> None:
+        """Adjust the limits, e.g. to those reported by the server.
+
+        Args:
+            capacity (float): Maximum number of tokens.
+            refill_per_second (float): Tokens added per second.
+            remaining (Optional[float]): Tokens the server says are left; the
+                bucket never holds more than this.
+        """
+        self._refill()
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = min(self._tokens, capacity)
+        if remaining is not None:
+            self._tokens = min(self._tokens, remaining)
+        if self._waiters:
+            self._dispatch()
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the given time.
+
+        Args:
+            seconds (float): How long to pause.
+        """
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        if self._waiters:
+            self._dispatch()
@@ -1,15 +1,52 @@
-import base64
+import binascii
+import functools
 import hmac
 import hashlib
 import time
-from typing import Protocol
+from typing import Optional, Protocol
 
 from src.domain.constants import URL_DECODE_MAP
 
+# Hex digits after "%" mapped to the decoded character
+_URL_DECODE_TABLE = {
+    encoded[1:].encode(): decoded.encode()
+    for encoded, decoded in URL_DECODE_MAP.items()
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_url(url: bytes) -> bytes:
+    """Decode the URL-encoded characters HubSpot decodes before signing.
+
+    Each escape is decoded once, in a single pass over the URL.
+    """
+    head, *escaped = url.split(b"%")
+    if not escaped:
+        return url
+    return head + b"".join(
+        [
+            _URL_DECODE_TABLE[part[:2]] + part[2:]
+            if part[:2] in _URL_DECODE_TABLE
+            else b"%" + part
+            for part in escaped
+        ]
+    )
+
 
 class IRequestVerifier(Protocol):
     """Interface for request verification."""
 
+    def verify(
+        self,
+        method: bytes,
+        url: bytes,
+        body: bytes,
+        timestamp: Optional[bytes],
+        signature: Optional[bytes],
+    ) -> bool:
+        """Verify a request synchronously from raw bytes."""
+        ...
+
     async def verify_request(
         self, method: str, url: str, body: str, timestamp: str, signature: str
     ) -> bool:
@@ -18,39 +55,104 @@ class IRequestVerifier(Protocol):
 
 
 class HubSpotRequestVerifier(IRequestVerifier):
-    """Service for verifying HubSpot requests."""
+    """Service for verifying HubSpot requests.
+
+    An HMAC-SHA256 object is keyed once with the client secret and copied
+    for each request, and signatures are compared as raw digests.
+    """
 
     def __init__(self, client_secret: str):
         self.client_secret = client_secret
+        self._mac = hmac.new(client_secret.encode(), digestmod=hashlib.sha256)
 
-    async def verify_request(
-        self, method: str, url: str, body: str, timestamp: str, signature: str
-    ) -> bool:
-        """
-        Verify the request using the client secret for v3 signature.
-        """
+    def is_timestamp_valid(self, timestamp: Optional[bytes]) -> bool:
+        """Check the request timestamp is present and not older than 5 minutes."""
         if not timestamp:
             return False
 
         # Validate timestamp is not older than 5 minutes
         current_time = int(time.time() * 1000)
-        timestamp_int = int(timestamp)
-        if current_time - timestamp_int > 300000:  # 5 minutes in milliseconds
+        try:
+            timestamp_int = int(timestamp)
+        except ValueError:
             return False
+        return current_time - timestamp_int <= 300000  # 5 minutes in milliseconds
 
-        # Decode URL-encoded characters
-        request_uri = url
-        for encoded, decoded in URL_DECODE_MAP.items():
-            request_uri = request_uri.replace(encoded, decoded)
+    def start(self, method: bytes, url: bytes) -> hmac.HMAC:
+        """Start the v3 signature of a request.
+
+        The request body is then fed with ``update()`` as it arrives, and the
+        result checked with ``finish()``.
+
+        Args:
+            method (bytes): The HTTP method.
+            url (bytes): The full request URL.
+
+        Returns:
+            hmac.HMAC: The signature in progress.
+        """
+        mac = self._mac.copy()
+        mac.update(method)
+        mac.update(_decode_url(url))
+        return mac
 
-        # Create the string to hash
-        raw_string = f"{method}{request_uri}{body}{timestamp}"
+    def finish(self, mac: hmac.HMAC, timestamp: bytes, signature: bytes) -> bool:
+        """Complete a signature started with ``start()`` and compare it.
 
-        # Create HMAC SHA-256 hash and base64 encode it
-        computed_signature = hmac.new(
-            self.client_secret.encode(), raw_string.encode(), hashlib.sha256
-        ).digest()
-        computed_signature = base64.b64encode(computed_signature).decode()
+        Args:
+            mac (hmac.HMAC): The signature fed with the request body.
+            timestamp (bytes): The X-HubSpot-Request-Timestamp header.
+            signature (bytes): The base64 X-HubSpot-Signature-v3 header.
+
+        Returns:
+            bool: Whether the signature matches.
+        """
+        try:
+            expected = binascii.a2b_base64(signature, strict_mode=True)
+        except binascii.Error:
+            return False
+        mac.update(timestamp)
 
         # Compare signatures (using constant-time comparison)
-        return hmac.compare_digest(computed_signature, signature)
+        return hmac.compare_digest(mac.digest(), expected)
+
+    def verify(
+        self,
+        method: bytes,
+        url: bytes,
+        body: bytes,
+        timestamp: Optional[bytes],
+        signature: Optional[bytes],
+    ) -> bool:
+        """Verify a request synchronously from raw bytes.
+
+        Args:
+            method (bytes): The HTTP method.
+            url (bytes): The full request URL.
+            body (bytes): The request body.
+            timestamp (Optional[bytes]): The X-HubSpot-Request-Timestamp header.
+            signature (Optional[bytes]): The X-HubSpot-Signature-v3 header.
+
+        Returns:
+            bool: Whether the request is signed by HubSpot and recent.
+        """
+        if not signature or not self.is_timestamp_valid(timestamp):
+            return False
+
+        mac = self.start(method, url)
+        mac.update(body)
+        return self.finish(mac, timestamp, signature)
+
+    async def verify_request(
+        self, method: str, url: str, body: str, timestamp: str, signature: str
+    ) -> bool:
+        """
+        Verify the request using the client secret for v3 signature.
+        """
+        return self.verify(
+            method.encode(),
+            url.encode(),
+            body.encode(),
+            timestamp.encode() if timestamp else None,
+            signature.encode() if signature else None,
+        )
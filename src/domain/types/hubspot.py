@@ -1,9 +1,27 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, FrozenSet, List, Mapping, Optional
 from datetime import datetime
 
+# The types are slotted to keep large collections, such as exports and
+# cached pages, compact. Their constructors do not validate and are meant
+# for data our own code produced; ``from_dict`` validates external input.
 
-@dataclass
+
+def check_required_fields(data: Mapping[str, Any], required: FrozenSet[str]) -> None:
+    """Check that a dictionary holds every required key.
+
+    Args:
+        data (Mapping[str, Any]): The external input.
+        required (FrozenSet[str]): The keys it must hold.
+
+    Raises:
+        TypeError: If a required key is missing.
+    """
+    if not required <= data.keys():
+        raise TypeError(f"Missing required fields: {set(required - data.keys())}")
+
+
+@dataclass(slots=True)
 class UserInfo:
     """User information from HubSpot OAuth."""
 
@@ -16,10 +34,8 @@ class UserInfo:
     expires_in: int
     token: Optional[str] = None
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "UserInfo":
-        """Create UserInfo from dictionary."""
-        required_fields = {
+    REQUIRED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {
             "user_id",
             "hub_id",
             "app_id",
@@ -28,9 +44,12 @@ class UserInfo:
             "token_type",
             "expires_in",
         }
-        missing_fields = required_fields - set(data.keys())
-        if missing_fields:
-            raise TypeError(f"Missing required fields: {missing_fields}")
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UserInfo":
+        """Create UserInfo from dictionary, validating it."""
+        check_required_fields(data, cls.REQUIRED_FIELDS)
 
         return cls(
             user_id=data["user_id"],
@@ -44,7 +63,7 @@ class UserInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HubSpotOAuthData:
     """HubSpot OAuth data for an installation."""
 
@@ -56,11 +75,12 @@ class HubSpotOAuthData:
     installed_at: datetime
     user_id: str
     app_id: str
+    # Incremented on every write, so writes based on an older record are
+    # detected; records stored before versioning read as version 0
+    version: int = 0
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "HubSpotOAuthData":
-        """Create HubSpotOAuthData from dictionary."""
-        required_fields = {
+    REQUIRED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {
             "hub_id",
             "access_token",
             "refresh_token",
@@ -70,9 +90,12 @@ class HubSpotOAuthData:
             "user_id",
             "app_id",
         }
-        missing_fields = required_fields - set(data.keys())
-        if missing_fields:
-            raise TypeError(f"Missing required fields: {missing_fields}")
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HubSpotOAuthData":
+        """Create HubSpotOAuthData from dictionary, validating it."""
+        check_required_fields(data, cls.REQUIRED_FIELDS)
 
         return cls(
             hub_id=data["hub_id"],
@@ -83,6 +106,7 @@ class HubSpotOAuthData:
             installed_at=datetime.fromisoformat(data["installed_at"]),
             user_id=data["user_id"],
             app_id=data["app_id"],
+            version=data.get("version", 0),
         )
 
     def to_dict(self) -> dict:
@@ -96,10 +120,11 @@ class HubSpotOAuthData:
             "installed_at": self.installed_at.isoformat(),
             "user_id": self.user_id,
             "app_id": self.app_id,
+            "version": self.version,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     """Contact information from HubSpot."""
 
@@ -107,14 +132,17 @@ class Contact:
     name: str
     email: str
     phone: str
+    # Requested HubSpot properties that are not contact fields
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    REQUIRED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"id", "name", "email", "phone"}
+    )
 
     @classmethod
     def from_dict(cls, data: dict) -> "Contact":
-        """Create Contact from dictionary."""
-        required_fields = {"id", "name", "email", "phone"}
-        missing_fields = required_fields - set(data.keys())
-        if missing_fields:
-            raise TypeError(f"Missing required fields: {missing_fields}")
+        """Create Contact from dictionary, validating it."""
+        check_required_fields(data, cls.REQUIRED_FIELDS)
 
         return cls(
             id=data["id"],
@@ -133,7 +161,7 @@ class Contact:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     """Company information from HubSpot."""
 
@@ -143,14 +171,15 @@ class Company:
     industry: Optional[str] = None
     phone: Optional[str] = None
     associated: bool = False
+    # Requested HubSpot properties that are not company fields
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    REQUIRED_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"id", "name"})
 
     @classmethod
     def from_dict(cls, data: dict) -> "Company":
-        """Create Company from dictionary."""
-        required_fields = {"id", "name"}
-        missing_fields = required_fields - set(data.keys())
-        if missing_fields:
-            raise TypeError(f"Missing required fields: {missing_fields}")
+        """Create Company from dictionary, validating it."""
+        check_required_fields(data, cls.REQUIRED_FIELDS)
 
         return cls(
             id=data["id"],
@@ -171,3 +200,22 @@ class Company:
             "phone": self.phone,
             "associated": self.associated,
         }
+
+
+@dataclass(slots=True)
+class AssociationResult:
+    """Outcome of creating or removing one contact to company association."""
+
+    contact_id: str
+    company_id: str
+    success: bool
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for responses."""
+        return {
+            "contact_id": self.contact_id,
+            "company_id": self.company_id,
+            "status": "success" if self.success else "error",
+            "error": self.error,
+        }
@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,6 +12,124 @@ class Settings(BaseSettings):
     HUBSPOT_REDIRECT_URI: str
     HUBSPOT_SCOPES: str
 
+    # Server started by ``python -m src.presentation.serve``
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    # Worker processes; defaults to the number of CPUs available
+    SERVER_WORKERS: Optional[int] = None
+    # Import the app once before forking so workers share its memory
+    SERVER_PRELOAD_APP: bool = True
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    # Connections per worker before new ones get 503, and requests before a
+    # worker is replaced; unlimited when unset
+    SERVER_LIMIT_CONCURRENCY: Optional[int] = None
+    SERVER_LIMIT_MAX_REQUESTS: Optional[int] = None
+    # How long a stopping worker waits for in-flight requests
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    # Run the token refresh scheduler and CRM sync in this process; the
+    # multi-worker server turns it off in all workers but one
+    SERVER_BACKGROUND_TASKS: bool = True
+
+    # Outbound HTTP connection pool shared by all HubSpot services
+    HUBSPOT_HTTP_MAX_CONNECTIONS: int = 100
+    HUBSPOT_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HUBSPOT_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HUBSPOT_HTTP_TIMEOUT: float = 10.0
+    HUBSPOT_HTTP2: bool = True
+    HUBSPOT_HTTP_WARMUP: bool = True
+    # Per-portal request rate, recalibrated from HubSpot's rate-limit headers
+    HUBSPOT_RATE_LIMIT_ENABLED: bool = True
+    HUBSPOT_RATE_LIMIT_MAX_REQUESTS: int = 100
+    HUBSPOT_RATE_LIMIT_INTERVAL_SECONDS: float = 10.0
+    # Processes sharing each portal's limit, each pacing itself to an equal
+    # share; the multi-worker server multiplies it by its number of workers
+    HUBSPOT_RATE_LIMIT_PROCESSES: int = 1
+    # Daily requests per portal that background sync leaves for interactive use
+    HUBSPOT_RATE_LIMIT_DAILY_RESERVE: int = 1000
+    HUBSPOT_RATE_LIMIT_MAX_RETRIES: int = 3
+    HUBSPOT_RATE_LIMIT_BACKOFF_SECONDS: float = 1.0
+    # Calls in flight per endpoint family, adapted to HubSpot's latency
+    HUBSPOT_ADAPTIVE_CONCURRENCY_ENABLED: bool = True
+    HUBSPOT_CONCURRENCY_INITIAL_LIMIT: int = 20
+    HUBSPOT_CONCURRENCY_MAX_LIMIT: int = 100
+    HUBSPOT_CONCURRENCY_MAX_QUEUE: int = 200
+    HUBSPOT_CONCURRENCY_MAX_WAIT_SECONDS: float = 5.0
+    # Endpoint families failing this often are cut off, then probed
+    HUBSPOT_CIRCUIT_FAILURE_RATE: float = 0.5
+    HUBSPOT_CIRCUIT_MIN_CALLS: int = 10
+    HUBSPOT_CIRCUIT_OPEN_SECONDS: float = 30.0
+    HUBSPOT_CIRCUIT_PROBE_CALLS: int = 3
+
+    # "http" uses the async client above, "sdk" runs the hubspot SDK on threads
+    HUBSPOT_COMPANY_BACKEND: Literal["http", "sdk"] = "http"
+    HUBSPOT_SDK_MAX_WORKERS: int = 8
+    # Association batch requests in flight per bulk operation
+    HUBSPOT_BATCH_CONCURRENCY: int = 4
+    # Identical concurrent reads for a portal share one HubSpot call
+    HUBSPOT_COALESCE_READS: bool = True
+
+    # "file" stores one JSON file per installation, "sqlite" one shared database
+    OAUTH_REPOSITORY_BACKEND: Literal["file", "sqlite"] = "file"
+    OAUTH_SQLITE_PATH: str = ".data/auth.db"
+    OAUTH_SQLITE_POOL_SIZE: int = 4
+    OAUTH_SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # Largest request body accepted on signature-verified routes, in bytes
+    HUBSPOT_VERIFICATION_MAX_BODY_SIZE: int = 1_048_576
+
+    # File-based OAuth repository
+    OAUTH_STORAGE_DIR: str = ".data/auth"
+    OAUTH_FILE_FSYNC: bool = False
+    OAUTH_FILE_SHARD_DEPTH: int = 1
+    OAUTH_FILE_IO_WORKERS: int = 4
+    # How long a token refresh waits for another worker's refresh of the
+    # portal, with either backend
+    OAUTH_FILE_LOCK_TIMEOUT_SECONDS: float = 30.0
+
+    # In-memory cache in front of the OAuth repository
+    OAUTH_CACHE_ENABLED: bool = True
+    OAUTH_CACHE_REVALIDATE_SECONDS: float = 5.0
+    OAUTH_CACHE_NEGATIVE_TTL_SECONDS: float = 10.0
+    OAUTH_CACHE_NEGATIVE_MAX_ENTRIES: int = 10000
+    OAUTH_CACHE_PRELOAD: bool = False
+
+    # Seconds token refreshes for a portal fail fast after a failed refresh
+    TOKEN_REFRESH_FAILURE_BACKOFF_SECONDS: float = 30.0
+
+    # Background refresh of tokens before they expire
+    TOKEN_REFRESH_SCHEDULER_ENABLED: bool = True
+    TOKEN_REFRESH_MARGIN_SECONDS: float = 300.0
+    TOKEN_REFRESH_CONCURRENCY: int = 4
+    TOKEN_REFRESH_RESYNC_SECONDS: float = 60.0
+    TOKEN_REFRESH_RETRY_SECONDS: float = 30.0
+
+    # Per-portal cache of contact and company reads
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_STALE_SECONDS: float = 300.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 10000
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # Serialize /contacts responses with orjson, skipping response validation
+    FAST_JSON_RESPONSES: bool = False
+
+    # Columnar CSV/Parquet exports, encoded in worker processes
+    EXPORT_PROCESS_WORKERS: int = 2
+    EXPORT_BATCH_ROWS: int = 10000
+    EXPORT_PARQUET_COMPRESSION: str = "zstd"
+
+    # Local mirror of contacts and companies, kept current in the background
+    CRM_MIRROR_ENABLED: bool = False
+    CRM_MIRROR_PATH: str = ".data/mirror.db"
+    CRM_MIRROR_POOL_SIZE: int = 4
+    CRM_SYNC_INTERVAL_SECONDS: float = 300.0
+    CRM_SYNC_OVERLAP_SECONDS: float = 60.0
+    CRM_SYNC_RECONCILE_INTERVAL_SECONDS: float = 86400.0
+    CRM_SYNC_CONCURRENCY: int = 4
+
+    # Property schemas used to validate requested fields
+    HUBSPOT_PROPERTY_SCHEMA_TTL_SECONDS: float = 300.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -20,6 +139,11 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    The settings are read from the environment and ``.env`` once, on the
+    first call, and shared by every later caller.
+    """
     return Settings()
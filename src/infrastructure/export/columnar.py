@@ -0,0 +1,295 @@
+"""Columnar CSV and Parquet exports encoded off the event loop."""
+
+import asyncio
+import csv
+import importlib.util
+import io
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from src.domain.types.hubspot import Company, Contact
+
+ColumnarFormat = Literal["csv", "parquet"]
+
+# Values of each column of a batch of rows, keyed by column name
+ColumnBatch = Dict[str, List[Any]]
+
+# Worker processes must not be forked from the server, whose threads could
+# hold a lock at the moment of the fork and leave it locked in the child
+WORKER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def parquet_available() -> bool:
+    """Check whether pyarrow, needed to write Parquet, is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def encode_csv(columns: Sequence[str], batch: ColumnBatch, header: bool) -> bytes:
+    """Encode a batch of rows as CSV.
+
+    Runs in a worker process.
+
+    Args:
+        columns (Sequence[str]): The column names, in order.
+        batch (ColumnBatch): The values of each column.
+        header (bool): Whether to start with a header row.
+
+    Returns:
+        bytes: The CSV rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows(zip(*(batch[column] for column in columns)))
+    return buffer.getvalue().encode()
+
+
+class ParquetSink(io.RawIOBase):
+    """A write-only file that hands out what was written since the last drain.
+
+    The Parquet writer records column chunk offsets from ``tell()``, so the
+    position keeps counting every byte written, including drained ones.
+    """
+
+    def __init__(self):
+        """Initialize the sink."""
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        """Report that the sink can be written to."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Buffer written bytes until the next drain.
+
+        Args:
+            data (Any): A bytes-like object.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        """Get the number of bytes written so far."""
+        return self._position
+
+    def drain(self) -> bytes:
+        """Take the bytes written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def open_parquet_writer(
+    columns: Sequence[str], compression: str
+) -> Tuple[Any, ParquetSink]:
+    """Open a Parquet writer of string columns on a new sink.
+
+    Args:
+        columns (Sequence[str]): The column names, in order.
+        compression (str): The Parquet compression codec, e.g. "zstd".
+
+    Returns:
+        Tuple[Any, ParquetSink]: The ``pyarrow.parquet.ParquetWriter`` and
+            the sink it writes to.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, pa.string()) for column in columns])
+    sink = ParquetSink()
+    return pq.ParquetWriter(sink, schema, compression=compression), sink
+
+
+def write_parquet_batch(
+    writer: Any, sink: ParquetSink, columns: Sequence[str], batch: ColumnBatch
+) -> bytes:
+    """Write a batch of rows as one row group.
+
+    Runs in a thread; pyarrow releases the GIL while compressing.
+
+    Args:
+        writer (Any): The writer opened by ``open_parquet_writer``.
+        sink (ParquetSink): The sink of the writer.
+        columns (Sequence[str]): The column names, in order.
+        batch (ColumnBatch): The values of each column.
+
+    Returns:
+        bytes: The encoded row group.
+    """
+    import pyarrow as pa
+
+    arrays = [
+        pa.array(
+            [None if value is None else str(value) for value in batch[column]],
+            pa.string(),
+        )
+        for column in columns
+    ]
+    writer.write_batch(pa.record_batch(arrays, schema=writer.schema))
+    return sink.drain()
+
+
+def close_parquet_writer(writer: Any, sink: ParquetSink) -> bytes:
+    """Close a Parquet writer.
+
+    Args:
+        writer (Any): The writer opened by ``open_parquet_writer``.
+        sink (ParquetSink): The sink of the writer.
+
+    Returns:
+        bytes: The rest of the file, ending with its footer.
+    """
+    writer.close()
+    return sink.drain()
+
+
+class ColumnarExporter:
+    """Export pages of contacts or companies as CSV or Parquet.
+
+    Rows are accumulated into column batches of ``batch_rows`` on the event
+    loop and encoded off it, so that large exports do not block other
+    requests. Each batch is streamed as soon as it is encoded, while the
+    next pages are fetched, so at most two batches are held in memory.
+    CSV batches are encoded in a process pool. Parquet batches are written
+    as row groups by one writer, which keeps the file's footer until the
+    end, so they are encoded on a thread; Parquet requires pyarrow.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        batch_rows: int = 10000,
+        parquet_compression: str = "zstd",
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            max_workers (int): Number of worker processes.
+            batch_rows (int): Number of rows encoded per task.
+            parquet_compression (str): The Parquet compression codec.
+            executor (Optional[Executor]): Runs the CSV encoding instead of
+                a process pool of its own, mainly for tests.
+        """
+        self.max_workers = max_workers
+        self.batch_rows = batch_rows
+        self.parquet_compression = parquet_compression
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self) -> Executor:
+        """Get the executor, starting the process pool if needed."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the process pool."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def _batches(
+        self,
+        pages: AsyncIterator[Sequence[Union[Contact, Company]]],
+        columns: Sequence[str],
+    ) -> AsyncIterator[ColumnBatch]:
+        """Accumulate pages of objects into column batches."""
+        batch: ColumnBatch = {column: [] for column in columns}
+        rows = 0
+        async for page in pages:
+            for item in page:
+                data = item.to_dict()
+                for column in columns:
+                    batch[column].append(
+                        data[column]
+                        if column in data
+                        else item.properties.get(column)
+                    )
+            rows += len(page)
+            if rows >= self.batch_rows:
+                yield batch
+                batch = {column: [] for column in columns}
+                rows = 0
+        if rows:
+            yield batch
+
+    async def stream(
+        self,
+        pages: AsyncIterator[Sequence[Union[Contact, Company]]],
+        columns: Sequence[str],
+        export_format: ColumnarFormat,
+    ) -> AsyncIterator[bytes]:
+        """Encode pages of objects, yielding the file in chunks.
+
+        Args:
+            pages (AsyncIterator[Sequence[Union[Contact, Company]]]): The
+                objects to export.
+            columns (Sequence[str]): The fields to export, in order.
+            export_format (ColumnarFormat): "csv" or "parquet".
+
+        Yields:
+            bytes: The next chunk of the file.
+        """
+        loop = asyncio.get_running_loop()
+        columns = list(columns)
+
+        writer: Any = None
+        if export_format == "parquet":
+            writer, sink = open_parquet_writer(columns, self.parquet_compression)
+        header = True
+        pending: Optional[asyncio.Future] = None
+        try:
+            async for batch in self._batches(pages, columns):
+                if writer is not None:
+                    # The writer takes one row group at a time, in order
+                    if pending is not None:
+                        yield await pending
+                        pending = None
+                    encoding = asyncio.ensure_future(
+                        asyncio.to_thread(
+                            write_parquet_batch, writer, sink, columns, batch
+                        )
+                    )
+                else:
+                    encoding = loop.run_in_executor(
+                        self.executor, encode_csv, columns, batch, header
+                    )
+                    header = False
+                if pending is not None:
+                    yield await pending
+                pending = encoding
+            if pending is not None:
+                yield await pending
+                pending = None
+            if writer is not None:
+                yield await asyncio.to_thread(close_parquet_writer, writer, sink)
+            elif header:
+                yield encode_csv(columns, {column: [] for column in columns}, True)
+        finally:
+            if pending is not None:
+                pending.cancel()
@@ -1,12 +1,11 @@
 import httpx
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from src.domain.interfaces.hubspot import IHubSpotAuth
 from src.domain.types.hubspot import UserInfo
 from src.domain.exceptions import HubSpotAuthenticationError, HubSpotOperationError
 from src.infrastructure.config import get_settings
-
-settings = get_settings()
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient, get_http_client
 
 
 class HubSpotAuth(IHubSpotAuth):
@@ -16,12 +15,22 @@ class HubSpotAuth(IHubSpotAuth):
     TOKEN_URL = "https://api.hubapi.com/oauth/v1/token"
     USER_INFO_URL = "https://api.hubapi.com/oauth/v1/access-tokens/"
 
+    def __init__(self, http_client: Optional[HubSpotHttpClient] = None):
+        """Initialize the auth client.
+
+        Args:
+            http_client (Optional[HubSpotHttpClient]): The shared HTTP client.
+                Defaults to the process-wide client.
+        """
+        self.http_client = http_client or get_http_client()
+
     def get_authorization_url(self) -> str:
         """Get the authorization URL for the HubSpot OAuth flow.
 
         Returns:
             str: The authorization URL.
         """
+        settings = get_settings()
         params = {
             "client_id": settings.HUBSPOT_CLIENT_ID,
             "redirect_uri": settings.HUBSPOT_REDIRECT_URI,
@@ -42,25 +51,29 @@ class HubSpotAuth(IHubSpotAuth):
             HubSpotAuthenticationError: If the authorization code is invalid.
             HubSpotOperationError: If the access token cannot be retrieved.
         """
-        async with httpx.AsyncClient() as client:
-            data = {
-                "grant_type": "authorization_code",
-                "client_id": settings.HUBSPOT_CLIENT_ID,
-                "client_secret": settings.HUBSPOT_CLIENT_SECRET,
-                "redirect_uri": settings.HUBSPOT_REDIRECT_URI,
-                "code": code,
-            }
-
-            try:
-                response = await client.post(self.TOKEN_URL, data=data)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                if response.status_code == 400:
-                    raise HubSpotAuthenticationError(
-                        f"Invalid authorization code: {str(e)}"
-                    )
-                raise HubSpotOperationError(f"Failed to get access token: {str(e)}")
+        settings = get_settings()
+        data = {
+            "grant_type": "authorization_code",
+            "client_id": settings.HUBSPOT_CLIENT_ID,
+            "client_secret": settings.HUBSPOT_CLIENT_SECRET,
+            "redirect_uri": settings.HUBSPOT_REDIRECT_URI,
+            "code": code,
+        }
+
+        try:
+            response = await self.http_client.request(
+                "POST", self.TOKEN_URL, data=data
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 400:
+                raise HubSpotAuthenticationError(
+                    f"Invalid authorization code: {str(e)}"
+                )
+            raise HubSpotOperationError(f"Failed to get access token: {str(e)}")
+        except httpx.HTTPError as e:
+            raise HubSpotOperationError(f"Failed to get access token: {str(e)}")
 
     async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """Refresh the access token for the HubSpot OAuth flow.
@@ -75,22 +88,26 @@ class HubSpotAuth(IHubSpotAuth):
             HubSpotAuthenticationError: If the refresh token is invalid.
             HubSpotOperationError: If the access token cannot be refreshed.
         """
-        async with httpx.AsyncClient() as client:
-            data = {
-                "grant_type": "refresh_token",
-                "client_id": settings.HUBSPOT_CLIENT_ID,
-                "client_secret": settings.HUBSPOT_CLIENT_SECRET,
-                "refresh_token": refresh_token,
-            }
-
-            try:
-                response = await client.post(self.TOKEN_URL, data=data)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                if response.status_code == 400:
-                    raise HubSpotAuthenticationError(f"Invalid refresh token: {str(e)}")
-                raise HubSpotOperationError(f"Failed to refresh token: {str(e)}")
+        settings = get_settings()
+        data = {
+            "grant_type": "refresh_token",
+            "client_id": settings.HUBSPOT_CLIENT_ID,
+            "client_secret": settings.HUBSPOT_CLIENT_SECRET,
+            "refresh_token": refresh_token,
+        }
+
+        try:
+            response = await self.http_client.request(
+                "POST", self.TOKEN_URL, data=data
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 400:
+                raise HubSpotAuthenticationError(f"Invalid refresh token: {str(e)}")
+            raise HubSpotOperationError(f"Failed to refresh token: {str(e)}")
+        except httpx.HTTPError as e:
+            raise HubSpotOperationError(f"Failed to refresh token: {str(e)}")
 
     async def get_user_info(self, access_token: str) -> UserInfo:
         """Get the user info for the HubSpot OAuth flow.
@@ -105,16 +122,17 @@ class HubSpotAuth(IHubSpotAuth):
             HubSpotAuthenticationError: If the access token is invalid.
             HubSpotOperationError: If the user info cannot be retrieved.
         """
-        async with httpx.AsyncClient() as client:
-            headers = {"Authorization": f"Bearer {access_token}"}
-            try:
-                response = await client.get(
-                    f"{self.USER_INFO_URL}{access_token}", headers=headers
-                )
-                response.raise_for_status()
-                data = response.json()
-                return UserInfo.from_dict(data)
-            except httpx.HTTPError as e:
-                if response.status_code == 401:
-                    raise HubSpotAuthenticationError(f"Invalid access token: {str(e)}")
-                raise HubSpotOperationError(f"Failed to get user info: {str(e)}")
+        headers = {"Authorization": f"Bearer {access_token}"}
+        try:
+            response = await self.http_client.request(
+                "GET", f"{self.USER_INFO_URL}{access_token}", headers=headers
+            )
+            response.raise_for_status()
+            data = response.json()
+            return UserInfo.from_dict(data)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise HubSpotAuthenticationError(f"Invalid access token: {str(e)}")
+            raise HubSpotOperationError(f"Failed to get user info: {str(e)}")
+        except httpx.HTTPError as e:
+            raise HubSpotOperationError(f"Failed to get user info: {str(e)}")
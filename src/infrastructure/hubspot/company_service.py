@@ -1,72 +1,580 @@
-from typing import List
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
-from hubspot import HubSpot
-from hubspot.crm.associations.v4.models import AssociationSpec
+import httpx
 
-from src.domain.exceptions import HubSpotOperationError
+from src.domain.exceptions import HubSpotAuthenticationError, HubSpotOperationError
 from src.domain.interfaces.hubspot import IHubSpotCompanyService
-from src.domain.types.hubspot import Company
+from src.domain.types.hubspot import AssociationResult, Company
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient, get_http_client
+from src.infrastructure.hubspot.properties import (
+    FieldProperties,
+    extra_properties,
+    resolve_properties,
+)
+from src.infrastructure.hubspot.search import iter_modified
+
+# HubSpot-defined contact -> company association type
+CONTACT_TO_COMPANY_ASSOCIATION_TYPE_ID = 1
+CONTACT_TO_COMPANY_ASSOCIATION_SPEC = {
+    "associationCategory": "HUBSPOT_DEFINED",
+    "associationTypeId": CONTACT_TO_COMPANY_ASSOCIATION_TYPE_ID,
+}
+
+# Maximum number of inputs HubSpot accepts in a single batch request
+ASSOCIATIONS_BATCH_SIZE = 1000
+COMPANIES_BATCH_SIZE = 100
+# Largest page of associations HubSpot returns
+ASSOCIATIONS_PAGE_SIZE = 500
+
+COMPANY_FIELD_PROPERTIES: FieldProperties = {
+    "name": ("name",),
+    "domain": ("domain",),
+    "industry": ("industry",),
+    "phone": ("phone",),
+}
+COMPANY_MODIFIED_PROPERTY = "hs_lastmodifieddate"
+
+
+def company_from_properties(
+    company_id: str,
+    properties: Dict[str, Any],
+    fields: Optional[List[str]],
+    associated: bool = True,
+) -> Company:
+    """Map a HubSpot company to a company.
+
+    Args:
+        company_id (str): The ID of the company.
+        properties (Dict[str, Any]): The properties returned by HubSpot.
+        fields (Optional[List[str]]): The requested fields.
+        associated (bool): Whether the company was read as an association.
+
+    Returns:
+        Company: The company.
+    """
+    return Company(
+        id=company_id,
+        name=properties.get("name"),
+        domain=properties.get("domain"),
+        industry=properties.get("industry"),
+        phone=properties.get("phone"),
+        associated=associated,
+        properties=extra_properties(properties, fields, COMPANY_FIELD_PROPERTIES),
+    )
+
+
+T = TypeVar("T")
+
+AssociationPair = Tuple[str, str]
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split items into consecutive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def map_companies_to_contacts(
+    contact_ids: Sequence[str],
+    company_ids_by_contact: Dict[str, List[str]],
+    companies: List[Company],
+) -> Dict[str, List[Company]]:
+    """Build the contact to companies map of a batch read.
+
+    Args:
+        contact_ids (Sequence[str]): The requested contact IDs.
+        company_ids_by_contact (Dict[str, List[str]]): The associated company
+            IDs of each contact.
+        companies (List[Company]): Every company that was read.
+
+    Returns:
+        Dict[str, List[Company]]: The companies of every requested contact,
+            which is empty for contacts without companies.
+    """
+    companies_by_id = {company.id: company for company in companies}
+    return {
+        contact_id: [
+            companies_by_id[company_id]
+            for company_id in company_ids_by_contact.get(contact_id, [])
+            if company_id in companies_by_id
+        ]
+        for contact_id in contact_ids
+    }
+
+
+async def run_association_batches(
+    pairs: Sequence[AssociationPair],
+    run_chunk: Callable[
+        [Sequence[AssociationPair]], Awaitable[List[AssociationResult]]
+    ],
+    concurrency: int,
+) -> List[AssociationResult]:
+    """Run association changes in batches with bounded parallelism.
+
+    A batch that fails is reported as failed for each of its pairs, so one
+    bad batch does not fail the others. Authentication errors still fail
+    the whole operation.
+
+    Args:
+        pairs (Sequence[AssociationPair]): The (contact ID, company ID) pairs.
+        run_chunk (Callable): Applies the change to one batch of pairs.
+        concurrency (int): The maximum number of batches in flight.
+
+    Returns:
+        List[AssociationResult]: The outcome of each distinct pair, in order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(chunk: Sequence[AssociationPair]) -> List[AssociationResult]:
+        async with semaphore:
+            try:
+                return await run_chunk(chunk)
+            except HubSpotOperationError as e:
+                return [
+                    AssociationResult(contact_id, company_id, False, str(e))
+                    for contact_id, company_id in chunk
+                ]
+
+    unique_pairs = list(dict.fromkeys(pairs))
+    chunks = await asyncio.gather(
+        *(run(chunk) for chunk in chunked(unique_pairs, ASSOCIATIONS_BATCH_SIZE))
+    )
+    return [result for chunk in chunks for result in chunk]
 
 
 class HubSpotCompanyService(IHubSpotCompanyService):
     """Implementation of HubSpot company operations."""
 
+    ASSOCIATIONS_URL = (
+        "https://api.hubapi.com/crm/v4/objects/contacts/{contact_id}"
+        "/associations/companies"
+    )
+    ASSOCIATIONS_BATCH_READ_URL = (
+        "https://api.hubapi.com/crm/v4/associations/contacts/companies/batch/read"
+    )
+    ASSOCIATIONS_BATCH_CREATE_URL = (
+        "https://api.hubapi.com/crm/v4/associations/contacts/companies/batch/create"
+    )
+    ASSOCIATIONS_BATCH_ARCHIVE_URL = (
+        "https://api.hubapi.com/crm/v4/associations/contacts/companies/batch/archive"
+    )
+    COMPANIES_BATCH_READ_URL = (
+        "https://api.hubapi.com/crm/v3/objects/companies/batch/read"
+    )
+    COMPANIES_URL = "https://api.hubapi.com/crm/v3/objects/companies"
+    COMPANIES_SEARCH_URL = "https://api.hubapi.com/crm/v3/objects/companies/search"
+
+    def __init__(
+        self,
+        http_client: Optional[HubSpotHttpClient] = None,
+        batch_concurrency: int = 4,
+    ):
+        """Initialize the company service.
+
+        Args:
+            http_client (Optional[HubSpotHttpClient]): The shared HTTP client.
+                Defaults to the process-wide client.
+            batch_concurrency (int): Maximum number of association batch
+                requests in flight per operation.
+        """
+        self.http_client = http_client or get_http_client()
+        self.batch_concurrency = batch_concurrency
+
+    async def _request(
+        self, method: str, url: str, access_token: str, action: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send an authenticated request and map HTTP errors.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            access_token (str): The access token.
+            action (str): Description of the operation, used in error messages.
+
+        Returns:
+            httpx.Response: The successful response.
+
+        Raises:
+            HubSpotAuthenticationError: If the access token is invalid.
+            HubSpotOperationError: If the request fails.
+        """
+        headers = {"Authorization": f"Bearer {access_token}"}
+        try:
+            response = await self.http_client.request(
+                method, url, headers=headers, **kwargs
+            )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise HubSpotAuthenticationError(f"Invalid access token: {str(e)}")
+            raise HubSpotOperationError(f"Failed to {action}: {str(e)}")
+        except httpx.HTTPError as e:
+            raise HubSpotOperationError(f"Failed to {action}: {str(e)}")
+
     async def get_companies_associated_with_contact(
-        self, access_token: str, contact_id: str, limit: int = 10
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        after: Optional[str] = None,
     ) -> List[Company]:
         """Get companies associated with a contact.
 
         Args:
             access_token (str): The access token.
             contact_id (str): The ID of the contact.
-            limit (int): The maximum number of companies to return.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+            after (Optional[str]): The associations cursor to start after.
         """
+        companies, _ = await self.get_companies_page(
+            access_token, contact_id, limit=limit, after=after, fields=fields
+        )
+        return companies
+
+    async def get_companies_page(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Company], Optional[str]]:
+        """Get companies associated with a contact and the cursor after them.
+
+        Association pages are followed one after another, and the batch
+        reads of each page's companies run while the next page is fetched.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            after (Optional[str]): The associations cursor to start after.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Returns:
+            Tuple[List[Company], Optional[str]]: The companies, and the cursor
+                of the next page if there are more.
+        """
+        properties = resolve_properties(fields, COMPANY_FIELD_PROPERTIES)
+        reads: List["asyncio.Future[List[Company]]"] = []
         try:
-            api_client = HubSpot(access_token=access_token)
-
-            # Get associated companies using the v4 associations API
-            associations = api_client.crm.associations.v4.basic_api.get_page(
-                object_type="contacts",
-                object_id=contact_id,
-                to_object_type="companies",
-                limit=limit,
+            async for company_ids, after in self._iter_association_pages(
+                access_token, contact_id, limit=limit, after=after
+            ):
+                reads.extend(
+                    asyncio.ensure_future(
+                        self._read_company_chunk(
+                            access_token, chunk, properties, fields
+                        )
+                    )
+                    for chunk in chunked(company_ids, COMPANIES_BATCH_SIZE)
+                )
+            chunks = await asyncio.gather(*reads)
+        except BaseException:
+            for read in reads:
+                read.cancel()
+            await asyncio.gather(*reads, return_exceptions=True)
+            raise
+        return [company for chunk in chunks for company in chunk], after
+
+    async def _iter_association_pages(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[List[str], Optional[str]]]:
+        """Iterate over the pages of a contact's associated company IDs.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of IDs to read, or None
+                for every ID.
+            after (Optional[str]): The associations cursor to start after.
+
+        Yields:
+            Tuple[List[str], Optional[str]]: The company IDs of each page, and
+                the cursor of the next page if there are more.
+        """
+        url = self.ASSOCIATIONS_URL.format(contact_id=contact_id)
+        while True:
+            page_size = ASSOCIATIONS_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit)
+            params: Dict[str, Any] = {"limit": page_size}
+            if after:
+                params["after"] = after
+            response = await self._request(
+                "GET", url, access_token, "get companies", params=params
             )
+            data = response.json()
+            company_ids = [
+                str(assoc["toObjectId"]) for assoc in data.get("results", [])
+            ]
+            after = data.get("paging", {}).get("next", {}).get("after")
+            yield company_ids, after
 
-            if not associations.results:
-                return []
+            if limit is not None:
+                limit -= len(company_ids)
+            if not after or not company_ids or limit == 0:
+                return
 
-            # Get company IDs from associations
-            company_ids = [assoc.to_object_id for assoc in associations.results]
+    async def get_companies_for_contacts(
+        self,
+        access_token: str,
+        contact_ids: List[str],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, List[Company]]:
+        """Get the companies associated with each of several contacts.
 
-            from hubspot.crm.companies.models import BatchReadInputSimplePublicObjectId
+        Associations are read with the v4 batch API, following the
+        remaining pages of contacts with more companies than one result
+        holds, and every distinct company is then read once, in concurrent
+        chunks.
 
-            batch_input = BatchReadInputSimplePublicObjectId(
-                inputs=[{"id": id} for id in company_ids]
+        Args:
+            access_token (str): The access token.
+            contact_ids (List[str]): The IDs of the contacts.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Returns:
+            Dict[str, List[Company]]: The companies of each contact.
+        """
+        contact_ids = list(dict.fromkeys(contact_ids))
+        pages = await asyncio.gather(
+            *(
+                self._read_associations(access_token, chunk)
+                for chunk in chunked(contact_ids, ASSOCIATIONS_BATCH_SIZE)
             )
-            # Get all company details in a single batch request
-            companies_response = api_client.crm.companies.batch_api.read(
-                batch_read_input_simple_public_object_id=batch_input,
+        )
+        company_ids_by_contact: Dict[str, List[str]] = {}
+        for page in pages:
+            company_ids_by_contact.update(page)
+
+        company_ids = list(
+            dict.fromkeys(
+                company_id
+                for ids in company_ids_by_contact.values()
+                for company_id in ids
             )
+        )
+        companies = await self._read_companies(access_token, company_ids, fields)
+        return map_companies_to_contacts(
+            contact_ids, company_ids_by_contact, companies
+        )
 
-            # Format the response
-            companies = []
-            for company in companies_response.results:
-                companies.append(
-                    Company.from_dict(
-                        {
-                            "id": company.id,
-                            "name": company.properties.get("name"),
-                            "domain": company.properties.get("domain"),
-                            "industry": company.properties.get("industry"),
-                            "phone": company.properties.get("phone"),
-                            "associated": True,
-                        }
-                    )
+    async def _read_associations(
+        self, access_token: str, contact_ids: Sequence[str]
+    ) -> Dict[str, List[str]]:
+        """Read the associated company IDs of up to a batch of contacts.
+
+        Args:
+            access_token (str): The access token.
+            contact_ids (Sequence[str]): The IDs of the contacts.
+
+        Returns:
+            Dict[str, List[str]]: The company IDs of each contact that has any.
+        """
+        response = await self._request(
+            "POST",
+            self.ASSOCIATIONS_BATCH_READ_URL,
+            access_token,
+            "get associations",
+            json={"inputs": [{"id": contact_id} for contact_id in contact_ids]},
+        )
+        company_ids_by_contact: Dict[str, List[str]] = {}
+        cursors: Dict[str, str] = {}
+        # Contacts without companies are reported as errors of a 207 response
+        for result in response.json().get("results", []):
+            contact_id = str(result["from"]["id"])
+            company_ids_by_contact[contact_id] = [
+                str(assoc["toObjectId"]) for assoc in result.get("to", [])
+            ]
+            after = result.get("paging", {}).get("next", {}).get("after")
+            if after:
+                cursors[contact_id] = after
+
+        # A batch result holds one page; read the rest of longer lists
+        async def read_rest(contact_id: str, after: str) -> List[str]:
+            return [
+                company_id
+                async for company_ids, _ in self._iter_association_pages(
+                    access_token, contact_id, after=after
                 )
+                for company_id in company_ids
+            ]
+
+        rests = await asyncio.gather(
+            *(read_rest(contact_id, after) for contact_id, after in cursors.items())
+        )
+        for contact_id, rest in zip(cursors, rests):
+            company_ids_by_contact[contact_id].extend(rest)
+        return company_ids_by_contact
+
+    async def _read_companies(
+        self,
+        access_token: str,
+        company_ids: Sequence[str],
+        fields: Optional[List[str]],
+    ) -> List[Company]:
+        """Read companies by ID in concurrent batch requests.
+
+        Args:
+            access_token (str): The access token.
+            company_ids (Sequence[str]): The IDs of the companies.
+            fields (Optional[List[str]]): The requested fields.
+
+        Returns:
+            List[Company]: The companies that were found.
+        """
+        properties = resolve_properties(fields, COMPANY_FIELD_PROPERTIES)
+        chunks = await asyncio.gather(
+            *(
+                self._read_company_chunk(access_token, chunk, properties, fields)
+                for chunk in chunked(company_ids, COMPANIES_BATCH_SIZE)
+            )
+        )
+        return [company for chunk in chunks for company in chunk]
+
+    async def _read_company_chunk(
+        self,
+        access_token: str,
+        company_ids: Sequence[str],
+        properties: List[str],
+        fields: Optional[List[str]],
+    ) -> List[Company]:
+        """Read up to a batch of companies by ID.
 
-            return companies
-        except Exception as e:
-            raise HubSpotOperationError(f"Failed to get companies: {str(e)}")
+        Args:
+            access_token (str): The access token.
+            company_ids (Sequence[str]): The IDs of the companies.
+            properties (List[str]): The HubSpot properties to read.
+            fields (Optional[List[str]]): The requested fields.
+
+        Returns:
+            List[Company]: The companies that were found.
+        """
+        response = await self._request(
+            "POST",
+            self.COMPANIES_BATCH_READ_URL,
+            access_token,
+            "get companies",
+            json={
+                "properties": properties,
+                "inputs": [{"id": company_id} for company_id in company_ids],
+            },
+        )
+        return [
+            company_from_properties(
+                company["id"], company.get("properties", {}), fields
+            )
+            for company in response.json().get("results", [])
+        ]
+
+    async def iter_companies(
+        self,
+        access_token: str,
+        page_size: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over every company, one page at a time, in ID order.
+
+        Args:
+            access_token (str): The access token.
+            page_size (int): The number of companies per page (at most 100).
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Yields:
+            List[Company]: The companies of each page.
+        """
+        properties = resolve_properties(fields, COMPANY_FIELD_PROPERTIES)
+        after: Optional[str] = None
+        while True:
+            params: Dict[str, Any] = {"limit": page_size, "properties": properties}
+            if after:
+                params["after"] = after
+            response = await self._request(
+                "GET", self.COMPANIES_URL, access_token, "list companies", params=params
+            )
+            data = response.json()
+            yield [
+                company_from_properties(
+                    result["id"], result.get("properties", {}), fields, False
+                )
+                for result in data.get("results", [])
+            ]
+            after = data.get("paging", {}).get("next", {}).get("after")
+            if not after:
+                return
+
+    async def iter_modified_companies(
+        self,
+        access_token: str,
+        since: datetime,
+        page_size: int = 100,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over companies modified at or after a time, oldest first.
+
+        Each company carries its ``hs_lastmodifieddate`` in ``properties``.
+
+        Args:
+            access_token (str): The access token.
+            since (datetime): The earliest modification to return.
+            page_size (int): The number of companies per page (at most 200).
+
+        Yields:
+            List[Company]: The companies of each page.
+        """
+        fields = [*COMPANY_FIELD_PROPERTIES, COMPANY_MODIFIED_PROPERTY]
+
+        async def search(body: Dict[str, Any]) -> Dict[str, Any]:
+            response = await self._request(
+                "POST",
+                self.COMPANIES_SEARCH_URL,
+                access_token,
+                "search companies",
+                json=body,
+            )
+            return response.json()
+
+        async for results in iter_modified(
+            search,
+            COMPANY_MODIFIED_PROPERTY,
+            since,
+            resolve_properties(fields, COMPANY_FIELD_PROPERTIES),
+            page_size,
+        ):
+            yield [
+                company_from_properties(
+                    result["id"], result.get("properties", {}), fields, False
+                )
+                for result in results
+            ]
 
     async def create_association(
         self,
@@ -81,22 +589,13 @@ class HubSpotCompanyService(IHubSpotCompanyService):
             contact_id (str): The ID of the contact.
             company_id (str): The ID of the company.
         """
-        try:
-            api_client = HubSpot(access_token=access_token)
-            api_client.crm.associations.v4.basic_api.create(
-                object_type="contacts",
-                object_id=contact_id,
-                to_object_type="companies",
-                to_object_id=company_id,
-                association_spec=[
-                    AssociationSpec(
-                        association_category="HUBSPOT_DEFINED",
-                        association_type_id=1,
-                    )
-                ],
-            )
-        except Exception as e:
-            raise HubSpotOperationError(f"Failed to create association: {str(e)}")
+        await self._request(
+            "PUT",
+            f"{self.ASSOCIATIONS_URL.format(contact_id=contact_id)}/{company_id}",
+            access_token,
+            "create association",
+            json=[CONTACT_TO_COMPANY_ASSOCIATION_SPEC],
+        )
 
     async def remove_association(
         self,
@@ -111,13 +610,113 @@ class HubSpotCompanyService(IHubSpotCompanyService):
             contact_id (str): The ID of the contact.
             company_id (str): The ID of the company.
         """
-        try:
-            api_client = HubSpot(access_token=access_token)
-            api_client.crm.associations.v4.basic_api.archive(
-                object_type="contacts",
-                object_id=contact_id,
-                to_object_type="companies",
-                to_object_id=company_id,
+        await self._request(
+            "DELETE",
+            f"{self.ASSOCIATIONS_URL.format(contact_id=contact_id)}/{company_id}",
+            access_token,
+            "remove association",
+        )
+
+    async def create_associations(
+        self,
+        access_token: str,
+        pairs: List[AssociationPair],
+    ) -> List[AssociationResult]:
+        """Create associations between many contacts and companies.
+
+        Args:
+            access_token (str): The access token.
+            pairs (List[AssociationPair]): The (contact ID, company ID) pairs.
+
+        Returns:
+            List[AssociationResult]: The outcome of each distinct pair.
+        """
+
+        async def create_chunk(
+            chunk: Sequence[AssociationPair],
+        ) -> List[AssociationResult]:
+            response = await self._request(
+                "POST",
+                self.ASSOCIATIONS_BATCH_CREATE_URL,
+                access_token,
+                "create associations",
+                json={
+                    "inputs": [
+                        {
+                            "from": {"id": contact_id},
+                            "to": {"id": company_id},
+                            "types": [CONTACT_TO_COMPANY_ASSOCIATION_SPEC],
+                        }
+                        for contact_id, company_id in chunk
+                    ]
+                },
             )
-        except Exception as e:
-            raise HubSpotOperationError(f"Failed to remove association: {str(e)}")
+            # Pairs HubSpot could not associate are missing from the results
+            data = response.json()
+            created = {
+                (str(result["fromObjectId"]), str(result["toObjectId"]))
+                for result in data.get("results", [])
+            }
+            error = "; ".join(
+                error.get("message", "") for error in data.get("errors", [])
+            )
+            return [
+                AssociationResult(
+                    contact_id,
+                    company_id,
+                    (contact_id, company_id) in created,
+                    None
+                    if (contact_id, company_id) in created
+                    else error or "Association was not created",
+                )
+                for contact_id, company_id in chunk
+            ]
+
+        return await run_association_batches(
+            pairs, create_chunk, self.batch_concurrency
+        )
+
+    async def remove_associations(
+        self,
+        access_token: str,
+        pairs: List[AssociationPair],
+    ) -> List[AssociationResult]:
+        """Remove associations between many contacts and companies.
+
+        Args:
+            access_token (str): The access token.
+            pairs (List[AssociationPair]): The (contact ID, company ID) pairs.
+
+        Returns:
+            List[AssociationResult]: The outcome of each distinct pair.
+        """
+
+        async def archive_chunk(
+            chunk: Sequence[AssociationPair],
+        ) -> List[AssociationResult]:
+            company_ids_by_contact: Dict[str, List[str]] = defaultdict(list)
+            for contact_id, company_id in chunk:
+                company_ids_by_contact[contact_id].append(company_id)
+            await self._request(
+                "POST",
+                self.ASSOCIATIONS_BATCH_ARCHIVE_URL,
+                access_token,
+                "remove associations",
+                json={
+                    "inputs": [
+                        {
+                            "from": {"id": contact_id},
+                            "to": [{"id": company_id} for company_id in company_ids],
+                        }
+                        for contact_id, company_ids in company_ids_by_contact.items()
+                    ]
+                },
+            )
+            return [
+                AssociationResult(contact_id, company_id, True)
+                for contact_id, company_id in chunk
+            ]
+
+        return await run_association_batches(
+            pairs, archive_chunk, self.batch_concurrency
+        )
@@ -1,21 +1,70 @@
-from typing import List, Optional
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import httpx
 
 from src.domain.interfaces.hubspot import IHubSpotContactService
 from src.domain.types.hubspot import Contact
 from src.domain.exceptions import HubSpotAuthenticationError, HubSpotOperationError
-from src.infrastructure.config import get_settings
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient, get_http_client
+from src.infrastructure.hubspot.properties import (
+    FieldProperties,
+    extra_properties,
+    resolve_properties,
+)
+from src.infrastructure.hubspot.search import iter_modified
 
-settings = get_settings()
+CONTACT_FIELD_PROPERTIES: FieldProperties = {
+    "name": ("firstname", "lastname"),
+    "email": ("email",),
+    "phone": ("phone",),
+}
+CONTACT_MODIFIED_PROPERTY = "lastmodifieddate"
+
+
+def contact_from_properties(
+    contact_id: str, properties: Dict[str, Any], fields: Optional[List[str]]
+) -> Contact:
+    """Map a HubSpot contact to a contact.
+
+    Args:
+        contact_id (str): The ID of the contact.
+        properties (Dict[str, Any]): The properties returned by HubSpot.
+        fields (Optional[List[str]]): The requested fields.
+
+    Returns:
+        Contact: The contact.
+    """
+    return Contact(
+        id=contact_id,
+        name=f"{properties.get('firstname', '')} {properties.get('lastname', '')}".strip(),
+        email=properties.get("email", ""),
+        phone=properties.get("phone", ""),
+        properties=extra_properties(properties, fields, CONTACT_FIELD_PROPERTIES),
+    )
 
 
 class HubSpotContactService(IHubSpotContactService):
     """Implementation of HubSpot contact operations."""
 
     CONTACTS_URL = "https://api.hubapi.com/crm/v3/objects/contacts"
+    SEARCH_URL = "https://api.hubapi.com/crm/v3/objects/contacts/search"
+
+    def __init__(self, http_client: Optional[HubSpotHttpClient] = None):
+        """Initialize the contact service.
+
+        Args:
+            http_client (Optional[HubSpotHttpClient]): The shared HTTP client.
+                Defaults to the process-wide client.
+        """
+        self.http_client = http_client or get_http_client()
 
     async def get_contacts(
-        self, access_token: str, limit: int = 10, after: Optional[str] = None
+        self,
+        access_token: str,
+        limit: int = 10,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Contact]:
         """Get contacts from HubSpot.
 
@@ -23,35 +72,144 @@ class HubSpotContactService(IHubSpotContactService):
             access_token (str): The access token.
             limit (int): The maximum number of contacts to return.
             after (Optional[str]): The ID of the last contact to return.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every contact field.
         """
+        contacts, _ = await self._get_page(access_token, limit, after, fields)
+        return contacts
+
+    async def iter_contacts(
+        self,
+        access_token: str,
+        page_size: int = 100,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Contact]]:
+        """Iterate over every contact, one page at a time.
+
+        The next page is requested while the caller handles the current one,
+        so at most two pages are held at once. Closing the iterator cancels
+        the request in flight.
+
+        Args:
+            access_token (str): The access token.
+            page_size (int): The number of contacts per page (at most 100).
+            after (Optional[str]): The cursor to start after.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every contact field.
+
+        Yields:
+            List[Contact]: The contacts of each page.
+        """
+        next_page: Optional[asyncio.Future] = asyncio.ensure_future(
+            self._get_page(access_token, page_size, after, fields)
+        )
+        try:
+            while next_page is not None:
+                contacts, after = await next_page
+                next_page = (
+                    asyncio.ensure_future(
+                        self._get_page(access_token, page_size, after, fields)
+                    )
+                    if after
+                    else None
+                )
+                yield contacts
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                # Retrieve the outcome if the request finished before the cancel
+                next_page.add_done_callback(
+                    lambda page: page.cancelled() or page.exception()
+                )
+
+    async def _get_page(
+        self,
+        access_token: str,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Contact], Optional[str]]:
+        """Get one page of contacts and the cursor of the next page."""
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {
             "limit": limit,
-            "properties": ["firstname", "lastname", "email", "phone"],
+            "properties": resolve_properties(fields, CONTACT_FIELD_PROPERTIES),
         }
         if after:
             params["after"] = after
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    self.CONTACTS_URL, headers=headers, params=params
+        try:
+            response = await self.http_client.request(
+                "GET", self.CONTACTS_URL, headers=headers, params=params
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            contacts = [
+                contact_from_properties(
+                    result["id"], result.get("properties", {}), fields
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                contacts = []
-                for result in data.get("results", []):
-                    properties = result.get("properties", {})
-                    contact = Contact(
-                        id=result["id"],
-                        name=f"{properties.get('firstname', '')} {properties.get('lastname', '')}".strip(),
-                        email=properties.get("email", ""),
-                        phone=properties.get("phone", ""),
-                    )
-                    contacts.append(contact)
-                return contacts
-            except httpx.HTTPError as e:
-                if response.status_code == 401:
-                    raise HubSpotAuthenticationError(f"Invalid access token: {str(e)}")
-                raise HubSpotOperationError(f"Failed to get contacts: {str(e)}")
+                for result in data.get("results", [])
+            ]
+            next_after = data.get("paging", {}).get("next", {}).get("after")
+            return contacts, next_after
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise HubSpotAuthenticationError(f"Invalid access token: {str(e)}")
+            raise HubSpotOperationError(f"Failed to get contacts: {str(e)}")
+        except httpx.HTTPError as e:
+            raise HubSpotOperationError(f"Failed to get contacts: {str(e)}")
+
+    async def iter_modified_contacts(
+        self,
+        access_token: str,
+        since: datetime,
+        page_size: int = 100,
+    ) -> AsyncIterator[List[Contact]]:
+        """Iterate over contacts modified at or after a time, oldest first.
+
+        Each contact carries its ``lastmodifieddate`` in ``properties``.
+
+        Args:
+            access_token (str): The access token.
+            since (datetime): The earliest modification to return.
+            page_size (int): The number of contacts per page (at most 200).
+
+        Yields:
+            List[Contact]: The contacts of each page.
+        """
+        fields = [*CONTACT_FIELD_PROPERTIES, CONTACT_MODIFIED_PROPERTY]
+
+        async def search(body: Dict[str, Any]) -> Dict[str, Any]:
+            return await self._search(access_token, body)
+
+        async for results in iter_modified(
+            search,
+            CONTACT_MODIFIED_PROPERTY,
+            since,
+            resolve_properties(fields, CONTACT_FIELD_PROPERTIES),
+            page_size,
+        ):
+            yield [
+                contact_from_properties(
+                    result["id"], result.get("properties", {}), fields
+                )
+                for result in results
+            ]
+
+    async def _search(self, access_token: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a contact search request and return the response body."""
+        headers = {"Authorization": f"Bearer {access_token}"}
+        try:
+            response = await self.http_client.request(
+                "POST", self.SEARCH_URL, headers=headers, json=body
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise HubSpotAuthenticationError(f"Invalid access token: {str(e)}")
+            raise HubSpotOperationError(f"Failed to search contacts: {str(e)}")
+        except httpx.HTTPError as e:
+            raise HubSpotOperationError(f"Failed to search contacts: {str(e)}")
@@ -0,0 +1,243 @@
+"""Shared, pooled HTTP client for HubSpot API calls."""
+
+import asyncio
+import functools
+import importlib.util
+import logging
+from typing import Any, Optional
+
+import httpx
+
+from src.domain.services.request_context import (
+    Priority,
+    current_portal,
+    current_priority,
+)
+from src.infrastructure.config import Settings, get_settings
+from src.domain.services.adaptive_concurrency import AdaptiveConcurrencyLimit
+from src.domain.services.circuit_breaker import CircuitBreaker
+from src.infrastructure.hubspot.rate_limiter import HubSpotRateLimiter
+from src.infrastructure.hubspot.resilience import HubSpotUpstreamGuard
+
+logger = logging.getLogger(__name__)
+
+HUBSPOT_API_BASE_URL = "https://api.hubapi.com"
+
+
+class HubSpotHttpClient:
+    """Connection pool shared by every HubSpot-facing service.
+
+    The underlying ``httpx.AsyncClient`` keeps TCP/TLS connections to
+    api.hubapi.com alive between requests. It is opened and pre-warmed by
+    ``start`` from the app lifespan and closed by ``aclose``; if a service
+    is used outside of the lifespan (scripts, tests) the client is created
+    lazily on first use.
+
+    With a ``rate_limiter``, every request first waits for a token of the
+    portal set by ``portal_context``, and 429 responses are retried after
+    the pause the limiter imposes. With an ``upstream_guard``, requests are
+    shed with ``HubSpotUnavailableError`` while their endpoint family is
+    overloaded or failing.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        http2: bool = True,
+        warmup: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[HubSpotRateLimiter] = None,
+        max_retries: int = 3,
+        upstream_guard: Optional[HubSpotUpstreamGuard] = None,
+    ):
+        """Initialize the pool configuration.
+
+        Args:
+            max_connections (int): Maximum number of concurrent connections.
+            max_keepalive_connections (int): Maximum number of idle connections
+                kept open for reuse.
+            keepalive_expiry (float): Seconds an idle connection is kept open.
+            timeout (float): Default request timeout in seconds.
+            http2 (bool): Negotiate HTTP/2 when the ``h2`` package is installed.
+            warmup (bool): Open connections to HubSpot when the pool starts.
+            transport (Optional[httpx.AsyncBaseTransport]): Custom transport,
+                mainly for tests.
+            rate_limiter (Optional[HubSpotRateLimiter]): Paces requests per
+                portal; requests are sent unpaced without one.
+            max_retries (int): How often a throttled request is retried.
+            upstream_guard (Optional[HubSpotUpstreamGuard]): Limits concurrency
+                and breaks circuits per endpoint family.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+        self.warmup = warmup
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.upstream_guard = upstream_guard
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HubSpotHttpClient":
+        """Create a client configured from application settings.
+
+        Args:
+            settings (Settings): The application settings.
+
+        Returns:
+            HubSpotHttpClient: The configured client.
+        """
+        rate_limiter = None
+        if settings.HUBSPOT_RATE_LIMIT_ENABLED:
+            rate_limiter = HubSpotRateLimiter(
+                max_requests=settings.HUBSPOT_RATE_LIMIT_MAX_REQUESTS,
+                interval_seconds=settings.HUBSPOT_RATE_LIMIT_INTERVAL_SECONDS,
+                processes=settings.HUBSPOT_RATE_LIMIT_PROCESSES,
+                daily_reserve=settings.HUBSPOT_RATE_LIMIT_DAILY_RESERVE,
+                backoff_seconds=settings.HUBSPOT_RATE_LIMIT_BACKOFF_SECONDS,
+            )
+        upstream_guard = None
+        if settings.HUBSPOT_ADAPTIVE_CONCURRENCY_ENABLED:
+            upstream_guard = HubSpotUpstreamGuard(
+                new_limit=functools.partial(
+                    AdaptiveConcurrencyLimit,
+                    initial_limit=settings.HUBSPOT_CONCURRENCY_INITIAL_LIMIT,
+                    max_limit=settings.HUBSPOT_CONCURRENCY_MAX_LIMIT,
+                    max_queue=settings.HUBSPOT_CONCURRENCY_MAX_QUEUE,
+                    max_wait_seconds=settings.HUBSPOT_CONCURRENCY_MAX_WAIT_SECONDS,
+                ),
+                new_breaker=functools.partial(
+                    CircuitBreaker,
+                    failure_rate=settings.HUBSPOT_CIRCUIT_FAILURE_RATE,
+                    min_calls=settings.HUBSPOT_CIRCUIT_MIN_CALLS,
+                    open_seconds=settings.HUBSPOT_CIRCUIT_OPEN_SECONDS,
+                    probe_calls=settings.HUBSPOT_CIRCUIT_PROBE_CALLS,
+                ),
+            )
+        return cls(
+            max_connections=settings.HUBSPOT_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HUBSPOT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HUBSPOT_HTTP_KEEPALIVE_EXPIRY,
+            timeout=settings.HUBSPOT_HTTP_TIMEOUT,
+            http2=settings.HUBSPOT_HTTP2,
+            warmup=settings.HUBSPOT_HTTP_WARMUP,
+            rate_limiter=rate_limiter,
+            max_retries=settings.HUBSPOT_RATE_LIMIT_MAX_RETRIES,
+            upstream_guard=upstream_guard,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the underlying ``httpx.AsyncClient``, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+                transport=self.transport,
+            )
+        return self._client
+
+    async def start(self) -> None:
+        """Open the pool and pre-warm DNS, TCP and TLS to HubSpot."""
+        client = self.client
+        if self.warmup:
+            await self.warm_up(client)
+
+    async def warm_up(self, client: Optional[httpx.AsyncClient] = None) -> None:
+        """Establish a pooled connection to the HubSpot API.
+
+        Any response, including an error status, leaves a connection in the
+        pool, so failures are only logged.
+        """
+        client = client or self.client
+        try:
+            await asyncio.wait_for(
+                client.head(HUBSPOT_API_BASE_URL), timeout=self.timeout.connect
+            )
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            logger.warning("HubSpot connection warm-up failed: %s", e)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared pool.
+
+        A throttled request is retried up to ``max_retries`` times before its
+        429 response is returned.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The absolute URL to request.
+            **kwargs: Extra arguments forwarded to ``httpx.AsyncClient.request``.
+
+        Returns:
+            httpx.Response: The response.
+
+        Raises:
+            HubSpotUnavailableError: If the request was shed by the upstream
+                guard.
+        """
+        hub_id = current_portal()
+        priority = current_priority()
+        attempt = 0
+        while True:
+            response = await self._send(hub_id, priority, method, url, **kwargs)
+            if (
+                self.rate_limiter is None
+                or response.status_code != 429
+                or attempt == self.max_retries
+            ):
+                return response
+            # The pause makes the next acquire wait out the backoff
+            self.rate_limiter.throttle(hub_id, response, attempt)
+            attempt += 1
+
+    async def _send(
+        self,
+        hub_id: Optional[str],
+        priority: Priority,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send one attempt of a request through the limiter and guard."""
+        if self.upstream_guard is not None:
+            # Fail fast rather than wait for a token of a doomed request
+            self.upstream_guard.check(url)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(hub_id, priority)
+        if self.upstream_guard is None:
+            response = await self.client.request(method, url, **kwargs)
+        else:
+            response = await self.upstream_guard.send(
+                url, lambda: self.client.request(method, url, **kwargs)
+            )
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(hub_id, response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_http_client: Optional[HubSpotHttpClient] = None
+
+
+def get_http_client() -> HubSpotHttpClient:
+    """Get the process-wide HubSpot HTTP client."""
+    global _http_client
+    if _http_client is None:
+        _http_client = HubSpotHttpClient.from_settings(get_settings())
+    return _http_client
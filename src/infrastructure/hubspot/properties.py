@@ -0,0 +1,100 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from src.domain.exceptions import HubSpotAuthenticationError, HubSpotOperationError
+from src.domain.interfaces.hubspot import IHubSpotPropertyService
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient, get_http_client
+
+# Domain fields mapped to the HubSpot properties they are built from
+FieldProperties = Dict[str, Tuple[str, ...]]
+
+
+def resolve_properties(
+    fields: Optional[Sequence[str]], field_properties: FieldProperties
+) -> List[str]:
+    """Get the HubSpot properties to request for a set of fields.
+
+    Args:
+        fields (Optional[Sequence[str]]): The requested fields, or None for
+            every domain field. Fields that are not domain fields are
+            requested as HubSpot properties of the same name.
+        field_properties (FieldProperties): The domain field mapping.
+
+    Returns:
+        List[str]: The HubSpot property names, without duplicates.
+    """
+    if fields is None:
+        fields = list(field_properties)
+    properties: Dict[str, None] = {}
+    for field in fields:
+        for name in field_properties.get(field, (field,)):
+            properties[name] = None
+    return list(properties)
+
+
+def extra_properties(
+    properties: Dict[str, Any],
+    fields: Optional[Sequence[str]],
+    field_properties: FieldProperties,
+) -> Dict[str, Any]:
+    """Pick the requested properties that are not domain fields.
+
+    Args:
+        properties (Dict[str, Any]): The properties returned by HubSpot.
+        fields (Optional[Sequence[str]]): The requested fields.
+        field_properties (FieldProperties): The domain field mapping.
+
+    Returns:
+        Dict[str, Any]: The extra properties by name.
+    """
+    if not fields:
+        return {}
+    return {
+        field: properties.get(field)
+        for field in fields
+        if field not in field_properties and field != "id"
+    }
+
+
+class HubSpotPropertyService(IHubSpotPropertyService):
+    """Implementation of HubSpot property schema lookups."""
+
+    PROPERTIES_URL = "https://api.hubapi.com/crm/v3/properties/{object_type}"
+
+    def __init__(self, http_client: Optional[HubSpotHttpClient] = None):
+        """Initialize the property service.
+
+        Args:
+            http_client (Optional[HubSpotHttpClient]): The shared HTTP client.
+                Defaults to the process-wide client.
+        """
+        self.http_client = http_client or get_http_client()
+
+    async def get_property_names(
+        self, access_token: str, object_type: str
+    ) -> List[str]:
+        """Get the names of every property defined for an object type.
+
+        Args:
+            access_token (str): The access token.
+            object_type (str): The object type, e.g. "contacts" or "companies".
+
+        Returns:
+            List[str]: The property names.
+        """
+        headers = {"Authorization": f"Bearer {access_token}"}
+        try:
+            response = await self.http_client.request(
+                "GET",
+                self.PROPERTIES_URL.format(object_type=object_type),
+                headers=headers,
+            )
+            response.raise_for_status()
+            return [prop["name"] for prop in response.json().get("results", [])]
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise HubSpotAuthenticationError(f"Invalid access token: {str(e)}")
+            raise HubSpotOperationError(f"Failed to get properties: {str(e)}")
+        except httpx.HTTPError as e:
+            raise HubSpotOperationError(f"Failed to get properties: {str(e)}")
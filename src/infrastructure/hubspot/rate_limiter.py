@@ -0,0 +1,219 @@
+"""Per-portal limiting of outbound HubSpot requests."""
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from src.domain.exceptions import HubSpotOperationError
+from src.domain.services.request_context import Priority
+from src.domain.services.token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+MAX_HEADER = "X-HubSpot-RateLimit-Max"
+INTERVAL_HEADER = "X-HubSpot-RateLimit-Interval-Milliseconds"
+REMAINING_HEADER = "X-HubSpot-RateLimit-Remaining"
+DAILY_REMAINING_HEADER = "X-HubSpot-RateLimit-Daily-Remaining"
+
+
+def _header_number(response: httpx.Response, name: str) -> Optional[float]:
+    """Read a numeric header, ignoring missing or malformed values."""
+    value = response.headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@dataclass
+class LaneMetrics:
+    """Time spent waiting on the limiter by requests of one priority."""
+
+    requests: int = 0
+    waited: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        """Record one request and how long it waited."""
+        self.requests += 1
+        if wait_seconds > 0:
+            self.waited += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for reporting."""
+        return {
+            "requests": self.requests,
+            "waited": self.waited,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+
+
+class HubSpotRateLimiter:
+    """Token bucket per portal, calibrated from HubSpot's rate-limit headers.
+
+    Each hub ID gets a bucket that starts at ``max_requests`` per
+    ``interval_seconds`` and is recalibrated from the
+    ``X-HubSpot-RateLimit-*`` headers of every response. Interactive
+    requests are served ahead of background ones. Once a portal's daily
+    allowance falls to ``daily_reserve``, background requests fail fast so
+    the remainder is kept for interactive use. Requests not attributed to a
+    portal share one bucket.
+
+    HubSpot's limits apply to a portal across every process calling it, so
+    when ``processes`` processes each run a limiter, every bucket is sized
+    to an equal share of the limits, of at least one request.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 100,
+        interval_seconds: float = 10.0,
+        daily_reserve: int = 1000,
+        backoff_seconds: float = 1.0,
+        processes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_requests (int): Requests allowed per interval before the
+                first response calibrates a portal's bucket.
+            interval_seconds (float): Length of the rate-limit interval.
+            daily_reserve (int): Daily requests kept for interactive use.
+            backoff_seconds (float): Base delay of the exponential backoff
+                after a 429 without a Retry-After header.
+            processes (int): Number of processes sharing the limits.
+            clock (Callable[[], float]): Monotonic clock, mainly for tests.
+        """
+        self.max_requests = max_requests
+        self.interval_seconds = interval_seconds
+        self.daily_reserve = daily_reserve
+        self.backoff_seconds = backoff_seconds
+        self.processes = processes
+        self._clock = clock
+        self._buckets: Dict[Optional[str], TokenBucket] = {}
+        self._daily_remaining: Dict[Optional[str], float] = {}
+        self._lanes = {priority: LaneMetrics() for priority in Priority}
+        self.throttled = 0
+
+    def _share(self, requests: float) -> float:
+        """Get this process's share of a number of requests, at least one."""
+        return max(requests / self.processes, 1.0)
+
+    def bucket(self, hub_id: Optional[str]) -> TokenBucket:
+        """Get the bucket of a portal, creating it if needed.
+
+        Args:
+            hub_id (Optional[str]): The hub ID, or None for unattributed calls.
+
+        Returns:
+            TokenBucket: The portal's bucket.
+        """
+        bucket = self._buckets.get(hub_id)
+        if bucket is None:
+            capacity = self._share(self.max_requests)
+            bucket = TokenBucket(
+                capacity, capacity / self.interval_seconds, clock=self._clock
+            )
+            self._buckets[hub_id] = bucket
+        return bucket
+
+    async def acquire(self, hub_id: Optional[str], priority: Priority) -> float:
+        """Wait for permission to send a request.
+
+        Args:
+            hub_id (Optional[str]): The hub ID the request is for.
+            priority (Priority): The request's priority.
+
+        Returns:
+            float: The seconds spent waiting.
+
+        Raises:
+            HubSpotOperationError: If a background request would eat into
+                the portal's reserved daily allowance.
+        """
+        if priority is Priority.BACKGROUND:
+            remaining = self._daily_remaining.get(hub_id)
+            if remaining is not None and remaining <= self.daily_reserve:
+                raise HubSpotOperationError(
+                    f"Daily HubSpot API allowance of hub {hub_id} is reserved "
+                    "for interactive requests"
+                )
+        started = self._clock()
+        await self.bucket(hub_id).acquire(priority)
+        waited = self._clock() - started
+        self._lanes[priority].record(waited)
+        return waited
+
+    def observe(self, hub_id: Optional[str], response: httpx.Response) -> None:
+        """Calibrate a portal's bucket from a response's headers.
+
+        Args:
+            hub_id (Optional[str]): The hub ID the request was for.
+            response (httpx.Response): The response.
+        """
+        max_requests = _header_number(response, MAX_HEADER)
+        interval_ms = _header_number(response, INTERVAL_HEADER)
+        if max_requests and interval_ms:
+            capacity = self._share(max_requests)
+            remaining = _header_number(response, REMAINING_HEADER)
+            self.bucket(hub_id).calibrate(
+                capacity,
+                capacity / (interval_ms / 1000),
+                None if remaining is None else remaining / self.processes,
+            )
+        daily_remaining = _header_number(response, DAILY_REMAINING_HEADER)
+        if daily_remaining is not None:
+            self._daily_remaining[hub_id] = daily_remaining
+
+    def throttle(
+        self, hub_id: Optional[str], response: httpx.Response, attempt: int
+    ) -> float:
+        """Pause a portal's requests after a 429 response.
+
+        The pause honours ``Retry-After`` when present and otherwise backs
+        off exponentially, with random jitter so paused requests do not all
+        resume at once.
+
+        Args:
+            hub_id (Optional[str]): The hub ID the request was for.
+            response (httpx.Response): The 429 response.
+            attempt (int): How many times the request has been retried.
+
+        Returns:
+            float: The length of the pause in seconds.
+        """
+        self.throttled += 1
+        delay = _header_number(response, "Retry-After")
+        if delay is None:
+            delay = self.backoff_seconds * 2**attempt
+        delay += random.uniform(0, delay * 0.5)
+        self.bucket(hub_id).pause(delay)
+        logger.warning("HubSpot throttled hub %s, pausing %.2fs", hub_id, delay)
+        return delay
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get counters of requests, limiter waits and 429 responses.
+
+        Returns:
+            Dict[str, Any]: The metrics of each priority lane and the number
+                of throttled responses.
+        """
+        return {
+            "lanes": {
+                priority.name.lower(): lane.to_dict()
+                for priority, lane in self._lanes.items()
+            },
+            "throttled": self.throttled,
+            "portals": len(self._buckets),
+        }
@@ -0,0 +1,164 @@
+"""Adaptive concurrency limits and circuit breakers per HubSpot endpoint family."""
+
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from src.domain.exceptions import HubSpotUnavailableError
+from src.domain.services.adaptive_concurrency import (
+    AdaptiveConcurrencyLimit,
+    ConcurrencyLimitExceeded,
+)
+from src.domain.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def endpoint_family(url: str) -> str:
+    """Get the endpoint family of a HubSpot URL.
+
+    CRM object endpoints are grouped by object type and other CRM endpoints
+    by API, e.g. ``crm/objects/contacts`` or ``crm/associations``; anything
+    else by its first path segment, e.g. ``oauth``.
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        str: The endpoint family.
+    """
+    parts = [part for part in httpx.URL(url).path.split("/") if part]
+    if len(parts) >= 3 and parts[0] == "crm":
+        return "/".join(["crm", *parts[2 : 4 if parts[2] == "objects" else 3]])
+    return parts[0] if parts else "/"
+
+
+class HubSpotUpstreamGuard:
+    """Shed HubSpot calls when an endpoint family slows down or fails.
+
+    Each endpoint family gets an adaptive concurrency limit, so slower
+    responses mean fewer calls in flight and excess calls are rejected
+    rather than queued without bound. Each family also gets a circuit
+    breaker that fails calls fast while the family keeps failing, and
+    half-opens with probe calls to detect recovery. 5xx responses and
+    transport errors count as failures; 429s are left to the rate limiter.
+    Rejected calls raise ``HubSpotUnavailableError``.
+    """
+
+    def __init__(
+        self,
+        new_limit: Callable[[], AdaptiveConcurrencyLimit] = AdaptiveConcurrencyLimit,
+        new_breaker: Callable[[], CircuitBreaker] = CircuitBreaker,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the guard.
+
+        Args:
+            new_limit (Callable[[], AdaptiveConcurrencyLimit]): Creates the
+                limit of a family.
+            new_breaker (Callable[[], CircuitBreaker]): Creates the breaker of
+                a family.
+            clock (Callable[[], float]): Monotonic clock used to time calls.
+        """
+        self._new_limit = new_limit
+        self._new_breaker = new_breaker
+        self._clock = clock
+        self._limits: Dict[str, AdaptiveConcurrencyLimit] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def limit(self, family: str) -> AdaptiveConcurrencyLimit:
+        """Get the concurrency limit of an endpoint family."""
+        if family not in self._limits:
+            self._limits[family] = self._new_limit()
+        return self._limits[family]
+
+    def breaker(self, family: str) -> CircuitBreaker:
+        """Get the circuit breaker of an endpoint family."""
+        if family not in self._breakers:
+            self._breakers[family] = self._new_breaker()
+        return self._breakers[family]
+
+    def check(self, url: str) -> None:
+        """Fail fast if the circuit of a URL's endpoint family is open.
+
+        Args:
+            url (str): The request URL.
+
+        Raises:
+            HubSpotUnavailableError: If the circuit is open.
+        """
+        family = endpoint_family(url)
+        retry_after = self.breaker(family).retry_after()
+        if retry_after > 0:
+            raise self._unavailable(family, retry_after)
+
+    async def send(
+        self, url: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a request within its endpoint family's limit and circuit.
+
+        Args:
+            url (str): The request URL.
+            send (Callable[[], Awaitable[httpx.Response]]): Sends the request.
+
+        Returns:
+            httpx.Response: The response.
+
+        Raises:
+            HubSpotUnavailableError: If the circuit is open or no slot frees up
+                in time.
+        """
+        family = endpoint_family(url)
+        breaker = self.breaker(family)
+        limit = self.limit(family)
+        try:
+            probe = breaker.allow()
+        except CircuitOpenError as e:
+            raise self._unavailable(family, e.retry_after) from e
+        try:
+            await limit.acquire()
+        except BaseException as e:
+            breaker.record(None, probe)
+            if isinstance(e, ConcurrencyLimitExceeded):
+                raise self._unavailable(family, 1.0) from e
+            raise
+
+        started = self._clock()
+        success: Optional[bool] = None
+        try:
+            response = await send()
+            success = response.status_code < 500
+            return response
+        except httpx.TransportError:
+            success = False
+            raise
+        finally:
+            latency = None if success is None else self._clock() - started
+            limit.release(latency, dropped=success is False)
+            breaker.record(success, probe)
+
+    @staticmethod
+    def _unavailable(family: str, retry_after: float) -> HubSpotUnavailableError:
+        """Create the error raised for a shed call."""
+        return HubSpotUnavailableError(
+            f"HubSpot {family} is unavailable, retry in {math.ceil(retry_after)}s",
+            retry_after=retry_after,
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get the limit, load and circuit state of each endpoint family.
+
+        Returns:
+            Dict[str, Any]: Metrics keyed by endpoint family.
+        """
+        return {
+            family: {
+                "limit": int(self.limit(family).limit),
+                "in_flight": self.limit(family).in_flight,
+                "queued": self.limit(family).queued,
+                "rejected": self.limit(family).rejected,
+                "circuit": self.breaker(family).state.value,
+                "circuit_rejected": self.breaker(family).rejected,
+            }
+            for family in sorted(set(self._limits) | set(self._breakers))
+        }
@@ -0,0 +1,580 @@
+import asyncio
+import functools
+from collections import defaultdict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from hubspot import HubSpot
+from hubspot.crm.associations.v4.models import (
+    AssociationSpec,
+    BatchInputPublicAssociationMultiArchive,
+    BatchInputPublicAssociationMultiPost,
+    BatchInputPublicFetchAssociationsBatchRequest,
+    PublicAssociationMultiArchive,
+    PublicAssociationMultiPost,
+    PublicObjectId,
+)
+from hubspot.crm.companies.models import BatchReadInputSimplePublicObjectId
+
+from src.domain.exceptions import HubSpotOperationError
+from src.domain.interfaces.hubspot import IHubSpotCompanyService
+from src.domain.types.hubspot import AssociationResult, Company
+from src.infrastructure.hubspot.company_service import (
+    ASSOCIATIONS_BATCH_SIZE,
+    ASSOCIATIONS_PAGE_SIZE,
+    COMPANIES_BATCH_SIZE,
+    COMPANY_FIELD_PROPERTIES,
+    COMPANY_MODIFIED_PROPERTY,
+    CONTACT_TO_COMPANY_ASSOCIATION_TYPE_ID,
+    AssociationPair,
+    chunked,
+    company_from_properties,
+    map_companies_to_contacts,
+    run_association_batches,
+)
+from src.infrastructure.hubspot.properties import resolve_properties
+from src.infrastructure.hubspot.search import iter_modified
+
+
+class HubSpotSdkCompanyService(IHubSpotCompanyService):
+    """HubSpot company operations backed by the synchronous ``hubspot`` SDK.
+
+    SDK calls block, so each one runs on a dedicated thread pool to keep the
+    event loop free. Prefer ``HubSpotCompanyService``; this implementation is
+    kept as a fallback selected with ``HUBSPOT_COMPANY_BACKEND=sdk``.
+    """
+
+    def __init__(self, max_workers: int = 8, batch_concurrency: int = 4):
+        """Initialize the service with its thread pool.
+
+        Args:
+            max_workers (int): Maximum number of concurrent SDK calls.
+            batch_concurrency (int): Maximum number of association batch
+                requests in flight per operation.
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hubspot-sdk"
+        )
+        self.batch_concurrency = batch_concurrency
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking SDK call on the thread pool.
+
+        Args:
+            func (Callable[..., Any]): The blocking callable.
+
+        Returns:
+            Any: The callable's result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        """Shut down the thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def get_companies_associated_with_contact(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        after: Optional[str] = None,
+    ) -> List[Company]:
+        """Get companies associated with a contact.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+            after (Optional[str]): The associations cursor to start after.
+        """
+        companies, _ = await self.get_companies_page(
+            access_token, contact_id, limit=limit, after=after, fields=fields
+        )
+        return companies
+
+    async def get_companies_page(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Company], Optional[str]]:
+        """Get companies associated with a contact and the cursor after them.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            after (Optional[str]): The associations cursor to start after.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Returns:
+            Tuple[List[Company], Optional[str]]: The companies, and the cursor
+                of the next page if there are more.
+        """
+        api_client = HubSpot(access_token=access_token)
+        properties = resolve_properties(fields, COMPANY_FIELD_PROPERTIES)
+        reads: List["asyncio.Future[List[Company]]"] = []
+        try:
+            async for company_ids, after in self._iter_association_pages(
+                api_client, contact_id, limit=limit, after=after
+            ):
+                # Read this page's companies while the next page is fetched
+                reads.extend(
+                    asyncio.ensure_future(
+                        self._read_company_chunk(
+                            api_client, chunk, properties, fields
+                        )
+                    )
+                    for chunk in chunked(company_ids, COMPANIES_BATCH_SIZE)
+                )
+            chunks = await asyncio.gather(*reads)
+        except Exception as e:
+            for read in reads:
+                read.cancel()
+            await asyncio.gather(*reads, return_exceptions=True)
+            raise HubSpotOperationError(f"Failed to get companies: {str(e)}")
+        return [company for chunk in chunks for company in chunk], after
+
+    async def _iter_association_pages(
+        self,
+        api_client: HubSpot,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[List[str], Optional[str]]]:
+        """Iterate over the pages of a contact's associated company IDs.
+
+        Args:
+            api_client (HubSpot): The SDK client.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of IDs to read, or None
+                for every ID.
+            after (Optional[str]): The associations cursor to start after.
+
+        Yields:
+            Tuple[List[str], Optional[str]]: The company IDs of each page, and
+                the cursor of the next page if there are more.
+        """
+        while True:
+            page_size = ASSOCIATIONS_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit)
+            # Get associated companies using the v4 associations API
+            associations = await self._run(
+                api_client.crm.associations.v4.basic_api.get_page,
+                object_type="contacts",
+                object_id=contact_id,
+                to_object_type="companies",
+                limit=page_size,
+                **({"after": after} if after else {}),
+            )
+            company_ids = [
+                str(assoc.to_object_id) for assoc in associations.results or []
+            ]
+            paging = associations.paging
+            after = paging.next.after if paging and paging.next else None
+            yield company_ids, after
+
+            if limit is not None:
+                limit -= len(company_ids)
+            if not after or not company_ids or limit == 0:
+                return
+
+    async def _read_company_chunk(
+        self,
+        api_client: HubSpot,
+        company_ids: Sequence[str],
+        properties: List[str],
+        fields: Optional[List[str]],
+    ) -> List[Company]:
+        """Read up to a batch of companies by ID.
+
+        Args:
+            api_client (HubSpot): The SDK client.
+            company_ids (Sequence[str]): The IDs of the companies.
+            properties (List[str]): The HubSpot properties to read.
+            fields (Optional[List[str]]): The requested fields.
+
+        Returns:
+            List[Company]: The companies that were found.
+        """
+        batch_input = BatchReadInputSimplePublicObjectId(
+            properties=properties,
+            inputs=[{"id": company_id} for company_id in company_ids],
+        )
+        response = await self._run(
+            api_client.crm.companies.batch_api.read,
+            batch_read_input_simple_public_object_id=batch_input,
+        )
+        return [
+            company_from_properties(company.id, company.properties, fields)
+            for company in response.results
+        ]
+
+    async def get_companies_for_contacts(
+        self,
+        access_token: str,
+        contact_ids: List[str],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, List[Company]]:
+        """Get the companies associated with each of several contacts.
+
+        Args:
+            access_token (str): The access token.
+            contact_ids (List[str]): The IDs of the contacts.
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Returns:
+            Dict[str, List[Company]]: The companies of each contact.
+        """
+        try:
+            api_client = HubSpot(access_token=access_token)
+            contact_ids = list(dict.fromkeys(contact_ids))
+
+            async def read_associations(chunk: Sequence[str]) -> Any:
+                batch_input = BatchInputPublicFetchAssociationsBatchRequest(
+                    inputs=[{"id": contact_id} for contact_id in chunk]
+                )
+                return await self._run(
+                    api_client.crm.associations.v4.batch_api.get_page,
+                    from_object_type="contacts",
+                    to_object_type="companies",
+                    batch_input_public_fetch_associations_batch_request=batch_input,
+                )
+
+            responses = await asyncio.gather(
+                *(
+                    read_associations(chunk)
+                    for chunk in chunked(contact_ids, ASSOCIATIONS_BATCH_SIZE)
+                )
+            )
+            company_ids_by_contact: Dict[str, List[str]] = {}
+            cursors: Dict[str, str] = {}
+            for response in responses:
+                for result in response.results:
+                    contact_id = str(result._from.id)
+                    company_ids_by_contact[contact_id] = [
+                        str(assoc.to_object_id) for assoc in result.to
+                    ]
+                    paging = result.paging
+                    if paging and paging.next and paging.next.after:
+                        cursors[contact_id] = paging.next.after
+
+            # A batch result holds one page; read the rest of longer lists
+            async def read_rest(contact_id: str, after: str) -> List[str]:
+                return [
+                    company_id
+                    async for company_ids, _ in self._iter_association_pages(
+                        api_client, contact_id, after=after
+                    )
+                    for company_id in company_ids
+                ]
+
+            rests = await asyncio.gather(
+                *(read_rest(contact_id, after) for contact_id, after in cursors.items())
+            )
+            for contact_id, rest in zip(cursors, rests):
+                company_ids_by_contact[contact_id].extend(rest)
+
+            properties = resolve_properties(fields, COMPANY_FIELD_PROPERTIES)
+            company_ids = list(
+                dict.fromkeys(
+                    company_id
+                    for ids in company_ids_by_contact.values()
+                    for company_id in ids
+                )
+            )
+            chunks = await asyncio.gather(
+                *(
+                    self._read_company_chunk(api_client, chunk, properties, fields)
+                    for chunk in chunked(company_ids, COMPANIES_BATCH_SIZE)
+                )
+            )
+            companies = [company for chunk in chunks for company in chunk]
+            return map_companies_to_contacts(
+                contact_ids, company_ids_by_contact, companies
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to get companies: {str(e)}")
+
+    async def iter_companies(
+        self,
+        access_token: str,
+        page_size: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over every company, one page at a time, in ID order.
+
+        Args:
+            access_token (str): The access token.
+            page_size (int): The number of companies per page (at most 100).
+            fields (Optional[List[str]]): The fields to fetch, or None for
+                every company field.
+
+        Yields:
+            List[Company]: The companies of each page.
+        """
+        api_client = HubSpot(access_token=access_token)
+        properties = resolve_properties(fields, COMPANY_FIELD_PROPERTIES)
+        after: Optional[str] = None
+        while True:
+            try:
+                response = await self._run(
+                    api_client.crm.companies.basic_api.get_page,
+                    limit=page_size,
+                    properties=properties,
+                    **({"after": after} if after else {}),
+                )
+            except Exception as e:
+                raise HubSpotOperationError(f"Failed to list companies: {str(e)}")
+            yield [
+                company_from_properties(
+                    company.id, company.properties or {}, fields, False
+                )
+                for company in response.results
+            ]
+            paging = response.paging
+            after = paging.next.after if paging and paging.next else None
+            if not after:
+                return
+
+    async def iter_modified_companies(
+        self,
+        access_token: str,
+        since: datetime,
+        page_size: int = 100,
+    ) -> AsyncIterator[List[Company]]:
+        """Iterate over companies modified at or after a time, oldest first.
+
+        Each company carries its ``hs_lastmodifieddate`` in ``properties``.
+
+        Args:
+            access_token (str): The access token.
+            since (datetime): The earliest modification to return.
+            page_size (int): The number of companies per page (at most 200).
+
+        Yields:
+            List[Company]: The companies of each page.
+        """
+        api_client = HubSpot(access_token=access_token)
+        fields = [*COMPANY_FIELD_PROPERTIES, COMPANY_MODIFIED_PROPERTY]
+
+        async def search(body: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                response = await self._run(
+                    api_client.crm.companies.search_api.do_search,
+                    public_object_search_request=body,
+                )
+            except Exception as e:
+                raise HubSpotOperationError(f"Failed to search companies: {str(e)}")
+            return response.to_dict()
+
+        async for results in iter_modified(
+            search,
+            COMPANY_MODIFIED_PROPERTY,
+            since,
+            resolve_properties(fields, COMPANY_FIELD_PROPERTIES),
+            page_size,
+        ):
+            yield [
+                company_from_properties(
+                    result["id"], result.get("properties") or {}, fields, False
+                )
+                for result in results
+            ]
+
+    async def create_association(
+        self,
+        access_token: str,
+        contact_id: str,
+        company_id: str,
+    ) -> None:
+        """Create association between contact and company.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            company_id (str): The ID of the company.
+        """
+        try:
+            api_client = HubSpot(access_token=access_token)
+            await self._run(
+                api_client.crm.associations.v4.basic_api.create,
+                object_type="contacts",
+                object_id=contact_id,
+                to_object_type="companies",
+                to_object_id=company_id,
+                association_spec=[
+                    AssociationSpec(
+                        association_category="HUBSPOT_DEFINED",
+                        association_type_id=CONTACT_TO_COMPANY_ASSOCIATION_TYPE_ID,
+                    )
+                ],
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to create association: {str(e)}")
+
+    async def remove_association(
+        self,
+        access_token: str,
+        contact_id: str,
+        company_id: str,
+    ) -> None:
+        """Remove association between contact and company.
+
+        Args:
+            access_token (str): The access token.
+            contact_id (str): The ID of the contact.
+            company_id (str): The ID of the company.
+        """
+        try:
+            api_client = HubSpot(access_token=access_token)
+            await self._run(
+                api_client.crm.associations.v4.basic_api.archive,
+                object_type="contacts",
+                object_id=contact_id,
+                to_object_type="companies",
+                to_object_id=company_id,
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to remove association: {str(e)}")
+
+    async def create_associations(
+        self,
+        access_token: str,
+        pairs: List[AssociationPair],
+    ) -> List[AssociationResult]:
+        """Create associations between many contacts and companies.
+
+        Args:
+            access_token (str): The access token.
+            pairs (List[AssociationPair]): The (contact ID, company ID) pairs.
+
+        Returns:
+            List[AssociationResult]: The outcome of each distinct pair.
+        """
+        api_client = HubSpot(access_token=access_token)
+        spec = AssociationSpec(
+            association_category="HUBSPOT_DEFINED",
+            association_type_id=CONTACT_TO_COMPANY_ASSOCIATION_TYPE_ID,
+        )
+
+        async def create_chunk(
+            chunk: Sequence[AssociationPair],
+        ) -> List[AssociationResult]:
+            batch_input = BatchInputPublicAssociationMultiPost(
+                inputs=[
+                    PublicAssociationMultiPost(
+                        _from=PublicObjectId(id=contact_id),
+                        to=PublicObjectId(id=company_id),
+                        types=[spec],
+                    )
+                    for contact_id, company_id in chunk
+                ]
+            )
+            try:
+                response = await self._run(
+                    api_client.crm.associations.v4.batch_api.create,
+                    from_object_type="contacts",
+                    to_object_type="companies",
+                    batch_input_public_association_multi_post=batch_input,
+                )
+            except Exception as e:
+                raise HubSpotOperationError(
+                    f"Failed to create associations: {str(e)}"
+                )
+            created = {
+                (str(result.from_object_id), str(result.to_object_id))
+                for result in response.results or []
+            }
+            error = "; ".join(
+                error.message for error in getattr(response, "errors", None) or []
+            )
+            return [
+                AssociationResult(
+                    contact_id,
+                    company_id,
+                    (contact_id, company_id) in created,
+                    None
+                    if (contact_id, company_id) in created
+                    else error or "Association was not created",
+                )
+                for contact_id, company_id in chunk
+            ]
+
+        return await run_association_batches(
+            pairs, create_chunk, self.batch_concurrency
+        )
+
+    async def remove_associations(
+        self,
+        access_token: str,
+        pairs: List[AssociationPair],
+    ) -> List[AssociationResult]:
+        """Remove associations between many contacts and companies.
+
+        Args:
+            access_token (str): The access token.
+            pairs (List[AssociationPair]): The (contact ID, company ID) pairs.
+
+        Returns:
+            List[AssociationResult]: The outcome of each distinct pair.
+        """
+        api_client = HubSpot(access_token=access_token)
+
+        async def archive_chunk(
+            chunk: Sequence[AssociationPair],
+        ) -> List[AssociationResult]:
+            company_ids_by_contact: Dict[str, List[str]] = defaultdict(list)
+            for contact_id, company_id in chunk:
+                company_ids_by_contact[contact_id].append(company_id)
+            batch_input = BatchInputPublicAssociationMultiArchive(
+                inputs=[
+                    PublicAssociationMultiArchive(
+                        _from=PublicObjectId(id=contact_id),
+                        to=[PublicObjectId(id=company_id) for company_id in ids],
+                    )
+                    for contact_id, ids in company_ids_by_contact.items()
+                ]
+            )
+            try:
+                await self._run(
+                    api_client.crm.associations.v4.batch_api.archive,
+                    from_object_type="contacts",
+                    to_object_type="companies",
+                    batch_input_public_association_multi_archive=batch_input,
+                )
+            except Exception as e:
+                raise HubSpotOperationError(
+                    f"Failed to remove associations: {str(e)}"
+                )
+            return [
+                AssociationResult(contact_id, company_id, True)
+                for contact_id, company_id in chunk
+            ]
+
+        return await run_association_batches(
+            pairs, archive_chunk, self.batch_concurrency
+        )
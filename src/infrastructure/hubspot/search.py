@@ -0,0 +1,93 @@
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+# HubSpot's search API returns at most this many results per query
+SEARCH_RESULT_CAP = 10000
+
+SearchRequest = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def parse_hubspot_datetime(value: str) -> datetime:
+    """Parse a HubSpot timestamp such as ``2024-05-01T10:00:00.123Z``.
+
+    Args:
+        value (str): The ISO 8601 timestamp.
+
+    Returns:
+        datetime: The timezone-aware timestamp.
+    """
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def to_epoch_millis(value: datetime) -> int:
+    """Convert a datetime to epoch milliseconds, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+async def iter_modified(
+    search: SearchRequest,
+    modified_property: str,
+    since: datetime,
+    properties: List[str],
+    page_size: int = 100,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Iterate over objects modified at or after a time, oldest change first.
+
+    A search returns at most ``SEARCH_RESULT_CAP`` results, so when the cap
+    is reached the search restarts from the last modification seen.
+
+    Args:
+        search (SearchRequest): Sends a search request body and returns the
+            response body.
+        modified_property (str): The last-modified property of the object type.
+        since (datetime): The earliest modification to return.
+        properties (List[str]): The properties to return.
+        page_size (int): The number of results per page (at most 200).
+
+    Yields:
+        List[Dict[str, Any]]: The raw results of each page.
+    """
+    since_millis = to_epoch_millis(since)
+    after: Optional[str] = None
+    while True:
+        body: Dict[str, Any] = {
+            "filterGroups": [
+                {
+                    "filters": [
+                        {
+                            "propertyName": modified_property,
+                            "operator": "GTE",
+                            "value": str(since_millis),
+                        }
+                    ]
+                }
+            ],
+            "sorts": [{"propertyName": modified_property, "direction": "ASCENDING"}],
+            "properties": properties,
+            "limit": page_size,
+        }
+        if after:
+            body["after"] = after
+        data = await search(body)
+        results = data.get("results", [])
+        if results:
+            yield results
+
+        after = (data.get("paging") or {}).get("next", {}).get("after")
+        if not after or not results:
+            return
+        if int(after) + page_size > SEARCH_RESULT_CAP:
+            last_modified = results[-1].get("properties", {}).get(modified_property)
+            if not last_modified:
+                return
+            restart_millis = to_epoch_millis(parse_hubspot_datetime(last_modified))
+            # More results than the cap share one timestamp; nothing to gain
+            if restart_millis <= since_millis:
+                return
+            since_millis = restart_millis
+            after = None
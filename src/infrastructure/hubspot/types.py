@@ -1,5 +1,6 @@
+from typing import Any
+
 from pydantic import BaseModel
-from hubspot.crm.companies.models import BatchReadInputSimplePublicObjectId
 
 
 class Contact(BaseModel):
@@ -11,5 +12,11 @@ class Contact(BaseModel):
     phone: str
 
 
-# Type alias for HubSpot company batch input
-CompanyBatchInput = BatchReadInputSimplePublicObjectId
+def __getattr__(name: str) -> Any:
+    """Import the ``hubspot`` SDK only when its types are first used."""
+    if name == "CompanyBatchInput":
+        from hubspot.crm.companies.models import BatchReadInputSimplePublicObjectId
+
+        # Type alias for HubSpot company batch input
+        return BatchReadInputSimplePublicObjectId
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,223 @@
+"""In-memory caching repository decorator."""
+
+import contextlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from src.domain.interfaces.repository import IHubSpotOAuthRepository
+from src.domain.types.hubspot import HubSpotOAuthData
+
+
+@dataclass
+class _CacheEntry:
+    """Cached OAuth data with the state used to revalidate it."""
+
+    data: HubSpotOAuthData
+    modified_time: Optional[int]
+    checked_at: float
+
+
+class CachedHubSpotOAuthRepository(IHubSpotOAuthRepository):
+    """Keep parsed HubSpot OAuth data in memory in front of another repository.
+
+    Reads are served from memory. Writes go through to the wrapped repository
+    and update the cache. If the wrapped repository exposes
+    ``get_modified_time(hub_id)`` (as the file repository does), cached entries
+    are revalidated against it at most every ``revalidate_seconds`` so edits
+    made by other processes are picked up; otherwise they are reloaded at that
+    interval. Unknown hub IDs are remembered for
+    ``negative_ttl_seconds`` in a bounded negative cache. Taking a hub ID's
+    ``lock`` drops its cached entry, so reads under the lock see writes
+    made by other processes.
+    """
+
+    def __init__(
+        self,
+        repository: IHubSpotOAuthRepository,
+        revalidate_seconds: float = 5.0,
+        negative_ttl_seconds: float = 10.0,
+        negative_max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            repository (IHubSpotOAuthRepository): The repository to cache.
+            revalidate_seconds (float): How long a cached entry is trusted
+                before its modification time is checked again.
+            negative_ttl_seconds (float): How long an unknown hub ID is
+                remembered as missing.
+            negative_max_entries (int): Maximum number of unknown hub IDs kept.
+            clock (Callable[[], float]): Monotonic clock, mainly for tests.
+        """
+        self.repository = repository
+        self.revalidate_seconds = revalidate_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.negative_max_entries = negative_max_entries
+        self._clock = clock
+        self._get_modified_time: Callable[[str], Optional[int]] = getattr(
+            repository, "get_modified_time", lambda hub_id: None
+        )
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._missing: "OrderedDict[str, float]" = OrderedDict()
+
+    def _store(self, data: HubSpotOAuthData, modified_time: Optional[int]) -> None:
+        """Store OAuth data in the cache."""
+        self._entries[data.hub_id] = _CacheEntry(data, modified_time, self._clock())
+        self._missing.pop(data.hub_id, None)
+
+    def _remember_missing(self, hub_id: str) -> None:
+        """Remember that a hub ID has no OAuth data."""
+        self._entries.pop(hub_id, None)
+        self._missing.pop(hub_id, None)
+        self._missing[hub_id] = self._clock() + self.negative_ttl_seconds
+        while len(self._missing) > self.negative_max_entries:
+            self._missing.popitem(last=False)
+
+    def invalidate(self, hub_id: Optional[str] = None) -> None:
+        """Drop cached state for a hub ID, or for every hub ID.
+
+        Args:
+            hub_id (Optional[str]): The hub ID to drop, or None to clear all.
+        """
+        if hub_id is None:
+            self._entries.clear()
+            self._missing.clear()
+        else:
+            self._entries.pop(hub_id, None)
+            self._missing.pop(hub_id, None)
+
+    @contextlib.asynccontextmanager
+    async def lock(self, hub_id: str) -> AsyncIterator[None]:
+        """Hold the wrapped repository's lock of a hub ID, if it has one.
+
+        Args:
+            hub_id (str): The hub ID to lock.
+        """
+        lock = getattr(self.repository, "lock", None)
+        async with lock(hub_id) if lock is not None else contextlib.nullcontext():
+            self.invalidate(hub_id)
+            yield
+
+    def close(self) -> None:
+        """Close the wrapped repository, if it can be closed."""
+        close = getattr(self.repository, "close", None)
+        if close is not None:
+            close()
+
+    async def preload(self) -> int:
+        """Load every installation into the cache.
+
+        Returns:
+            int: The number of installations loaded.
+        """
+        installations = await self.list_all()
+        return len(installations)
+
+    async def save(self, data: HubSpotOAuthData) -> None:
+        """Save HubSpot OAuth data and cache it.
+
+        Args:
+            data (HubSpotOAuthData): The HubSpot OAuth data to save.
+        """
+        await self.repository.save(data)
+        self._store(data, self._get_modified_time(data.hub_id))
+
+    async def get_by_hub_id(self, hub_id: str) -> Optional[HubSpotOAuthData]:
+        """Get HubSpot OAuth data by hub ID, from memory when possible.
+
+        Args:
+            hub_id (str): The hub ID of the OAuth data to get.
+
+        Returns:
+            Optional[HubSpotOAuthData]: The HubSpot OAuth data.
+        """
+        now = self._clock()
+        entry = self._entries.get(hub_id)
+        if entry is not None:
+            if now - entry.checked_at < self.revalidate_seconds:
+                return entry.data
+            modified_time = self._get_modified_time(hub_id)
+            if modified_time is not None and modified_time == entry.modified_time:
+                entry.checked_at = now
+                return entry.data
+        else:
+            expires_at = self._missing.get(hub_id)
+            if expires_at is not None:
+                if now < expires_at:
+                    return None
+                del self._missing[hub_id]
+            modified_time = self._get_modified_time(hub_id)
+
+        # Read the modification time before loading so a concurrent write is
+        # detected on the next revalidation rather than masked.
+        data = await self.repository.get_by_hub_id(hub_id)
+        if data is None:
+            self._remember_missing(hub_id)
+        else:
+            self._store(data, modified_time)
+        return data
+
+    async def update(self, data: HubSpotOAuthData) -> None:
+        """Update existing HubSpot OAuth data and cache it.
+
+        Args:
+            data (HubSpotOAuthData): The HubSpot OAuth data to update.
+        """
+        try:
+            await self.repository.update(data)
+        except Exception:
+            self.invalidate(data.hub_id)
+            raise
+        self._store(data, self._get_modified_time(data.hub_id))
+
+    async def delete(self, hub_id: str) -> None:
+        """Delete HubSpot OAuth data and remember the hub ID as missing.
+
+        Args:
+            hub_id (str): The hub ID of the OAuth data to delete.
+        """
+        try:
+            await self.repository.delete(hub_id)
+        except Exception:
+            self.invalidate(hub_id)
+            raise
+        self._remember_missing(hub_id)
+
+    async def list_all(self) -> List[HubSpotOAuthData]:
+        """List every installation and refresh the cache with them.
+
+        Returns:
+            List[HubSpotOAuthData]: The HubSpot OAuth data of all installations.
+        """
+        installations = await self.repository.list_all()
+        for data in installations:
+            self._store(data, self._get_modified_time(data.hub_id))
+        return installations
+
+    async def list_expiring(self, before: datetime) -> List[HubSpotOAuthData]:
+        """List installations expiring at or before a time and cache them.
+
+        Uses the wrapped repository's ``list_expiring`` when it has one.
+
+        Args:
+            before (datetime): The expiry cutoff.
+
+        Returns:
+            List[HubSpotOAuthData]: The matching installations.
+        """
+        list_expiring = getattr(self.repository, "list_expiring", None)
+        if list_expiring is not None:
+            installations = await list_expiring(before)
+        else:
+            installations = [
+                data
+                for data in await self.repository.list_all()
+                if data.expires_at <= before
+            ]
+        for data in installations:
+            self._store(data, self._get_modified_time(data.hub_id))
+        return installations
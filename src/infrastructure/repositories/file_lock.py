@@ -0,0 +1,54 @@
+"""Advisory file locks shared by worker processes."""
+
+import asyncio
+import contextlib
+import os
+from typing import AsyncIterator
+
+from src.domain.exceptions import HubSpotOperationError
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows, where locks are skipped
+    fcntl = None
+
+# How often a waiting refresh retries taking the lock of a hub ID
+LOCK_POLL_SECONDS = 0.05
+
+
+@contextlib.asynccontextmanager
+async def hold_refresh_lock(
+    fd: int, hub_id: str, timeout_seconds: float
+) -> AsyncIterator[None]:
+    """Hold the refresh lock of a hub ID on an open lock file, then close it.
+
+    Waiting polls the lock instead of blocking a thread, since another
+    process may hold it for the length of a call to HubSpot.
+
+    Args:
+        fd (int): The open lock file, closed on exit.
+        hub_id (str): The hub ID the lock belongs to.
+        timeout_seconds (float): How long to wait for the lock.
+
+    Raises:
+        HubSpotOperationError: If the lock is not free within
+            ``timeout_seconds``.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        while fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if loop.time() >= deadline:
+                    raise HubSpotOperationError(
+                        f"Timed out waiting for the token refresh of hub "
+                        f"ID {hub_id} in another process"
+                    )
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+        yield
+    finally:
+        # Closing the file releases the lock
+        os.close(fd)
@@ -1,24 +1,89 @@
 """File-based repository implementation."""
 
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import hashlib
 import json
 import os
-from typing import Optional
+import tempfile
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from src.domain.interfaces.repository import IHubSpotOAuthRepository
 from src.domain.types.hubspot import HubSpotOAuthData
-from src.domain.exceptions import HubSpotOperationError
+from src.domain.exceptions import HubSpotOperationError, StaleOAuthDataError
+from src.infrastructure.repositories.file_lock import fcntl, hold_refresh_lock
+
+FILE_PREFIX = "hubspot_auth_"
+FILE_SUFFIX = ".json"
+LOCK_SUFFIX = ".lock"
 
 
 class FileHubSpotOAuthRepository(IHubSpotOAuthRepository):
-    """File-based implementation of HubSpot OAuth repository."""
+    """File-based implementation of HubSpot OAuth repository.
+
+    Each installation is stored as one JSON file in a subdirectory named after
+    a hash of its hub ID, so no single directory grows too large. All file I/O
+    runs on a dedicated thread pool, and writes go to a temporary file that
+    atomically replaces the previous version, so readers never see a partially
+    written file. Files written by earlier versions directly in
+    ``storage_dir`` are still read and are moved on their next write.
+
+    Several worker processes can share the directory. Each write takes an
+    advisory ``fcntl`` lock of its hub ID and checks the stored version:
+    an update whose version is not newer is rejected with
+    ``StaleOAuthDataError``. Token refreshes hold a second, longer lock of
+    the hub ID, taken with ``lock``, so only one process at a time
+    exchanges a refresh token. Lock files are kept next to the data files.
+
+    Listing all installations keeps each parsed file in memory with its
+    modification time and inode, and only parses files that changed since
+    the previous listing.
+    """
 
-    def __init__(self, storage_dir: str = ".data/auth"):
+    def __init__(
+        self,
+        storage_dir: str = ".data/auth",
+        fsync: bool = False,
+        shard_depth: int = 1,
+        max_workers: int = 4,
+        executor: Optional[Executor] = None,
+        lock_timeout_seconds: float = 30.0,
+    ):
         """Initialize repository with storage directory.
 
         Args:
             storage_dir (str): The directory to store the OAuth data.
+            fsync (bool): Flush writes to disk before replacing the old file.
+            shard_depth (int): Number of hashed subdirectory levels.
+            max_workers (int): Size of the file I/O thread pool.
+            executor (Optional[Executor]): Executor to run file I/O on instead
+                of a dedicated thread pool.
+            lock_timeout_seconds (float): How long ``lock`` waits for another
+                process's refresh of the same hub ID.
         """
         self.storage_dir = storage_dir
+        self.fsync = fsync
+        self.shard_depth = shard_depth
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self._owns_executor = executor is None
+        # Parsed data files by path, with the (mtime, inode) they were read at
+        self._parsed: Dict[str, Tuple[Tuple[int, int], HubSpotOAuthData]] = {}
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="oauth-file-io"
+        )
         self._ensure_storage_dir()
 
     def _ensure_storage_dir(self) -> None:
@@ -29,6 +94,13 @@ class FileHubSpotOAuthRepository(IHubSpotOAuthRepository):
         """
         os.makedirs(self.storage_dir, exist_ok=True)
 
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking file I/O on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args)
+        )
+
     def _get_file_path(self, hub_id: str) -> str:
         """Get file path for a hub ID.
 
@@ -38,18 +110,211 @@ class FileHubSpotOAuthRepository(IHubSpotOAuthRepository):
         Returns:
             str: The file path.
         """
-        return os.path.join(self.storage_dir, f"hubspot_auth_{hub_id}.json")
+        digest = hashlib.sha1(hub_id.encode()).hexdigest()
+        shards = [digest[2 * i : 2 * i + 2] for i in range(self.shard_depth)]
+        return os.path.join(
+            self.storage_dir, *shards, f"{FILE_PREFIX}{hub_id}{FILE_SUFFIX}"
+        )
+
+    def _get_legacy_file_path(self, hub_id: str) -> str:
+        """Get the unsharded file path used by earlier versions."""
+        return os.path.join(self.storage_dir, f"{FILE_PREFIX}{hub_id}{FILE_SUFFIX}")
+
+    def _get_lock_path(self, hub_id: str, name: str) -> str:
+        """Get the path of a lock file of a hub ID."""
+        return os.path.join(
+            os.path.dirname(self._get_file_path(hub_id)),
+            f".{FILE_PREFIX}{hub_id}.{name}{LOCK_SUFFIX}",
+        )
+
+    def _open_lock(self, hub_id: str, name: str) -> int:
+        """Open a lock file of a hub ID, creating it if needed."""
+        lock_path = self._get_lock_path(hub_id, name)
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        return os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    @contextlib.contextmanager
+    def _write_lock(self, hub_id: str) -> Iterator[None]:
+        """Hold the lock of a hub ID's data file while it is written."""
+        fd = self._open_lock(hub_id, "write")
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the file releases the lock
+            os.close(fd)
+
+    @contextlib.asynccontextmanager
+    async def lock(self, hub_id: str) -> AsyncIterator[None]:
+        """Hold the refresh lock of a hub ID, shared by all processes.
+
+        Waiting polls the lock instead of blocking a thread, since another
+        process may hold it for the length of a call to HubSpot.
+
+        Args:
+            hub_id (str): The hub ID to lock.
+
+        Raises:
+            HubSpotOperationError: If the lock is not free within
+                ``lock_timeout_seconds``.
+        """
+        fd = await self._run(self._open_lock, hub_id, "refresh")
+        async with hold_refresh_lock(fd, hub_id, self.lock_timeout_seconds):
+            yield
+
+    def get_modified_time(self, hub_id: str) -> Optional[int]:
+        """Get the last modification time of the OAuth data for a hub ID.
+
+        Args:
+            hub_id (str): The hub ID of the OAuth data.
+
+        Returns:
+            Optional[int]: The modification time in nanoseconds, or None if
+                there is no file.
+        """
+        for file_path in (
+            self._get_file_path(hub_id),
+            self._get_legacy_file_path(hub_id),
+        ):
+            try:
+                return os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return None
+
+    @staticmethod
+    def _load(file_path: str) -> HubSpotOAuthData:
+        """Read and parse one OAuth data file."""
+        with open(file_path, "rb") as f:
+            return HubSpotOAuthData.from_dict(json.loads(f.read()))
+
+    def _read(self, hub_id: str) -> Optional[HubSpotOAuthData]:
+        """Read the OAuth data for a hub ID, if any."""
+        for file_path in (
+            self._get_file_path(hub_id),
+            self._get_legacy_file_path(hub_id),
+        ):
+            try:
+                return self._load(file_path)
+            except FileNotFoundError:
+                continue
+        return None
+
+    def _write(self, data: HubSpotOAuthData, must_exist: bool = False) -> None:
+        """Write the OAuth data for a hub ID, checking the stored version.
+
+        An update must carry a newer version than the stored data, while
+        saved data always replaces it, with a version above it.
+
+        Raises:
+            StaleOAuthDataError: If an update is not newer than the stored
+                data.
+        """
+        with self._write_lock(data.hub_id):
+            stored = self._read(data.hub_id)
+            if must_exist and stored is None:
+                raise HubSpotOperationError(
+                    f"No OAuth data found for hub ID: {data.hub_id}"
+                )
+            if stored is not None and data.version <= stored.version:
+                if must_exist:
+                    raise StaleOAuthDataError(
+                        f"Stored OAuth data of hub ID {data.hub_id} is at "
+                        f"version {stored.version}, not older than "
+                        f"{data.version}"
+                    )
+                data = dataclasses.replace(data, version=stored.version + 1)
+            self._replace(data)
+
+    def _replace(self, data: HubSpotOAuthData) -> None:
+        """Atomically replace the OAuth data file of a hub ID."""
+        file_path = self._get_file_path(data.hub_id)
+        legacy_path = self._get_legacy_file_path(data.hub_id)
+        directory = os.path.dirname(file_path)
+        os.makedirs(directory, exist_ok=True)
+        content = json.dumps(data.to_dict(), separators=(",", ":")).encode()
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{FILE_PREFIX}", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        if self.fsync:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        if legacy_path != file_path:
+            try:
+                os.remove(legacy_path)
+            except FileNotFoundError:
+                pass
+
+    def _remove(self, hub_id: str) -> None:
+        """Remove the OAuth data files for a hub ID."""
+        with self._write_lock(hub_id):
+            for file_path in (
+                self._get_file_path(hub_id),
+                self._get_legacy_file_path(hub_id),
+            ):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+
+    def _read_all(self) -> List[HubSpotOAuthData]:
+        """Read every OAuth data file under the storage directory.
+
+        Files unchanged since the previous call are not parsed again.
+        """
+        installations: Dict[str, HubSpotOAuthData] = {}
+        parsed: Dict[str, Tuple[Tuple[int, int], HubSpotOAuthData]] = {}
+        for root, _, file_names in os.walk(self.storage_dir):
+            for file_name in file_names:
+                if not (
+                    file_name.startswith(FILE_PREFIX) and file_name.endswith(FILE_SUFFIX)
+                ):
+                    continue
+                file_path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(file_path)
+                    version = (stat.st_mtime_ns, stat.st_ino)
+                    cached = self._parsed.get(file_path)
+                    if cached is not None and cached[0] == version:
+                        data = cached[1]
+                    else:
+                        data = self._load(file_path)
+                except FileNotFoundError:
+                    # Deleted since the directory was listed
+                    continue
+                parsed[file_path] = (version, data)
+                # A sharded file takes precedence over a legacy one
+                if root != self.storage_dir or data.hub_id not in installations:
+                    installations[data.hub_id] = data
+        self._parsed = parsed
+        return [installations[hub_id] for hub_id in sorted(installations)]
 
     async def save(self, data: HubSpotOAuthData) -> None:
-        """Save HubSpot OAuth data to file.
+        """Save HubSpot OAuth data to file, replacing any stored data.
 
         Args:
             data (HubSpotOAuthData): The HubSpot OAuth data to save.
         """
         try:
-            file_path = self._get_file_path(data.hub_id)
-            with open(file_path, "w") as f:
-                json.dump(data.to_dict(), f, indent=2)
+            await self._run(self._write, data)
         except Exception as e:
             raise HubSpotOperationError(f"Failed to save OAuth data: {str(e)}")
 
@@ -63,13 +328,7 @@ class FileHubSpotOAuthRepository(IHubSpotOAuthRepository):
             Optional[HubSpotOAuthData]: The HubSpot OAuth data.
         """
         try:
-            file_path = self._get_file_path(hub_id)
-            if not os.path.exists(file_path):
-                return None
-
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                return HubSpotOAuthData.from_dict(data)
+            return await self._run(self._read, hub_id)
         except Exception as e:
             raise HubSpotOperationError(f"Failed to get OAuth data: {str(e)}")
 
@@ -77,17 +336,16 @@ class FileHubSpotOAuthRepository(IHubSpotOAuthRepository):
         """Update existing HubSpot OAuth data in file.
 
         Args:
-            data (HubSpotOAuthData): The HubSpot OAuth data to update.
+            data (HubSpotOAuthData): The HubSpot OAuth data to update, with a
+                version newer than the stored one.
+
+        Raises:
+            StaleOAuthDataError: If the stored data is as new or newer.
         """
         try:
-            file_path = self._get_file_path(data.hub_id)
-            if not os.path.exists(file_path):
-                raise HubSpotOperationError(
-                    f"No OAuth data found for hub ID: {data.hub_id}"
-                )
-
-            with open(file_path, "w") as f:
-                json.dump(data.to_dict(), f, indent=2)
+            await self._run(self._write, data, True)
+        except StaleOAuthDataError:
+            raise
         except Exception as e:
             raise HubSpotOperationError(f"Failed to update OAuth data: {str(e)}")
 
@@ -98,8 +356,37 @@ class FileHubSpotOAuthRepository(IHubSpotOAuthRepository):
             hub_id (str): The hub ID of the OAuth data to delete.
         """
         try:
-            file_path = self._get_file_path(hub_id)
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            await self._run(self._remove, hub_id)
         except Exception as e:
             raise HubSpotOperationError(f"Failed to delete OAuth data: {str(e)}")
+
+    async def list_all(self) -> List[HubSpotOAuthData]:
+        """List the HubSpot OAuth data of every installation on disk.
+
+        Returns:
+            List[HubSpotOAuthData]: The HubSpot OAuth data of all installations.
+        """
+        try:
+            return await self._run(self._read_all)
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to list OAuth data: {str(e)}")
+
+    async def list_expiring(self, before: datetime) -> List[HubSpotOAuthData]:
+        """List installations whose token expires at or before a given time.
+
+        Args:
+            before (datetime): The expiry cutoff.
+
+        Returns:
+            List[HubSpotOAuthData]: The matching installations, soonest first.
+        """
+        installations = await self.list_all()
+        return sorted(
+            (data for data in installations if data.expires_at <= before),
+            key=lambda data: data.expires_at,
+        )
+
+    def close(self) -> None:
+        """Shut down the file I/O thread pool if this repository created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
@@ -0,0 +1,58 @@
+"""Import file-based OAuth data into the SQLite repository.
+
+Usage:
+    python -m src.infrastructure.repositories.migrate_to_sqlite \\
+        [--storage-dir .data/auth] [--database .data/auth.db]
+
+Existing rows for the same hub ID are overwritten, so the command can safely
+be run again. The source files are left untouched.
+"""
+
+import argparse
+import asyncio
+from typing import List, Optional
+
+from src.domain.interfaces.repository import IHubSpotOAuthRepository
+from src.infrastructure.repositories.file_repository import FileHubSpotOAuthRepository
+from src.infrastructure.repositories.sqlite_repository import (
+    SqliteHubSpotOAuthRepository,
+)
+
+
+async def migrate(
+    source: IHubSpotOAuthRepository, target: IHubSpotOAuthRepository
+) -> int:
+    """Copy every installation from one repository to another.
+
+    Args:
+        source (IHubSpotOAuthRepository): The repository to read from.
+        target (IHubSpotOAuthRepository): The repository to write to.
+
+    Returns:
+        int: The number of installations copied.
+    """
+    installations = await source.list_all()
+    for data in installations:
+        await target.save(data)
+    return len(installations)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the migration from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--storage-dir", default=".data/auth")
+    parser.add_argument("--database", default=".data/auth.db")
+    args = parser.parse_args(argv)
+
+    source = FileHubSpotOAuthRepository(storage_dir=args.storage_dir)
+    target = SqliteHubSpotOAuthRepository(database_path=args.database)
+    try:
+        count = asyncio.run(migrate(source, target))
+    finally:
+        source.close()
+        target.close()
+    print(f"Imported {count} installation(s) into {args.database}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+"""SQLite-based mirror of each portal's contacts and companies."""
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.domain.exceptions import HubSpotOperationError
+from src.domain.interfaces.repository import ICrmMirrorRepository
+from src.domain.types.hubspot import Company, Contact
+from src.infrastructure.repositories.sqlite_pool import SqliteConnectionPool
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mirror_contacts (
+    hub_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    properties TEXT NOT NULL,
+    PRIMARY KEY (hub_id, id)
+) WITHOUT ROWID;
+-- HubSpot IDs are numbers stored as text, so pages follow their numeric order
+CREATE INDEX IF NOT EXISTS mirror_contacts_numeric_id
+    ON mirror_contacts (hub_id, CAST(id AS INTEGER));
+CREATE TABLE IF NOT EXISTS mirror_companies (
+    hub_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    domain TEXT,
+    industry TEXT,
+    phone TEXT,
+    properties TEXT NOT NULL,
+    PRIMARY KEY (hub_id, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS mirror_contact_companies (
+    hub_id TEXT NOT NULL,
+    contact_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    company_id TEXT NOT NULL,
+    PRIMARY KEY (hub_id, contact_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS mirror_sync_state (
+    hub_id TEXT NOT NULL,
+    object_type TEXT NOT NULL,
+    synced_until TEXT NOT NULL,
+    PRIMARY KEY (hub_id, object_type)
+) WITHOUT ROWID;
+"""
+
+UPSERT_CONTACT_SQL = (
+    "INSERT OR REPLACE INTO mirror_contacts "
+    "(hub_id, id, name, email, phone, properties) VALUES (?, ?, ?, ?, ?, ?)"
+)
+UPSERT_COMPANY_SQL = (
+    "INSERT OR REPLACE INTO mirror_companies "
+    "(hub_id, id, name, domain, industry, phone, properties) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+DELETE_CONTACT_COMPANIES_SQL = (
+    "DELETE FROM mirror_contact_companies WHERE hub_id = ? AND contact_id = ?"
+)
+INSERT_CONTACT_COMPANY_SQL = (
+    "INSERT INTO mirror_contact_companies "
+    "(hub_id, contact_id, position, company_id) VALUES (?, ?, ?, ?)"
+)
+SELECT_CONTACTS_SQL = (
+    "SELECT id, name, email, phone, properties FROM mirror_contacts "
+    "WHERE hub_id = ? AND CAST(id AS INTEGER) > ? "
+    "ORDER BY CAST(id AS INTEGER) LIMIT ?"
+)
+SELECT_CONTACT_COMPANIES_SQL = (
+    "SELECT a.position, c.id, c.name, c.domain, c.industry, c.phone, c.properties "
+    "FROM mirror_contact_companies a "
+    "JOIN mirror_companies c ON c.hub_id = a.hub_id AND c.id = a.company_id "
+    "WHERE a.hub_id = ? AND a.contact_id = ? AND a.position > ? "
+    "ORDER BY a.position LIMIT ?"
+)
+# Tables of each mirrored object type
+OBJECT_TABLES = {"contacts": "mirror_contacts", "companies": "mirror_companies"}
+SELECT_IDS_SQL = "SELECT id FROM {table} WHERE hub_id = ?"
+DELETE_OBJECT_SQL = "DELETE FROM {table} WHERE hub_id = ? AND id = ?"
+# Associations are keyed by contact, so a company's are found in one scan
+DELETE_COMPANY_ASSOCIATIONS_SQL = (
+    "DELETE FROM mirror_contact_companies WHERE hub_id = ? "
+    "AND company_id IN (SELECT value FROM json_each(?))"
+)
+SELECT_SYNC_STATE_SQL = (
+    "SELECT synced_until FROM mirror_sync_state WHERE hub_id = ? AND object_type = ?"
+)
+UPSERT_SYNC_STATE_SQL = (
+    "INSERT OR REPLACE INTO mirror_sync_state (hub_id, object_type, synced_until) "
+    "VALUES (?, ?, ?)"
+)
+
+
+def _in_transaction(
+    connection: sqlite3.Connection, func: Callable[[sqlite3.Connection], Any]
+) -> Any:
+    """Run ``func`` in a write transaction."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        result = func(connection)
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+    return result
+
+
+class SqliteCrmMirrorRepository(ICrmMirrorRepository):
+    """SQLite implementation of the CRM mirror.
+
+    Every table is keyed by hub ID first, so one database holds the mirrors
+    of all portals and each read is a primary key range scan.
+    """
+
+    def __init__(
+        self,
+        database_path: str = ".data/mirror.db",
+        pool_size: int = 4,
+        busy_timeout_ms: int = 5000,
+    ):
+        """Initialize repository and create the schema if needed.
+
+        Args:
+            database_path (str): Path of the SQLite database file.
+            pool_size (int): Number of pooled connections and worker threads.
+            busy_timeout_ms (int): How long a write waits for another
+                process's write lock before failing.
+        """
+        self.database_path = database_path
+        self._pool = SqliteConnectionPool(
+            database_path,
+            SCHEMA,
+            pool_size=pool_size,
+            busy_timeout_ms=busy_timeout_ms,
+            thread_name_prefix="mirror-sqlite",
+        )
+
+    async def upsert_contacts(self, hub_id: str, contacts: List[Contact]) -> None:
+        """Insert or replace contacts of a portal.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            contacts (List[Contact]): The contacts to store.
+        """
+        rows = [
+            (
+                hub_id,
+                contact.id,
+                contact.name,
+                contact.email,
+                contact.phone,
+                json.dumps(contact.properties),
+            )
+            for contact in contacts
+        ]
+        try:
+            await self._pool.run(
+                lambda connection: _in_transaction(
+                    connection, lambda c: c.executemany(UPSERT_CONTACT_SQL, rows)
+                )
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to save contacts: {str(e)}")
+
+    async def upsert_companies(self, hub_id: str, companies: List[Company]) -> None:
+        """Insert or replace companies of a portal.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            companies (List[Company]): The companies to store.
+        """
+        rows = [
+            (
+                hub_id,
+                company.id,
+                company.name,
+                company.domain,
+                company.industry,
+                company.phone,
+                json.dumps(company.properties),
+            )
+            for company in companies
+        ]
+        try:
+            await self._pool.run(
+                lambda connection: _in_transaction(
+                    connection, lambda c: c.executemany(UPSERT_COMPANY_SQL, rows)
+                )
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to save companies: {str(e)}")
+
+    async def replace_contact_companies(
+        self, hub_id: str, company_ids_by_contact: Dict[str, List[str]]
+    ) -> None:
+        """Replace the associated companies of contacts.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            company_ids_by_contact (Dict[str, List[str]]): The complete list of
+                associated company IDs of each contact.
+        """
+        deletes = [(hub_id, contact_id) for contact_id in company_ids_by_contact]
+        inserts = [
+            (hub_id, contact_id, position, company_id)
+            for contact_id, company_ids in company_ids_by_contact.items()
+            for position, company_id in enumerate(company_ids)
+        ]
+
+        def replace(connection: sqlite3.Connection) -> None:
+            connection.executemany(DELETE_CONTACT_COMPANIES_SQL, deletes)
+            connection.executemany(INSERT_CONTACT_COMPANY_SQL, inserts)
+
+        try:
+            await self._pool.run(
+                lambda connection: _in_transaction(connection, replace)
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to save associations: {str(e)}")
+
+    async def list_contacts(
+        self, hub_id: str, limit: int = 10, after: Optional[str] = None
+    ) -> List[Contact]:
+        """List contacts of a portal in numeric ID order.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            limit (int): The maximum number of contacts to return.
+            after (Optional[str]): The ID of the contact to start after.
+
+        Returns:
+            List[Contact]: The contacts.
+
+        Raises:
+            ValueError: If ``after`` is not a contact ID.
+        """
+        start = -1 if after is None else int(after)
+        try:
+            rows = await self._pool.run(
+                lambda connection: connection.execute(
+                    SELECT_CONTACTS_SQL, (hub_id, start, limit)
+                ).fetchall()
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to list contacts: {str(e)}")
+        return [
+            Contact(
+                id=row[0],
+                name=row[1],
+                email=row[2],
+                phone=row[3],
+                properties=json.loads(row[4]),
+            )
+            for row in rows
+        ]
+
+    async def get_contact_companies(
+        self, hub_id: str, contact_id: str
+    ) -> List[Company]:
+        """Get the companies associated with a contact.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            contact_id (str): The ID of the contact.
+
+        Returns:
+            List[Company]: The associated companies.
+        """
+        companies, _ = await self.get_contact_companies_page(hub_id, contact_id)
+        return companies
+
+    async def get_contact_companies_page(
+        self,
+        hub_id: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Company], Optional[str]]:
+        """Get a page of the companies associated with a contact.
+
+        The cursor is the position of the last company returned, in the
+        order HubSpot listed the associations.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            contact_id (str): The ID of the contact.
+            limit (Optional[int]): The maximum number of companies to return,
+                or None for every company.
+            after (Optional[str]): The cursor to start after.
+
+        Returns:
+            Tuple[List[Company], Optional[str]]: The companies, and the cursor
+                of the next page if there are more.
+
+        Raises:
+            ValueError: If ``after`` is not a cursor of this mirror.
+        """
+        start = -1 if after is None else int(after)
+        # One more row than requested tells whether there is a next page
+        row_limit = -1 if limit is None else limit + 1
+        try:
+            rows = await self._pool.run(
+                lambda connection: connection.execute(
+                    SELECT_CONTACT_COMPANIES_SQL,
+                    (hub_id, contact_id, start, row_limit),
+                ).fetchall()
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to get companies: {str(e)}")
+        next_after = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_after = str(rows[-1][0])
+        companies = [
+            Company(
+                id=row[1],
+                name=row[2],
+                domain=row[3],
+                industry=row[4],
+                phone=row[5],
+                associated=True,
+                properties=json.loads(row[6]),
+            )
+            for row in rows
+        ]
+        return companies, next_after
+
+    async def list_ids(self, hub_id: str, object_type: str) -> Set[str]:
+        """Get the IDs of every mirrored object of a type.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, "contacts" or "companies".
+
+        Returns:
+            Set[str]: The IDs of the objects.
+        """
+        sql = SELECT_IDS_SQL.format(table=OBJECT_TABLES[object_type])
+        try:
+            rows = await self._pool.run(
+                lambda connection: connection.execute(sql, (hub_id,)).fetchall()
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to list {object_type}: {str(e)}")
+        return {row[0] for row in rows}
+
+    async def delete_objects(
+        self, hub_id: str, object_type: str, ids: Iterable[str]
+    ) -> None:
+        """Delete mirrored objects together with their associations.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, "contacts" or "companies".
+            ids (Iterable[str]): The IDs of the objects.
+        """
+        ids = list(ids)
+        sql = DELETE_OBJECT_SQL.format(table=OBJECT_TABLES[object_type])
+        rows = [(hub_id, object_id) for object_id in ids]
+
+        def delete(connection: sqlite3.Connection) -> None:
+            connection.executemany(sql, rows)
+            if object_type == "contacts":
+                connection.executemany(DELETE_CONTACT_COMPANIES_SQL, rows)
+            else:
+                connection.execute(
+                    DELETE_COMPANY_ASSOCIATIONS_SQL, (hub_id, json.dumps(ids))
+                )
+
+        try:
+            await self._pool.run(
+                lambda connection: _in_transaction(connection, delete)
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to delete {object_type}: {str(e)}")
+
+    async def get_synced_until(
+        self, hub_id: str, object_type: str
+    ) -> Optional[datetime]:
+        """Get the time up to which an object type of a portal is mirrored.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, e.g. "contacts".
+
+        Returns:
+            Optional[datetime]: The sync watermark, or None before the backfill
+                has completed.
+        """
+        try:
+            row = await self._pool.run(
+                lambda connection: connection.execute(
+                    SELECT_SYNC_STATE_SQL, (hub_id, object_type)
+                ).fetchone()
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to get sync state: {str(e)}")
+        return datetime.fromisoformat(row[0]) if row else None
+
+    async def set_synced_until(
+        self, hub_id: str, object_type: str, synced_until: datetime
+    ) -> None:
+        """Record the time up to which an object type of a portal is mirrored.
+
+        Args:
+            hub_id (str): The hub ID of the portal.
+            object_type (str): The object type, e.g. "contacts".
+            synced_until (datetime): The sync watermark.
+        """
+        row = (hub_id, object_type, synced_until.isoformat())
+        try:
+            await self._pool.run(
+                lambda connection: connection.execute(UPSERT_SYNC_STATE_SQL, row)
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to save sync state: {str(e)}")
+
+    def close(self) -> None:
+        """Close every pooled connection and the worker threads."""
+        self._pool.close()
@@ -0,0 +1,109 @@
+"""Pooled SQLite connections used from asyncio."""
+
+import asyncio
+import functools
+import os
+import queue
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+
+class SqliteConnectionPool:
+    """A pool of SQLite connections with queries run on worker threads.
+
+    The database runs in WAL mode so readers never block the writer and
+    several uvicorn workers can share one database file. Each worker thread
+    borrows a connection from a pool of the same size, so the event loop
+    never waits on disk. A pool opened before the process forks, e.g. when
+    ``serve`` preloads the app, opens new connections in the child.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        schema: str,
+        pool_size: int = 4,
+        busy_timeout_ms: int = 5000,
+        thread_name_prefix: str = "sqlite",
+    ):
+        """Open the pool and create the schema if needed.
+
+        Args:
+            database_path (str): Path of the SQLite database file.
+            schema (str): Script creating the tables and indexes.
+            pool_size (int): Number of pooled connections and worker threads.
+            busy_timeout_ms (int): How long a write waits for another
+                process's write lock before failing.
+            thread_name_prefix (str): Name prefix of the worker threads.
+        """
+        self.database_path = database_path
+        self._pool_size = pool_size
+        self._busy_timeout_ms = busy_timeout_ms
+        self._pid = os.getpid()
+        # Connections inherited from the parent process, never used or closed
+        self._inherited: List[sqlite3.Connection] = []
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect(busy_timeout_ms))
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix=thread_name_prefix
+        )
+        self.with_connection(lambda connection: connection.executescript(schema))
+
+    def _connect(self, busy_timeout_ms: int) -> sqlite3.Connection:
+        """Open a pooled connection."""
+        connection = sqlite3.connect(
+            self.database_path,
+            timeout=busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=32,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        return connection
+
+    def with_connection(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``func`` with a connection borrowed from the pool."""
+        connection = self._pool.get()
+        try:
+            return func(connection)
+        finally:
+            self._pool.put(connection)
+
+    def _reopen_after_fork(self) -> None:
+        """Replace the connections inherited from the parent process.
+
+        SQLite connections must not be used across a fork. Closing them in
+        the child could disturb the parent's locks, so they are only set
+        aside.
+        """
+        while not self._pool.empty():
+            self._inherited.append(self._pool.get_nowait())
+        for _ in range(self._pool_size):
+            self._pool.put(self._connect(self._busy_timeout_ms))
+        self._pid = os.getpid()
+
+    async def run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a query on the worker threads."""
+        if self._pid != os.getpid():
+            self._reopen_after_fork()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self.with_connection, func)
+        )
+
+    def close(self) -> None:
+        """Close every pooled connection and the worker threads."""
+        self._executor.shutdown(wait=True)
+        if self._pid != os.getpid():
+            # The connections still belong to the parent process
+            return
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
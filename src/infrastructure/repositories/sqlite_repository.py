@@ -0,0 +1,312 @@
+"""SQLite-based repository implementation."""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
+
+from src.domain.interfaces.repository import IHubSpotOAuthRepository
+from src.domain.types.hubspot import HubSpotOAuthData
+from src.domain.exceptions import HubSpotOperationError, StaleOAuthDataError
+from src.infrastructure.repositories.file_lock import hold_refresh_lock
+from src.infrastructure.repositories.sqlite_pool import SqliteConnectionPool
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hubspot_oauth (
+    hub_id TEXT PRIMARY KEY,
+    access_token TEXT NOT NULL,
+    refresh_token TEXT NOT NULL,
+    expires_at TEXT NOT NULL,
+    scopes TEXT NOT NULL,
+    installed_at TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    app_id TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_hubspot_oauth_expires_at
+    ON hubspot_oauth (expires_at);
+"""
+
+# Adds the version column to databases created before it existed
+ADD_VERSION_SQL = (
+    "ALTER TABLE hubspot_oauth ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+)
+
+COLUMNS = (
+    "hub_id, access_token, refresh_token, expires_at, scopes, installed_at, "
+    "user_id, app_id, version"
+)
+
+# Statements are kept constant so each pooled connection compiles them once
+# and reuses them from its statement cache.
+# Saved data replaces stored data, with a version above it
+UPSERT_SQL = (
+    f"INSERT INTO hubspot_oauth ({COLUMNS}) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (hub_id) DO UPDATE SET access_token = excluded.access_token, "
+    "refresh_token = excluded.refresh_token, expires_at = excluded.expires_at, "
+    "scopes = excluded.scopes, installed_at = excluded.installed_at, "
+    "user_id = excluded.user_id, app_id = excluded.app_id, "
+    "version = MAX(excluded.version, hubspot_oauth.version + 1)"
+)
+SELECT_SQL = f"SELECT {COLUMNS} FROM hubspot_oauth WHERE hub_id = ?"
+# An update only applies over an older version
+UPDATE_SQL = (
+    "UPDATE hubspot_oauth SET access_token = ?, refresh_token = ?, expires_at = ?, "
+    "scopes = ?, installed_at = ?, user_id = ?, app_id = ?, version = ? "
+    "WHERE hub_id = ? AND version < ?"
+)
+SELECT_VERSION_SQL = "SELECT version FROM hubspot_oauth WHERE hub_id = ?"
+DELETE_SQL = "DELETE FROM hubspot_oauth WHERE hub_id = ?"
+SELECT_ALL_SQL = f"SELECT {COLUMNS} FROM hubspot_oauth ORDER BY hub_id"
+SELECT_EXPIRING_SQL = (
+    f"SELECT {COLUMNS} FROM hubspot_oauth "
+    "WHERE expires_at <= ? ORDER BY expires_at"
+)
+
+
+def _format_datetime(value: datetime) -> str:
+    """Format a datetime so that string order matches time order."""
+    return value.isoformat(timespec="microseconds")
+
+
+def _to_row(data: HubSpotOAuthData) -> Tuple[Any, ...]:
+    """Convert OAuth data to a row in column order."""
+    return (
+        data.hub_id,
+        data.access_token,
+        data.refresh_token,
+        _format_datetime(data.expires_at),
+        json.dumps(data.scopes),
+        _format_datetime(data.installed_at),
+        data.user_id,
+        data.app_id,
+        data.version,
+    )
+
+
+def _from_row(row: Tuple[Any, ...]) -> HubSpotOAuthData:
+    """Convert a row in column order to OAuth data."""
+    return HubSpotOAuthData(
+        hub_id=row[0],
+        access_token=row[1],
+        refresh_token=row[2],
+        expires_at=datetime.fromisoformat(row[3]),
+        scopes=json.loads(row[4]),
+        installed_at=datetime.fromisoformat(row[5]),
+        user_id=row[6],
+        app_id=row[7],
+        version=row[8],
+    )
+
+
+def _add_version_column(connection: sqlite3.Connection) -> None:
+    """Add the version column to a database created before it existed."""
+    columns = {
+        row[1] for row in connection.execute("PRAGMA table_info(hubspot_oauth)")
+    }
+    if "version" in columns:
+        return
+    try:
+        connection.execute(ADD_VERSION_SQL)
+    except sqlite3.OperationalError as e:
+        # Another worker added it first
+        if "duplicate column" not in str(e):
+            raise
+
+
+def _update(connection: sqlite3.Connection, row: Tuple[Any, ...]) -> None:
+    """Update a row if its stored version is older.
+
+    Raises:
+        HubSpotOperationError: If there is no row for the hub ID.
+        StaleOAuthDataError: If the stored version is as new or newer.
+    """
+    hub_id, version = row[0], row[-1]
+    if connection.execute(UPDATE_SQL, row[1:] + (hub_id, version)).rowcount:
+        return
+    stored = connection.execute(SELECT_VERSION_SQL, (hub_id,)).fetchone()
+    if stored is None:
+        raise HubSpotOperationError(f"No OAuth data found for hub ID: {hub_id}")
+    raise StaleOAuthDataError(
+        f"Stored OAuth data of hub ID {hub_id} is at version {stored[0]}, "
+        f"not older than {version}"
+    )
+
+
+class SqliteHubSpotOAuthRepository(IHubSpotOAuthRepository):
+    """SQLite implementation of HubSpot OAuth repository.
+
+    The database runs in WAL mode so readers never block the writer and
+    several uvicorn workers can share one database file. Queries run on a
+    small thread pool, each thread borrowing a connection from a pool of the
+    same size, so the event loop never waits on disk.
+
+    As with the file repository, an update whose version is not newer than
+    the stored one is rejected with ``StaleOAuthDataError``, and token
+    refreshes hold an advisory ``fcntl`` lock of the hub ID, taken with
+    ``lock``, so only one process at a time exchanges a refresh token. Lock
+    files are kept in a directory next to the database.
+    """
+
+    def __init__(
+        self,
+        database_path: str = ".data/auth.db",
+        pool_size: int = 4,
+        busy_timeout_ms: int = 5000,
+        lock_timeout_seconds: float = 30.0,
+    ):
+        """Initialize repository and create the schema if needed.
+
+        Args:
+            database_path (str): Path of the SQLite database file.
+            pool_size (int): Number of pooled connections and worker threads.
+            busy_timeout_ms (int): How long a write waits for another
+                process's write lock before failing.
+            lock_timeout_seconds (float): How long ``lock`` waits for another
+                process's refresh of the same hub ID.
+        """
+        self.database_path = database_path
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self._pool = SqliteConnectionPool(
+            database_path,
+            SCHEMA,
+            pool_size=pool_size,
+            busy_timeout_ms=busy_timeout_ms,
+            thread_name_prefix="oauth-sqlite",
+        )
+        self._pool.with_connection(_add_version_column)
+
+    async def _run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a query on the pool's worker threads."""
+        return await self._pool.run(func)
+
+    def _open_lock(self, hub_id: str) -> int:
+        """Open the refresh lock file of a hub ID, creating it if needed."""
+        digest = hashlib.sha1(hub_id.encode()).hexdigest()
+        directory = os.path.join(f"{self.database_path}.locks", digest[:2])
+        os.makedirs(directory, exist_ok=True)
+        return os.open(
+            os.path.join(directory, f"{hub_id}.refresh.lock"),
+            os.O_RDWR | os.O_CREAT,
+            0o600,
+        )
+
+    @contextlib.asynccontextmanager
+    async def lock(self, hub_id: str) -> AsyncIterator[None]:
+        """Hold the refresh lock of a hub ID, shared by all processes.
+
+        Args:
+            hub_id (str): The hub ID to lock.
+
+        Raises:
+            HubSpotOperationError: If the lock is not free within
+                ``lock_timeout_seconds``.
+        """
+        fd = await asyncio.to_thread(self._open_lock, hub_id)
+        async with hold_refresh_lock(fd, hub_id, self.lock_timeout_seconds):
+            yield
+
+    async def save(self, data: HubSpotOAuthData) -> None:
+        """Save HubSpot OAuth data to the database.
+
+        Args:
+            data (HubSpotOAuthData): The HubSpot OAuth data to save.
+        """
+        row = _to_row(data)
+        try:
+            await self._run(lambda connection: connection.execute(UPSERT_SQL, row))
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to save OAuth data: {str(e)}")
+
+    async def get_by_hub_id(self, hub_id: str) -> Optional[HubSpotOAuthData]:
+        """Get HubSpot OAuth data by hub ID from the database.
+
+        Args:
+            hub_id (str): The hub ID of the OAuth data to get.
+
+        Returns:
+            Optional[HubSpotOAuthData]: The HubSpot OAuth data.
+        """
+        try:
+            row = await self._run(
+                lambda connection: connection.execute(
+                    SELECT_SQL, (hub_id,)
+                ).fetchone()
+            )
+            return _from_row(row) if row else None
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to get OAuth data: {str(e)}")
+
+    async def update(self, data: HubSpotOAuthData) -> None:
+        """Update existing HubSpot OAuth data in the database.
+
+        Args:
+            data (HubSpotOAuthData): The HubSpot OAuth data to update, with a
+                version newer than the stored one.
+
+        Raises:
+            StaleOAuthDataError: If the stored data is as new or newer.
+        """
+        row = _to_row(data)
+        try:
+            await self._run(lambda connection: _update(connection, row))
+        except StaleOAuthDataError:
+            raise
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to update OAuth data: {str(e)}")
+
+    async def delete(self, hub_id: str) -> None:
+        """Delete HubSpot OAuth data by hub ID from the database.
+
+        Args:
+            hub_id (str): The hub ID of the OAuth data to delete.
+        """
+        try:
+            await self._run(
+                lambda connection: connection.execute(DELETE_SQL, (hub_id,))
+            )
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to delete OAuth data: {str(e)}")
+
+    async def list_all(self) -> List[HubSpotOAuthData]:
+        """List the HubSpot OAuth data of every installation.
+
+        Returns:
+            List[HubSpotOAuthData]: The HubSpot OAuth data of all installations.
+        """
+        try:
+            rows = await self._run(
+                lambda connection: connection.execute(SELECT_ALL_SQL).fetchall()
+            )
+            return [_from_row(row) for row in rows]
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to list OAuth data: {str(e)}")
+
+    async def list_expiring(self, before: datetime) -> List[HubSpotOAuthData]:
+        """List installations whose token expires at or before a given time.
+
+        Args:
+            before (datetime): The expiry cutoff.
+
+        Returns:
+            List[HubSpotOAuthData]: The matching installations, soonest first.
+        """
+        cutoff = _format_datetime(before)
+        try:
+            rows = await self._run(
+                lambda connection: connection.execute(
+                    SELECT_EXPIRING_SQL, (cutoff,)
+                ).fetchall()
+            )
+            return [_from_row(row) for row in rows]
+        except Exception as e:
+            raise HubSpotOperationError(f"Failed to list OAuth data: {str(e)}")
+
+    def close(self) -> None:
+        """Close every pooled connection and the worker threads."""
+        self._pool.close()
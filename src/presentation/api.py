@@ -1,15 +1,60 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.infrastructure.config import get_settings
+from src.infrastructure.hubspot.http_client import get_http_client
+from src.infrastructure.repositories.cached_repository import (
+    CachedHubSpotOAuthRepository,
+)
+from src.presentation import dependencies
 from src.presentation.middleware.hubspot_verification import (
     HubSpotVerificationMiddleware,
 )
-from src.presentation.routers import auth_router, contacts_router
+from src.presentation.routers import auth_router, contacts, contacts_router
+
+# Logged through uvicorn's logger, which its log config sets up
+logger = logging.getLogger("uvicorn.error")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open shared resources on startup and release them on shutdown."""
+    settings = get_settings()
+    dependencies.init_services(settings)
+    contacts.init_services(settings, dependencies.token_manager)
+    http_client = get_http_client()
+    await http_client.start()
+    repository = dependencies.repository
+    if settings.OAUTH_CACHE_PRELOAD and isinstance(
+        repository, CachedHubSpotOAuthRepository
+    ):
+        await repository.preload()
+    if settings.SERVER_BACKGROUND_TASKS:
+        if settings.TOKEN_REFRESH_SCHEDULER_ENABLED:
+            dependencies.token_refresh_scheduler.start()
+        if contacts.crm_sync is not None:
+            contacts.crm_sync.start()
+        logger.info("Started background tasks")
+    try:
+        yield
+    finally:
+        if contacts.crm_sync is not None:
+            await contacts.crm_sync.stop()
+        await dependencies.token_refresh_scheduler.stop()
+        await http_client.aclose()
+        contacts.close_services()
+        dependencies.close_services()
+
 
 app = FastAPI(
     title="HS Backend Demo",
     description="Backend for HS Auth & Backend Api's",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -33,3 +78,17 @@ app.include_router(contacts_router)
 async def healthcheck() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/metrics/rate-limits")
+async def rate_limit_metrics() -> dict:
+    """Report waits on the outbound HubSpot rate limiter and 429 responses."""
+    rate_limiter = get_http_client().rate_limiter
+    return rate_limiter.metrics() if rate_limiter is not None else {}
+
+
+@app.get("/metrics/upstream")
+async def upstream_metrics() -> dict:
+    """Report the concurrency limit and circuit state of each HubSpot API."""
+    upstream_guard = get_http_client().upstream_guard
+    return upstream_guard.metrics() if upstream_guard is not None else {}
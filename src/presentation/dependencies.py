@@ -1,19 +1,88 @@
 """FastAPI dependencies."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import Depends, HTTPException, Query
 from typing import Annotated
 
+from src.application.services.auth_service import AuthService
+from src.application.services.token_manager import TokenManager
+from src.application.services.token_refresh_scheduler import TokenRefreshScheduler
 from src.domain.interfaces.repository import IHubSpotOAuthRepository
 from src.domain.interfaces.hubspot import IHubSpotAuth
 from src.domain.types.hubspot import HubSpotOAuthData
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories.cached_repository import (
+    CachedHubSpotOAuthRepository,
+)
 from src.infrastructure.repositories.file_repository import FileHubSpotOAuthRepository
+from src.infrastructure.repositories.sqlite_repository import (
+    SqliteHubSpotOAuthRepository,
+)
 from src.infrastructure.hubspot.auth import HubSpotAuth
-from src.domain.exceptions import HubSpotOperationError
+from src.domain.exceptions import HubSpotException
 
-# Initialize services
-repository: IHubSpotOAuthRepository = FileHubSpotOAuthRepository()
-auth_client: IHubSpotAuth = HubSpotAuth()
+# OAuth services, built by ``init_services`` on startup
+repository: IHubSpotOAuthRepository
+auth_client: IHubSpotAuth
+auth_service: AuthService
+token_manager: TokenManager
+token_refresh_scheduler: TokenRefreshScheduler
+
+
+def init_services(settings: Settings) -> None:
+    """Open the OAuth repository and build the services that use it.
+
+    Called when the app starts rather than on import, so that importing the
+    app reads no settings and opens no database.
+
+    Args:
+        settings (Settings): The application settings.
+    """
+    global repository, auth_client, auth_service, token_manager
+    global token_refresh_scheduler
+
+    if settings.OAUTH_REPOSITORY_BACKEND == "sqlite":
+        repository = SqliteHubSpotOAuthRepository(
+            database_path=settings.OAUTH_SQLITE_PATH,
+            pool_size=settings.OAUTH_SQLITE_POOL_SIZE,
+            busy_timeout_ms=settings.OAUTH_SQLITE_BUSY_TIMEOUT_MS,
+            lock_timeout_seconds=settings.OAUTH_FILE_LOCK_TIMEOUT_SECONDS,
+        )
+    else:
+        repository = FileHubSpotOAuthRepository(
+            storage_dir=settings.OAUTH_STORAGE_DIR,
+            fsync=settings.OAUTH_FILE_FSYNC,
+            shard_depth=settings.OAUTH_FILE_SHARD_DEPTH,
+            max_workers=settings.OAUTH_FILE_IO_WORKERS,
+            lock_timeout_seconds=settings.OAUTH_FILE_LOCK_TIMEOUT_SECONDS,
+        )
+    if settings.OAUTH_CACHE_ENABLED:
+        repository = CachedHubSpotOAuthRepository(
+            repository,
+            revalidate_seconds=settings.OAUTH_CACHE_REVALIDATE_SECONDS,
+            negative_ttl_seconds=settings.OAUTH_CACHE_NEGATIVE_TTL_SECONDS,
+            negative_max_entries=settings.OAUTH_CACHE_NEGATIVE_MAX_ENTRIES,
+        )
+    auth_client = HubSpotAuth()
+    auth_service = AuthService(auth_client, repository)
+    token_manager = TokenManager(
+        auth_service,
+        failure_backoff_seconds=settings.TOKEN_REFRESH_FAILURE_BACKOFF_SECONDS,
+    )
+    token_refresh_scheduler = TokenRefreshScheduler(
+        token_manager,
+        margin_seconds=settings.TOKEN_REFRESH_MARGIN_SECONDS,
+        concurrency=settings.TOKEN_REFRESH_CONCURRENCY,
+        resync_seconds=settings.TOKEN_REFRESH_RESYNC_SECONDS,
+        retry_seconds=settings.TOKEN_REFRESH_RETRY_SECONDS,
+    )
+
+
+def close_services() -> None:
+    """Close the OAuth repository opened by ``init_services``."""
+    close = getattr(repository, "close", None)
+    if close is not None:
+        close()
 
 
 async def get_oauth_data(
@@ -37,31 +106,13 @@ async def get_oauth_data(
             detail="Unable to access HubSpot data. Please ensure the app is properly installed.",
         )
 
-    # Check if token is expired or about to expire (within 5 minutes)
+    # Refresh expired tokens; concurrent requests share a single refresh
     if datetime.now() >= oauth_data.expires_at:
         try:
-            # Refresh the token
-            token_response = await auth_client.refresh_access_token(
-                oauth_data.refresh_token
+            return await token_manager.refresh(
+                portal_id, stale_access_token=oauth_data.access_token
             )
-
-            # Update OAuth data with new tokens
-            updated_data = HubSpotOAuthData(
-                hub_id=oauth_data.hub_id,
-                access_token=token_response["access_token"],
-                refresh_token=token_response["refresh_token"],
-                expires_at=datetime.now()
-                + timedelta(seconds=token_response["expires_in"]),
-                scopes=oauth_data.scopes,
-                installed_at=oauth_data.installed_at,
-                user_id=oauth_data.user_id,
-                app_id=oauth_data.app_id,
-            )
-
-            # Save updated data
-            await repository.update(updated_data)
-            return updated_data
-        except HubSpotOperationError as e:
+        except HubSpotException:
             raise HTTPException(
                 status_code=401,
                 detail="Failed to refresh access token. Please reinstall the app.",
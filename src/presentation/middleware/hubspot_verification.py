@@ -1,50 +1,99 @@
-from typing import Callable
+from typing import List, Optional
 
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response, JSONResponse
+from starlette.datastructures import URL
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.domain.services.verification import HubSpotRequestVerifier
 from src.infrastructure.config import get_settings
 
-settings = get_settings()
 
+class HubSpotVerificationMiddleware:
+    """Middleware to verify HubSpot requests for contact routes.
 
-class HubSpotVerificationMiddleware(BaseHTTPMiddleware):
-    """Middleware to verify HubSpot requests for contact routes."""
+    This is a plain ASGI middleware: requests outside ``/contacts`` are handed
+    to the app untouched. For contact routes the body is fed into the
+    signature as each chunk arrives, and the received messages are replayed
+    to the app as they are, without joining the body into a second copy.
+    """
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, max_body_size: Optional[int] = None):
+        settings = get_settings()
+        self.app = app
         self.verifier = HubSpotRequestVerifier(settings.HUBSPOT_CLIENT_SECRET)
+        self.max_body_size = (
+            max_body_size
+            if max_body_size is not None
+            else settings.HUBSPOT_VERIFICATION_MAX_BODY_SIZE
+        )
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Response]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Only verify requests for contact routes
-        if not request.url.path.startswith("/contacts"):
-            return await call_next(request)
-
-        # Get required headers
-        timestamp = request.headers.get("X-HubSpot-Request-Timestamp")
-        signature = request.headers.get("X-HubSpot-Signature-v3")
-
-        # Get request body
-        body = await request.body()
-        body_str = body.decode("utf-8")
-
-        # Verify the request
-        is_valid = await self.verifier.verify_request(
-            method=request.method,
-            url=str(request.url),
-            body=body_str,
-            timestamp=timestamp,
-            signature=signature,
+        if scope["type"] != "http" or not scope["path"].startswith("/contacts"):
+            await self.app(scope, receive, send)
+            return
+
+        # Get required headers as raw bytes
+        timestamp = signature = content_length = None
+        for name, value in scope["headers"]:
+            if name == b"x-hubspot-request-timestamp":
+                timestamp = value
+            elif name == b"x-hubspot-signature-v3":
+                signature = value
+            elif name == b"content-length":
+                content_length = value
+        if not signature or not self.verifier.is_timestamp_valid(timestamp):
+            await self._reject(scope, receive, send, 401, "Invalid request")
+            return
+
+        if content_length and content_length.isdigit():
+            if int(content_length) > self.max_body_size:
+                await self._reject(
+                    scope, receive, send, 413, "Request body too large"
+                )
+                return
+
+        # Sign the body as it arrives
+        mac = self.verifier.start(
+            scope["method"].encode(), str(URL(scope=scope)).encode()
         )
+        messages: List[Message] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                await self._reject(
+                    scope, receive, send, 413, "Request body too large"
+                )
+                return
+            mac.update(chunk)
+            messages.append(message)
+            more_body = message.get("more_body", False)
+
+        if not self.verifier.finish(mac, timestamp, signature):
+            await self._reject(scope, receive, send, 401, "Invalid request")
+            return
+
+        # Replay the received messages, then fall back to the server
+        pending = iter(messages)
+
+        async def replay() -> Message:
+            message = next(pending, None)
+            if message is not None:
+                return message
+            return await receive()
 
-        if not is_valid:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Invalid request"},
-            )
+        await self.app(scope, replay, send)
 
-        return await call_next(request)
+    @staticmethod
+    async def _reject(
+        scope: Scope, receive: Receive, send: Send, status_code: int, detail: str
+    ) -> None:
+        """Send an error response without calling the app."""
+        response = JSONResponse(status_code=status_code, content={"detail": detail})
+        await response(scope, receive, send)
@@ -0,0 +1,66 @@
+"""JSON responses serialized without FastAPI's encoder or response validation."""
+
+import json
+import logging
+from typing import Any
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # Installed with the ``fast`` extra
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _to_dict(value: Any) -> Any:
+    """Serialize domain types by their ``to_dict`` representation."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON.
+
+    Uses orjson when it is installed and the standard library otherwise.
+    Domain types such as ``Contact`` are serialized as their ``to_dict``.
+
+    Args:
+        content (Any): JSON-compatible content.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            content, default=_to_dict, option=orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    return json.dumps(
+        content, default=_to_dict, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered by ``dumps``.
+
+    Returning it from a route skips FastAPI's ``jsonable_encoder`` and the
+    validation of the content against the route's return type, so the
+    content must already have the documented shape.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def warn_if_slow() -> None:
+    """Log that the fast JSON path runs without orjson."""
+    if orjson is None:
+        logger.warning(
+            "Fast JSON responses requested but 'orjson' is not installed, "
+            "using the standard library"
+        )
+
@@ -1,18 +1,454 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Optional
-
-from src.domain.interfaces.hubspot import IHubSpotContactService, IHubSpotCompanyService
-from src.infrastructure.hubspot.contact_service import HubSpotContactService
-from src.infrastructure.hubspot.company_service import HubSpotCompanyService
-from src.domain.exceptions import HubSpotOperationError
-from src.domain.types.hubspot import HubSpotOAuthData
+import contextlib
+import csv
+import io
+import json
+import logging
+import math
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from src.domain.interfaces.hubspot import (
+    IHubSpotContactService,
+    IHubSpotCompanyService,
+    IHubSpotPropertyService,
+)
+from src.infrastructure.hubspot.contact_service import (
+    CONTACT_FIELD_PROPERTIES,
+    HubSpotContactService,
+)
+from src.infrastructure.hubspot.company_service import (
+    COMPANY_FIELD_PROPERTIES,
+    HubSpotCompanyService,
+)
+from src.infrastructure.hubspot.properties import (
+    FieldProperties,
+    HubSpotPropertyService,
+)
+from src.infrastructure.repositories.sqlite_mirror_repository import (
+    SqliteCrmMirrorRepository,
+)
+from src.application.services.coalescing import (
+    CoalescingCompanyService,
+    CoalescingContactService,
+    CoalescingPropertyService,
+)
+from src.application.services.crm_sync import CrmSyncService
+from src.application.services.token_manager import TokenManager
+from src.infrastructure.config import Settings
+from src.infrastructure.export.columnar import (
+    ColumnarExporter,
+    ColumnarFormat,
+    parquet_available,
+)
+from src.domain.exceptions import (
+    HubSpotAuthenticationError,
+    HubSpotException,
+    HubSpotOperationError,
+    HubSpotUnavailableError,
+)
+from src.domain.interfaces.repository import ICrmMirrorRepository
+from src.domain.services.request_context import portal_context
+from src.domain.services.response_cache import ResponseCache
+from src.domain.types.hubspot import (
+    AssociationResult,
+    Company,
+    Contact,
+    HubSpotOAuthData,
+)
 from src.presentation.dependencies import get_oauth_data
+from src.presentation.responses import FastJSONResponse, dumps, warn_if_slow
+
+if TYPE_CHECKING:
+    from src.infrastructure.hubspot.sdk_company_service import (
+        HubSpotSdkCompanyService,
+    )
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 router = APIRouter(prefix="/contacts", tags=["Contacts"])
 
-# Initialize services
-contact_service: IHubSpotContactService = HubSpotContactService()
-company_service: IHubSpotCompanyService = HubSpotCompanyService()
+# HubSpot services, caches and the CRM mirror, built by ``init_services`` on
+# startup
+token_manager: TokenManager
+contact_service: IHubSpotContactService
+company_service: IHubSpotCompanyService
+property_service: IHubSpotPropertyService
+crm_mirror: Optional[SqliteCrmMirrorRepository] = None
+crm_sync: Optional[CrmSyncService] = None
+# The SDK company service, whose thread pool is shut down by ``close_services``
+sdk_company_service: Optional["HubSpotSdkCompanyService"] = None
+response_cache: Optional[ResponseCache[Any]] = None
+# Property schemas of each portal, used to validate requested fields
+property_schema_cache: ResponseCache[FrozenSet[str]]
+# Encodes columnar exports off the event loop
+columnar_exporter: ColumnarExporter
+# Serialize responses directly instead of validating and encoding them
+fast_json_responses = False
+
+UNAUTHORIZED_DETAIL = "HubSpot rejected the access token. Please reinstall the app."
+
+# Largest page of companies the list API returns
+COMPANY_EXPORT_PAGE_SIZE = 100
+
+# Response header holding the cursor of the next page of a contact's companies
+NEXT_AFTER_HEADER = "X-Next-After"
+
+UNAVAILABLE_DETAIL = "HubSpot is temporarily unavailable. Please retry later."
+
+SOURCE_DESCRIPTION = (
+    "Read live from HubSpot, or from the local mirror when CRM_MIRROR_ENABLED "
+    "is set"
+)
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return. Defaults to every field; other HubSpot "
+    "properties of the portal may also be requested."
+)
+
+
+def init_services(settings: Settings, manager: TokenManager) -> None:
+    """Build the HubSpot services and caches and open the CRM mirror.
+
+    Called when the app starts rather than on import, so that importing
+    the router stays cheap, reads no settings and opens no files. The
+    ``hubspot`` SDK is only imported when ``HUBSPOT_COMPANY_BACKEND``
+    selects it.
+
+    Args:
+        settings (Settings): The application settings.
+        manager (TokenManager): Refreshes tokens rejected by HubSpot.
+    """
+    global token_manager, contact_service, company_service, property_service
+    global crm_mirror, crm_sync, sdk_company_service
+    global response_cache, property_schema_cache, columnar_exporter
+    global fast_json_responses
+
+    token_manager = manager
+    sdk_company_service = crm_mirror = crm_sync = response_cache = None
+    if settings.RESPONSE_CACHE_ENABLED:
+        response_cache = ResponseCache(
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+            stale_seconds=settings.RESPONSE_CACHE_STALE_SECONDS,
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+        )
+    property_schema_cache = ResponseCache(
+        ttl_seconds=settings.HUBSPOT_PROPERTY_SCHEMA_TTL_SECONDS,
+        stale_seconds=settings.HUBSPOT_PROPERTY_SCHEMA_TTL_SECONDS,
+    )
+    columnar_exporter = ColumnarExporter(
+        max_workers=settings.EXPORT_PROCESS_WORKERS,
+        batch_rows=settings.EXPORT_BATCH_ROWS,
+        parquet_compression=settings.EXPORT_PARQUET_COMPRESSION,
+    )
+    fast_json_responses = settings.FAST_JSON_RESPONSES
+    if fast_json_responses:
+        warn_if_slow()
+    contact_service = HubSpotContactService()
+    if settings.HUBSPOT_COMPANY_BACKEND == "sdk":
+        from src.infrastructure.hubspot.sdk_company_service import (
+            HubSpotSdkCompanyService,
+        )
+
+        sdk_company_service = HubSpotSdkCompanyService(
+            max_workers=settings.HUBSPOT_SDK_MAX_WORKERS,
+            batch_concurrency=settings.HUBSPOT_BATCH_CONCURRENCY,
+        )
+        company_service = sdk_company_service
+    else:
+        company_service = HubSpotCompanyService(
+            batch_concurrency=settings.HUBSPOT_BATCH_CONCURRENCY
+        )
+    property_service = HubSpotPropertyService()
+    if settings.HUBSPOT_COALESCE_READS:
+        contact_service = CoalescingContactService(contact_service)
+        company_service = CoalescingCompanyService(company_service)
+        property_service = CoalescingPropertyService(property_service)
+    if settings.CRM_MIRROR_ENABLED:
+        crm_mirror = SqliteCrmMirrorRepository(
+            database_path=settings.CRM_MIRROR_PATH,
+            pool_size=settings.CRM_MIRROR_POOL_SIZE,
+        )
+        crm_sync = CrmSyncService(
+            token_manager,
+            contact_service,
+            company_service,
+            crm_mirror,
+            interval_seconds=settings.CRM_SYNC_INTERVAL_SECONDS,
+            overlap_seconds=settings.CRM_SYNC_OVERLAP_SECONDS,
+            reconcile_interval_seconds=settings.CRM_SYNC_RECONCILE_INTERVAL_SECONDS,
+            concurrency=settings.CRM_SYNC_CONCURRENCY,
+        )
+
+
+def close_services() -> None:
+    """Release the pools and connections opened by ``init_services``."""
+    columnar_exporter.close()
+    if sdk_company_service is not None:
+        sdk_company_service.shutdown()
+    if crm_mirror is not None:
+        crm_mirror.close()
+
+
+# Largest number of contacts accepted by a batch read
+BATCH_READ_MAX_CONTACTS = 1000
+
+
+class CompaniesBatchReadRequest(BaseModel):
+    """Request body of a batch read of contacts' companies."""
+
+    contact_ids: List[str] = Field(
+        ..., min_length=1, max_length=BATCH_READ_MAX_CONTACTS
+    )
+
+
+# Largest number of pairs accepted by a batch association change
+BATCH_ASSOCIATION_MAX_PAIRS = 10000
+
+
+class AssociationPair(BaseModel):
+    """A contact and company to associate or dissociate."""
+
+    contact_id: str
+    company_id: str
+
+
+class AssociationBatchRequest(BaseModel):
+    """Request body of a batch association change."""
+
+    pairs: List[AssociationPair] = Field(
+        ..., min_length=1, max_length=BATCH_ASSOCIATION_MAX_PAIRS
+    )
+
+
+def unavailable(e: HubSpotUnavailableError) -> HTTPException:
+    """Build the response to a HubSpot call shed during an upstream incident."""
+    return HTTPException(
+        status_code=503,
+        detail=UNAVAILABLE_DETAIL,
+        headers={"Retry-After": str(math.ceil(e.retry_after))},
+    )
+
+
+def respond(content: Any, headers: Optional[Dict[str, str]] = None) -> Any:
+    """Return route content, serialized directly on the fast JSON path."""
+    if not fast_json_responses:
+        return content
+    return FastJSONResponse(content, headers=headers)
+
+
+def respond_page(
+    response: Response, content: List[Any], next_after: Optional[str]
+) -> Any:
+    """Return a page of route content with the cursor of the next page.
+
+    Args:
+        response (Response): The response, given the cursor header.
+        content (List[Any]): The page.
+        next_after (Optional[str]): The cursor of the next page, if any.
+
+    Returns:
+        Any: The content, serialized directly on the fast JSON path.
+    """
+    headers = {NEXT_AFTER_HEADER: next_after} if next_after else {}
+    response.headers.update(headers)
+    return respond(content, headers)
+
+
+def contact_companies_group(hub_id: str, contact_id: str) -> Hashable:
+    """Cache group of every cached read of a contact's companies."""
+    return (hub_id, "contact_companies", contact_id)
+
+
+async def resolve_fields(
+    oauth_data: HubSpotOAuthData,
+    object_type: str,
+    fields: Optional[str],
+    field_properties: FieldProperties,
+) -> Optional[List[str]]:
+    """Parse a ``fields`` query parameter and validate it for a portal.
+
+    Fields other than domain fields must be properties defined in the
+    portal's schema, which is looked up once and cached.
+
+    Args:
+        oauth_data (HubSpotOAuthData): The portal's OAuth data.
+        object_type (str): The HubSpot object type of the fields.
+        fields (Optional[str]): The comma-separated fields, if given.
+        field_properties (FieldProperties): The domain field mapping.
+
+    Returns:
+        Optional[List[str]]: The requested fields, or None for every field.
+
+    Raises:
+        HTTPException: If a field is unknown or the schema lookup fails.
+    """
+    if fields is None:
+        return None
+    requested = list(
+        dict.fromkeys(
+            name for name in (part.strip() for part in fields.split(",")) if name
+        )
+    )
+    requested = [name for name in requested if name != "id"]
+
+    unknown = [name for name in requested if name not in field_properties]
+    if unknown:
+        try:
+            schema = await property_schema_cache.get_or_load(
+                (oauth_data.hub_id, "properties", object_type),
+                lambda: token_manager.call_with_token(
+                    oauth_data,
+                    lambda access_token: load_schema(access_token, object_type),
+                ),
+            )
+        except HubSpotAuthenticationError:
+            raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+        except HubSpotUnavailableError as e:
+            raise unavailable(e)
+        except HubSpotOperationError:
+            raise HTTPException(
+                status_code=400, detail="Failed to fetch properties from HubSpot"
+            )
+        invalid = [name for name in unknown if name not in schema]
+        if invalid:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown fields: {', '.join(invalid)}"
+            )
+    return requested
+
+
+async def load_schema(access_token: str, object_type: str) -> FrozenSet[str]:
+    """Load the property names of an object type."""
+    return frozenset(
+        await property_service.get_property_names(access_token, object_type)
+    )
+
+
+async def get_contact_fields(
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+) -> Optional[List[str]]:
+    """Dependency to get the requested contact fields."""
+    return await resolve_fields(
+        oauth_data, "contacts", fields, CONTACT_FIELD_PROPERTIES
+    )
+
+
+async def get_company_fields(
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+) -> Optional[List[str]]:
+    """Dependency to get the requested company fields."""
+    return await resolve_fields(
+        oauth_data, "companies", fields, COMPANY_FIELD_PROPERTIES
+    )
+
+
+def project(
+    item: Union[Contact, Company],
+    fields: Optional[List[str]],
+    always: tuple = ("id",),
+) -> dict:
+    """Convert a contact or company to a dict holding only the given fields."""
+    data = item.to_dict()
+    if fields is None:
+        return data
+    return {
+        name: data[name] if name in data else item.properties.get(name)
+        for name in (*always, *fields)
+    }
+
+
+def present(
+    item: Union[Contact, Company],
+    fields: Optional[List[str]],
+    always: tuple = ("id",),
+) -> Union[dict, Contact, Company]:
+    """Prepare a contact or company for a JSON response.
+
+    On the fast JSON path an item without a projection is kept as is and
+    serialized by ``dumps`` from the model, so no dict is built for it up
+    front and cached pages hold the compact models.
+
+    Args:
+        item (Union[Contact, Company]): The contact or company.
+        fields (Optional[List[str]]): The requested fields, if any.
+        always (tuple): Fields included in every projection.
+
+    Returns:
+        Union[dict, Contact, Company]: The item or its projection.
+    """
+    if fields is None and fast_json_responses:
+        return item
+    return project(item, fields, always)
+
+
+async def read_mirror(
+    hub_id: str, read: Callable[[ICrmMirrorRepository], Awaitable[T]]
+) -> T:
+    """Serve a read from the local mirror once the portal is backfilled.
+
+    Args:
+        hub_id (str): The hub ID of the portal.
+        read (Callable): Reads from the mirror.
+
+    Returns:
+        T: The result of the read.
+
+    Raises:
+        HTTPException: If the mirror is disabled, not yet backfilled or fails.
+    """
+    if crm_sync is None:
+        raise HTTPException(status_code=400, detail="The CRM mirror is not enabled")
+    try:
+        if await crm_sync.is_ready(hub_id):
+            return await read(crm_sync.mirror)
+    except HubSpotOperationError:
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+    raise HTTPException(
+        status_code=503, detail="The CRM mirror of this portal is not ready yet"
+    )
+
+
+async def cached_read(
+    key: Hashable,
+    loader: Callable[[], Awaitable[T]],
+    group: Optional[Hashable] = None,
+) -> T:
+    """Serve a read from the response cache when it is enabled.
+
+    While HubSpot is unavailable, the last cached value is served however
+    old it is.
+    """
+    if response_cache is None:
+        return await loader()
+    try:
+        return await response_cache.get_or_load(key, loader, group)
+    except HubSpotUnavailableError:
+        stale = response_cache.get_stale(key)
+        if stale is None:
+            raise
+        return stale
 
 
 @router.get("/")
@@ -20,15 +456,41 @@ async def get_contacts(
     oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
     limit: int = 10,
     after: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(get_contact_fields),
+    source: Literal["live", "mirror"] = Query("live", description=SOURCE_DESCRIPTION),
 ) -> List[dict]:
     """Get list of contacts."""
-    try:
+    if source == "mirror":
+        try:
+            contacts = await read_mirror(
+                oauth_data.hub_id,
+                lambda mirror: mirror.list_contacts(oauth_data.hub_id, limit, after),
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return respond([present(contact, fields) for contact in contacts])
+
+    async def load() -> List[Union[dict, Contact]]:
         # Get contacts using the access token
-        contacts = await contact_service.get_contacts(
-            access_token=oauth_data.access_token, limit=limit, after=after
+        contacts = await token_manager.call_with_token(
+            oauth_data,
+            lambda access_token: contact_service.get_contacts(
+                access_token=access_token, limit=limit, after=after, fields=fields
+            ),
         )
+        return [present(contact, fields) for contact in contacts]
 
-        return [contact.to_dict() for contact in contacts]
+    key_fields = tuple(fields) if fields is not None else None
+    try:
+        return respond(
+            await cached_read(
+                (oauth_data.hub_id, "contacts", limit, after, key_fields), load
+            )
+        )
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
     except HubSpotOperationError as e:
         raise HTTPException(
             status_code=400, detail="Failed to fetch contacts from HubSpot"
@@ -37,17 +499,373 @@ async def get_contacts(
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 
+def encode_ndjson(contacts: List[Contact], fields: Optional[List[str]]) -> bytes:
+    """Encode contacts as newline-delimited JSON."""
+    if fast_json_responses:
+        return b"".join(dumps(present(contact, fields)) + b"\n" for contact in contacts)
+    return "".join(
+        json.dumps(project(contact, fields)) + "\n" for contact in contacts
+    ).encode()
+
+
+def encode_csv(contacts: List[Contact], fields: Optional[List[str]]) -> bytes:
+    """Encode contacts as CSV rows."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=export_columns(fields))
+    writer.writerows(project(contact, fields) for contact in contacts)
+    return buffer.getvalue().encode()
+
+
+def export_columns(
+    fields: Optional[List[str]],
+    field_properties: FieldProperties = CONTACT_FIELD_PROPERTIES,
+) -> List[str]:
+    """Get the CSV columns of a contact or company export."""
+    if fields is None:
+        return ["id", *field_properties]
+    return ["id", *fields]
+
+
+COLUMNAR_MEDIA_TYPES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+
+async def columnar_export(
+    oauth_data: HubSpotOAuthData,
+    iterate: Callable[[str], AsyncIterator[List[Any]]],
+    columns: List[str],
+    export_format: ColumnarFormat,
+    name: str,
+) -> StreamingResponse:
+    """Stream pages of contacts or companies as a columnar CSV or Parquet file.
+
+    Encoding runs off the event loop, in the columnar exporter.
+    """
+    if export_format == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=400, detail="Parquet export requires pyarrow on the server"
+        )
+
+    async def open_export(access_token: str):
+        pages = iterate(access_token)
+        try:
+            return pages, await anext(pages, None)
+        except BaseException:
+            await pages.aclose()
+            raise
+
+    # Fetch the first page up front so errors still get a proper status code
+    try:
+        pages, first_page = await token_manager.call_with_token(
+            oauth_data, open_export
+        )
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
+    except HubSpotOperationError as e:
+        raise HTTPException(
+            status_code=400, detail=f"Failed to fetch {name} from HubSpot"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+    async def all_pages() -> AsyncIterator[List[Any]]:
+        if first_page is not None:
+            yield first_page
+        async for page in pages:
+            yield page
+
+    async def stream():
+        # Later pages are fetched outside call_with_token
+        with portal_context(oauth_data.hub_id):
+            async with contextlib.aclosing(pages):
+                try:
+                    async for chunk in columnar_exporter.stream(
+                        all_pages(), columns, export_format
+                    ):
+                        yield chunk
+                except HubSpotException as e:
+                    logger.warning("Columnar %s export stopped early: %s", name, e)
+
+    return StreamingResponse(
+        stream(),
+        media_type=COLUMNAR_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format}"'
+        },
+    )
+
+
+@router.get("/export")
+async def export_contacts(
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+    export_format: Literal["ndjson", "csv", "parquet"] = Query(
+        "ndjson", alias="format"
+    ),
+    fields: Optional[List[str]] = Depends(get_contact_fields),
+) -> StreamingResponse:
+    """Stream every contact as NDJSON, CSV or Parquet.
+
+    Pages are fetched from HubSpot as the client reads the response, with one
+    page of read-ahead, and fetching stops when the client disconnects.
+    Parquet is encoded by the columnar exporter.
+    """
+    if export_format == "parquet":
+        return await columnar_export(
+            oauth_data,
+            lambda access_token: contact_service.iter_contacts(
+                access_token, fields=fields
+            ),
+            export_columns(fields),
+            export_format,
+            "contacts",
+        )
+
+    async def open_export(access_token: str):
+        pages = contact_service.iter_contacts(access_token, fields=fields)
+        try:
+            return pages, await anext(pages)
+        except BaseException:
+            await pages.aclose()
+            raise
+
+    # Fetch the first page up front so errors still get a proper status code
+    try:
+        pages, first_page = await token_manager.call_with_token(
+            oauth_data, open_export
+        )
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
+    except HubSpotOperationError as e:
+        raise HTTPException(
+            status_code=400, detail="Failed to fetch contacts from HubSpot"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+    encode = encode_csv if export_format == "csv" else encode_ndjson
+
+    async def stream():
+        # Later pages are fetched outside call_with_token
+        with portal_context(oauth_data.hub_id):
+            async with contextlib.aclosing(pages):
+                if export_format == "csv":
+                    yield (",".join(export_columns(fields)) + "\r\n").encode()
+                yield encode(first_page, fields)
+                try:
+                    async for page in pages:
+                        yield encode(page, fields)
+                except HubSpotException as e:
+                    logger.warning("Contact export stopped early: %s", e)
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="contacts.{export_format}"'
+        },
+    )
+
+
+@router.get("/companies/export")
+async def export_companies_columnar(
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+    export_format: ColumnarFormat = Query("csv", alias="format"),
+    fields: Optional[List[str]] = Depends(get_company_fields),
+) -> StreamingResponse:
+    """Download every company of the portal as a CSV or Parquet file.
+
+    Companies are listed in ID order rather than searched, since search
+    results are capped and count against the tighter search rate limit.
+    """
+    return await columnar_export(
+        oauth_data,
+        lambda access_token: company_service.iter_companies(
+            access_token, page_size=COMPANY_EXPORT_PAGE_SIZE, fields=fields
+        ),
+        export_columns(fields, COMPANY_FIELD_PROPERTIES),
+        export_format,
+        "companies",
+    )
+
+
+@router.post("/companies:batchRead")
+async def batch_read_contact_companies(
+    request: CompaniesBatchReadRequest,
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+    fields: Optional[List[str]] = Depends(get_company_fields),
+) -> Dict[str, Dict[str, List[dict]]]:
+    """Get the companies associated with each of several contacts.
+
+    Associations of every contact are read in one batch and each distinct
+    company is fetched once.
+    """
+    try:
+        companies_by_contact = await token_manager.call_with_token(
+            oauth_data,
+            lambda access_token: company_service.get_companies_for_contacts(
+                access_token=access_token,
+                contact_ids=request.contact_ids,
+                fields=fields,
+            ),
+        )
+        return respond(
+            {
+                "results": {
+                    contact_id: [
+                        present(company, fields, always=("id", "associated"))
+                        for company in companies
+                    ]
+                    for contact_id, companies in companies_by_contact.items()
+                }
+            }
+        )
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
+    except HubSpotOperationError as e:
+        raise HTTPException(
+            status_code=400, detail="Failed to fetch companies from HubSpot"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+
+async def change_associations(
+    request: AssociationBatchRequest,
+    oauth_data: HubSpotOAuthData,
+    change: Callable[..., Awaitable[List[AssociationResult]]],
+    action: str,
+) -> Dict[str, List[dict]]:
+    """Apply a batch association change and report the outcome of each pair.
+
+    Args:
+        request (AssociationBatchRequest): The pairs to change.
+        oauth_data (HubSpotOAuthData): The portal's OAuth data.
+        change (Callable): The company service method applying the change.
+        action (str): Description of the change, used in error messages.
+
+    Returns:
+        Dict[str, List[dict]]: The result of each distinct pair.
+    """
+    pairs = [(pair.contact_id, pair.company_id) for pair in request.pairs]
+    try:
+        results = await token_manager.call_with_token(
+            oauth_data, lambda access_token: change(access_token, pairs)
+        )
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
+    except HubSpotOperationError as e:
+        raise HTTPException(status_code=400, detail=f"Failed to {action}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+    if response_cache is not None:
+        for contact_id in {result.contact_id for result in results if result.success}:
+            response_cache.invalidate_group(
+                contact_companies_group(oauth_data.hub_id, contact_id)
+            )
+    return respond({"results": [result.to_dict() for result in results]})
+
+
+@router.post("/companies/associations:batch")
+async def batch_add_company_associations(
+    request: AssociationBatchRequest,
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+) -> Dict[str, List[dict]]:
+    """Associate many contacts and companies in batches."""
+    return await change_associations(
+        request,
+        oauth_data,
+        company_service.create_associations,
+        "add company associations",
+    )
+
+
+@router.delete("/companies/associations:batch")
+async def batch_remove_company_associations(
+    request: AssociationBatchRequest,
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+) -> Dict[str, List[dict]]:
+    """Dissociate many contacts and companies in batches."""
+    return await change_associations(
+        request,
+        oauth_data,
+        company_service.remove_associations,
+        "remove company associations",
+    )
+
+
 @router.get("/{contact_id}/companies")
 async def get_contact_companies(
-    contact_id: str, oauth_data: HubSpotOAuthData = Depends(get_oauth_data)
+    contact_id: str,
+    response: Response,
+    oauth_data: HubSpotOAuthData = Depends(get_oauth_data),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Maximum number of companies; defaults to all"
+    ),
+    after: Optional[str] = Query(None, description="Cursor from X-Next-After"),
+    fields: Optional[List[str]] = Depends(get_company_fields),
+    source: Literal["live", "mirror"] = Query("live", description=SOURCE_DESCRIPTION),
 ) -> List[dict]:
-    """Get companies associated with a contact."""
-    try:
+    """Get companies associated with a contact.
+
+    Every company is returned unless ``limit`` is given, in which case the
+    cursor of the next page is returned in the ``X-Next-After`` header.
+    """
+    if source == "mirror":
+        try:
+            mirrored, next_after = await read_mirror(
+                oauth_data.hub_id,
+                lambda mirror: mirror.get_contact_companies_page(
+                    oauth_data.hub_id, contact_id, limit=limit, after=after
+                ),
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return respond_page(
+            response,
+            [
+                present(company, fields, always=("id", "associated"))
+                for company in mirrored
+            ],
+            next_after,
+        )
+
+    async def load() -> Tuple[List[Union[dict, Company]], Optional[str]]:
         # Get companies using the access token
-        companies = await company_service.get_companies_associated_with_contact(
-            access_token=oauth_data.access_token, contact_id=contact_id
+        companies, next_after = await token_manager.call_with_token(
+            oauth_data,
+            lambda access_token: company_service.get_companies_page(
+                access_token=access_token,
+                contact_id=contact_id,
+                limit=limit,
+                after=after,
+                fields=fields,
+            ),
         )
-        return [company.to_dict() for company in companies]
+        return [
+            present(company, fields, always=("id", "associated"))
+            for company in companies
+        ], next_after
+
+    key_fields = tuple(fields) if fields is not None else None
+    try:
+        group = contact_companies_group(oauth_data.hub_id, contact_id)
+        companies, next_after = await cached_read(
+            group + (key_fields, limit, after), load, group
+        )
+        return respond_page(response, companies, next_after)
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
     except HubSpotOperationError as e:
         raise HTTPException(
             status_code=400, detail="Failed to fetch companies from HubSpot"
@@ -64,16 +882,29 @@ async def add_company_association(
 ) -> dict:
     """Add a company association to a contact."""
     try:
-        await company_service.create_association(
-            oauth_data.access_token,
-            contact_id,
-            company_id,
+        await token_manager.call_with_token(
+            oauth_data,
+            lambda access_token: company_service.create_association(
+                access_token,
+                contact_id,
+                company_id,
+            ),
         )
+        if response_cache is not None:
+            response_cache.invalidate_group(
+                contact_companies_group(oauth_data.hub_id, contact_id)
+            )
 
-        return {
-            "status": "success",
-            "message": "Company association added successfully",
-        }
+        return respond(
+            {
+                "status": "success",
+                "message": "Company association added successfully",
+            }
+        )
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
     except HubSpotOperationError as e:
         raise HTTPException(status_code=400, detail="Failed to add company association")
     except Exception as e:
@@ -88,16 +919,29 @@ async def remove_company_association(
 ) -> dict:
     """Remove a company association from a contact."""
     try:
-        await company_service.remove_association(
-            oauth_data.access_token,
-            contact_id,
-            company_id,
+        await token_manager.call_with_token(
+            oauth_data,
+            lambda access_token: company_service.remove_association(
+                access_token,
+                contact_id,
+                company_id,
+            ),
         )
+        if response_cache is not None:
+            response_cache.invalidate_group(
+                contact_companies_group(oauth_data.hub_id, contact_id)
+            )
 
-        return {
-            "status": "success",
-            "message": "Company association removed successfully",
-        }
+        return respond(
+            {
+                "status": "success",
+                "message": "Company association removed successfully",
+            }
+        )
+    except HubSpotAuthenticationError:
+        raise HTTPException(status_code=401, detail=UNAUTHORIZED_DETAIL)
+    except HubSpotUnavailableError as e:
+        raise unavailable(e)
     except HubSpotOperationError as e:
         raise HTTPException(
             status_code=400, detail="Failed to remove company association"
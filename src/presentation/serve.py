@@ -0,0 +1,256 @@
+"""Serve the API with several uvicorn worker processes.
+
+Usage:
+    python -m src.presentation.serve [--host 0.0.0.0] [--port 8000] \\
+        [--workers 4]
+
+Options default to the ``SERVER_*`` settings. The app is imported once and
+the socket bound before the workers are forked, so they share the app's
+memory copy-on-write and accept connections from the same socket. Only
+one worker runs the background tasks, the token refresh scheduler and the
+CRM sync. uvloop and httptools are used when installed (the ``server``
+extra). On SIGTERM or SIGINT every worker stops accepting connections,
+finishes its in-flight requests and runs the app's shutdown, which stops
+the background tasks.
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from typing import List, Optional, Set
+
+import uvicorn
+
+from src.infrastructure.config import Settings, get_settings
+
+# Logged through uvicorn's logger, which its log config sets up
+logger = logging.getLogger("uvicorn.error")
+
+APP = "src.presentation.api:app"
+
+# Exit code of a worker whose app failed to start
+STARTUP_FAILURE = 3
+
+# Time a stopping worker gets for the app's shutdown after its requests
+SHUTDOWN_GRACE_SECONDS = 5.0
+
+
+def default_workers() -> int:
+    """Get the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        return os.cpu_count() or 1
+
+
+def build_config(
+    settings: Settings, host: Optional[str] = None, port: Optional[int] = None
+) -> uvicorn.Config:
+    """Build the uvicorn configuration of the workers.
+
+    Args:
+        settings (Settings): The application settings.
+        host (Optional[str]): Overrides ``SERVER_HOST``.
+        port (Optional[int]): Overrides ``SERVER_PORT``.
+
+    Returns:
+        uvicorn.Config: The configuration.
+    """
+    return uvicorn.Config(
+        APP,
+        host=host if host is not None else settings.SERVER_HOST,
+        port=port if port is not None else settings.SERVER_PORT,
+        # uvloop and httptools when installed, asyncio and h11 otherwise
+        loop="auto",
+        http="auto",
+        lifespan="on",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY,
+        limit_max_requests=settings.SERVER_LIMIT_MAX_REQUESTS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+    )
+
+
+def run_worker(config: uvicorn.Config, sock: socket.socket) -> int:
+    """Serve requests from a socket until told to stop.
+
+    Args:
+        config (uvicorn.Config): The server configuration.
+        sock (socket.socket): The listening socket.
+
+    Returns:
+        int: The exit code, ``STARTUP_FAILURE`` if the app failed to start.
+    """
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    return 0 if server.started else STARTUP_FAILURE
+
+
+class WorkerSupervisor:
+    """Fork workers sharing one listening socket and keep them running.
+
+    A worker that exits, e.g. after ``SERVER_LIMIT_MAX_REQUESTS``, is
+    replaced. One that fails to start stops the supervisor rather than
+    being restarted in a loop. One worker at a time is started with
+    ``SERVER_BACKGROUND_TASKS`` on, so the background tasks do not run once
+    per worker; when it exits, its replacement takes them over. Every
+    worker's ``HUBSPOT_RATE_LIMIT_PROCESSES`` is multiplied by the number
+    of workers, so that together they keep to HubSpot's per-portal rate
+    limits. On SIGTERM or SIGINT each worker is sent SIGTERM and
+    given the graceful shutdown timeout, plus ``SHUTDOWN_GRACE_SECONDS``,
+    to exit before it is killed.
+    """
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        """Initialize the supervisor.
+
+        Args:
+            config (uvicorn.Config): The configuration of the workers.
+            sock (socket.socket): The listening socket.
+            workers (int): Number of worker processes.
+        """
+        self.config = config
+        self.sock = sock
+        self.workers = workers
+        self.pids: Set[int] = set()
+        # The worker running the background tasks
+        self.background_pid: Optional[int] = None
+        self.should_exit = False
+
+    def _handle_exit(self, sig: int, frame: object) -> None:
+        self.should_exit = True
+
+    def _spawn(self) -> None:
+        """Fork a worker, with the background tasks if no worker runs them."""
+        settings = get_settings()
+        background = self.background_pid is None and settings.SERVER_BACKGROUND_TASKS
+        processes = settings.HUBSPOT_RATE_LIMIT_PROCESSES * self.workers
+        pid = os.fork()
+        if pid:
+            self.pids.add(pid)
+            if background:
+                self.background_pid = pid
+            return
+        code = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            # Settings read before the fork are cached; read them again
+            os.environ["SERVER_BACKGROUND_TASKS"] = str(background).lower()
+            os.environ["HUBSPOT_RATE_LIMIT_PROCESSES"] = str(processes)
+            get_settings.cache_clear()
+            code = run_worker(self.config, self.sock)
+        except BaseException:
+            logger.exception("Worker %s failed", os.getpid())
+        finally:
+            os._exit(code)
+
+    def _reaped(self, pid: int) -> None:
+        """Forget a worker that has exited."""
+        self.pids.discard(pid)
+        if pid == self.background_pid:
+            self.background_pid = None
+
+    def run(self) -> int:
+        """Run the workers until SIGTERM or SIGINT, then stop them.
+
+        Returns:
+            int: The exit code, ``STARTUP_FAILURE`` if a worker failed to
+                start.
+        """
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        signal.signal(signal.SIGINT, self._handle_exit)
+        for _ in range(self.workers):
+            self._spawn()
+        logger.info("Started %d workers", self.workers)
+
+        exit_code = 0
+        while not self.should_exit:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if not pid:
+                time.sleep(0.5)
+                continue
+            self._reaped(pid)
+            if os.WIFEXITED(status) and os.WEXITSTATUS(status) == STARTUP_FAILURE:
+                logger.error("Worker %s failed to start, stopping", pid)
+                exit_code = STARTUP_FAILURE
+                break
+            logger.warning("Worker %s exited, starting another", pid)
+            self._spawn()
+
+        self.stop()
+        return exit_code
+
+    def stop(self) -> None:
+        """Ask every worker to finish its requests and exit, then reap them."""
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = (
+            time.monotonic()
+            + (self.config.timeout_graceful_shutdown or 0)
+            + SHUTDOWN_GRACE_SECONDS
+        )
+        while self.pids and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid:
+                self._reaped(pid)
+            else:
+                time.sleep(0.1)
+        for pid in self.pids:
+            logger.warning("Worker %s did not stop in time, killing it", pid)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.pids.clear()
+        self.background_pid = None
+        self.sock.close()
+
+
+def serve(config: uvicorn.Config, workers: int, preload: bool = True) -> int:
+    """Serve the app with the given number of workers.
+
+    Args:
+        config (uvicorn.Config): The configuration of the workers.
+        workers (int): Number of worker processes.
+        preload (bool): Import the app before forking the workers.
+
+    Returns:
+        int: The exit code.
+    """
+    if preload:
+        config.load()
+        # Exempt the preloaded objects from garbage collection, which would
+        # otherwise write to, and so copy, the pages holding them
+        gc.freeze()
+    sock = config.bind_socket()
+    if workers == 1:
+        try:
+            return run_worker(config, sock)
+        finally:
+            sock.close()
+    return WorkerSupervisor(config, sock, workers).run()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    workers = args.workers or settings.SERVER_WORKERS or default_workers()
+    config = build_config(settings, host=args.host, port=args.port)
+    raise SystemExit(serve(config, workers, preload=settings.SERVER_PRELOAD_APP))
+
+
+if __name__ == "__main__":
+    main()
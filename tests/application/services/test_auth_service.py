@@ -27,7 +27,7 @@ def mock_auth_client():
         token_type="bearer",
         expires_in=3600,
     )
-    client.refresh_token.return_value = {
+    client.refresh_access_token.return_value = {
         "access_token": "new_access_token",
         "refresh_token": "new_refresh_token",
         "expires_in": 3600,
@@ -99,13 +99,13 @@ async def test_handle_oauth_callback_auth_error(auth_service, mock_auth_client):
 async def test_refresh_token_success(auth_service, mock_auth_client, mock_repository):
     """Test successful token refresh."""
     # Call the service
-    await auth_service.refresh_token("123")
+    result = await auth_service.refresh_token("123")
 
     # Verify repository get
     mock_repository.get_by_hub_id.assert_called_once_with("123")
 
     # Verify auth client refresh
-    mock_auth_client.refresh_token.assert_called_once_with("old_refresh_token")
+    mock_auth_client.refresh_access_token.assert_called_once_with("old_refresh_token")
 
     # Verify repository update
     mock_repository.update.assert_called_once()
@@ -114,6 +114,7 @@ async def test_refresh_token_success(auth_service, mock_auth_client, mock_reposi
     assert updated_data.hub_id == "123"
     assert updated_data.access_token == "new_access_token"
     assert updated_data.refresh_token == "new_refresh_token"
+    assert result == updated_data
 
 
 @pytest.mark.asyncio
@@ -131,7 +132,7 @@ async def test_refresh_token_not_found(auth_service, mock_repository):
 async def test_refresh_token_auth_error(auth_service, mock_auth_client):
     """Test token refresh with auth error."""
     # Make auth client raise an error
-    mock_auth_client.refresh_token.side_effect = Exception("Auth error")
+    mock_auth_client.refresh_access_token.side_effect = Exception("Auth error")
 
     # Verify error is raised
     with pytest.raises(HubSpotOperationError):
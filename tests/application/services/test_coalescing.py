@@ -0,0 +1,158 @@
+"""Tests for the read-coalescing service wrappers."""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+import pytest
+
+from src.application.services.coalescing import (
+    CoalescingCompanyService,
+    CoalescingContactService,
+)
+from src.domain.exceptions import HubSpotOperationError
+from src.domain.services.request_context import portal_context
+from src.domain.types.hubspot import Company
+
+
+class SlowCompanyService:
+    """Company service whose reads block until released."""
+
+    def __init__(self):
+        self.calls: List[tuple] = []
+        self.release = asyncio.Event()
+        self.error: Optional[Exception] = None
+        self.cancelled = 0
+
+    async def get_companies_page(
+        self, access_token, contact_id, limit=None, after=None, fields=None
+    ) -> Tuple[List[Company], Optional[str]]:
+        self.calls.append((access_token, contact_id, limit, after, fields))
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return [Company(id="c1", name="Acme", domain="acme.com")], None
+
+    async def create_association(self, access_token, contact_id, company_id):
+        self.calls.append(("create", contact_id, company_id))
+
+
+class FakeContactService:
+    """Contact service counting page reads."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_contacts(self, access_token, limit=10, after=None, fields=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return []
+
+
+async def read_concurrently(service, *reads):
+    """Start reads, let them reach the wrapped service and return the tasks."""
+    tasks = [asyncio.create_task(read) for read in reads]
+    await asyncio.sleep(0)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_identical_reads_share_one_call():
+    """Test concurrent identical reads for a portal make one upstream call."""
+    inner = SlowCompanyService()
+    service = CoalescingCompanyService(inner)
+
+    with portal_context("123"):
+        tasks = await read_concurrently(
+            service,
+            service.get_companies_associated_with_contact("token", "1"),
+            service.get_companies_associated_with_contact("token", "1"),
+            service.get_companies_page("token", "1"),
+        )
+    inner.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(inner.calls) == 1
+    assert results[0] == results[1] == results[2][0]
+
+
+@pytest.mark.asyncio
+async def test_different_params_or_portals_are_not_shared():
+    """Test reads differing in portal or parameters run separately."""
+    inner = SlowCompanyService()
+    service = CoalescingCompanyService(inner)
+
+    with portal_context("123"):
+        tasks = await read_concurrently(
+            service,
+            service.get_companies_page("token", "1"),
+            service.get_companies_page("token", "1", fields=["name"]),
+            service.get_companies_page("token", "2"),
+        )
+    with portal_context("456"):
+        tasks += await read_concurrently(
+            service, service.get_companies_page("other", "1")
+        )
+    inner.release.set()
+    await asyncio.gather(*tasks)
+
+    assert len(inner.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_error_reaches_every_waiter():
+    """Test the shared call's exception is raised to all waiters."""
+    inner = SlowCompanyService()
+    inner.error = HubSpotOperationError("boom")
+    service = CoalescingCompanyService(inner)
+
+    tasks = await read_concurrently(
+        service,
+        service.get_companies_page("token", "1"),
+        service.get_companies_page("token", "1"),
+    )
+    inner.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, HubSpotOperationError) for result in results)
+    assert len(inner.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_the_call_for_others():
+    """Test the shared call is only cancelled once every waiter has gone."""
+    inner = SlowCompanyService()
+    service = CoalescingCompanyService(inner)
+
+    first, second = await read_concurrently(
+        service,
+        service.get_companies_page("token", "1"),
+        service.get_companies_page("token", "1"),
+    )
+    first.cancel()
+    await asyncio.sleep(0)
+    assert inner.cancelled == 0
+
+    second.cancel()
+    await asyncio.gather(first, second, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert inner.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_sequential_reads_and_writes_are_not_shared():
+    """Test reads are shared only while in flight and writes pass through."""
+    inner = FakeContactService()
+    service = CoalescingContactService(inner)
+
+    await service.get_contacts("token")
+    await service.get_contacts("token")
+
+    assert inner.calls == 2
+
+    companies = SlowCompanyService()
+    await CoalescingCompanyService(companies).create_association("token", "1", "c1")
+    assert companies.calls == [("create", "1", "c1")]
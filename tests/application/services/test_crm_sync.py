@@ -0,0 +1,288 @@
+"""Tests for the CRM mirror sync service."""
+
+import asyncio
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from src.application.services.crm_sync import (
+    COMPANIES,
+    CONTACTS,
+    RECONCILED,
+    CrmSyncService,
+)
+from src.domain.exceptions import HubSpotOperationError
+from src.domain.types.hubspot import Company, Contact, HubSpotOAuthData
+from src.infrastructure.hubspot.company_service import HubSpotCompanyService
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+from src.infrastructure.repositories.sqlite_mirror_repository import (
+    SqliteCrmMirrorRepository,
+)
+
+
+class FakeRepository:
+    """OAuth repository holding one installation."""
+
+    def __init__(self, oauth_data: HubSpotOAuthData):
+        self.oauth_data = oauth_data
+
+    async def list_all(self) -> List[HubSpotOAuthData]:
+        return [self.oauth_data]
+
+
+class FakeTokenManager:
+    """Token manager calling HubSpot with the stored token."""
+
+    def __init__(self, repository: FakeRepository):
+        self.repository = repository
+
+    async def call_with_token(self, oauth_data, func):
+        return await func(oauth_data.access_token)
+
+
+class FakeContactService:
+    """Contact service serving a fixed list of contacts."""
+
+    def __init__(self):
+        self.contacts: List[Contact] = []
+        self.searches: List[datetime] = []
+
+    async def iter_contacts(self, access_token, page_size=100, fields=None):
+        for start in range(0, len(self.contacts), page_size):
+            yield self.contacts[start : start + page_size]
+
+    async def iter_modified_contacts(self, access_token, since, page_size=100):
+        self.searches.append(since)
+        yield [
+            contact
+            for contact in self.contacts
+            if datetime.fromisoformat(contact.properties["lastmodifieddate"]) >= since
+        ]
+
+
+class FakeCompanyService:
+    """Company service serving fixed associations."""
+
+    def __init__(self):
+        self.associations: Dict[str, List[Company]] = {}
+        self.companies: List[Company] = []
+
+    async def get_companies_for_contacts(self, access_token, contact_ids):
+        return {
+            contact_id: self.associations.get(contact_id, [])
+            for contact_id in contact_ids
+        }
+
+    async def iter_companies(self, access_token, page_size=100, fields=None):
+        yield self.companies
+
+    async def iter_modified_companies(self, access_token, since, page_size=100):
+        yield self.companies
+
+
+def make_contact(contact_id: str, name: str, modified: datetime) -> Contact:
+    """Create a contact last modified at ``modified``."""
+    return Contact(
+        id=contact_id,
+        name=name,
+        email="",
+        phone="",
+        properties={"lastmodifieddate": modified.isoformat()},
+    )
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """Create a mirror with a temporary database."""
+    mirror = SqliteCrmMirrorRepository(database_path=str(tmp_path / "mirror.db"))
+    yield mirror
+    mirror.close()
+
+
+@pytest.fixture
+def oauth_data():
+    """Create sample OAuth data."""
+    return HubSpotOAuthData(
+        hub_id="123",
+        access_token="token",
+        refresh_token="refresh",
+        expires_at=datetime.now() + timedelta(hours=1),
+        scopes=["contacts"],
+        installed_at=datetime.now(),
+        user_id="user",
+        app_id="app",
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_then_incremental_sync(mirror, oauth_data):
+    """Test a portal is backfilled once and then synced from its watermark."""
+    contacts = FakeContactService()
+    companies = FakeCompanyService()
+    sync = CrmSyncService(
+        FakeTokenManager(FakeRepository(oauth_data)),
+        contacts,
+        companies,
+        mirror,
+        overlap_seconds=60,
+        page_size=2,
+    )
+    old = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    contacts.contacts = [make_contact(str(i), f"Contact {i}", old) for i in range(3)]
+    companies.associations = {"1": [Company(id="9", name="Acme", associated=True)]}
+
+    assert not await sync.is_ready("123")
+    await sync.sync_all()
+
+    assert await sync.is_ready("123")
+    assert [c.id for c in await mirror.list_contacts("123")] == ["0", "1", "2"]
+    assert [c.name for c in await mirror.get_contact_companies("123", "1")] == [
+        "Acme"
+    ]
+    backfilled_until = await mirror.get_synced_until("123", CONTACTS)
+    assert backfilled_until > old
+    assert await mirror.get_synced_until("123", COMPANIES) is not None
+
+    # A contact changes and moves to another company after the backfill
+    modified = backfilled_until + timedelta(minutes=5)
+    contacts.contacts[1] = make_contact("1", "Renamed", modified)
+    companies.associations = {"1": [Company(id="8", name="Globex", associated=True)]}
+    await sync.sync_all()
+
+    assert contacts.searches == [backfilled_until - timedelta(seconds=60)]
+    names = [c.name for c in await mirror.list_contacts("123")]
+    assert names == ["Contact 0", "Renamed", "Contact 2"]
+    assert [c.id for c in await mirror.get_contact_companies("123", "1")] == ["8"]
+    assert await mirror.get_synced_until("123", CONTACTS) == modified
+
+
+@pytest.mark.asyncio
+async def test_deleted_objects_are_removed(mirror, oauth_data):
+    """Test a reconcile pass removes objects HubSpot no longer returns."""
+    contacts = FakeContactService()
+    companies = FakeCompanyService()
+    sync = CrmSyncService(
+        FakeTokenManager(FakeRepository(oauth_data)),
+        contacts,
+        companies,
+        mirror,
+        reconcile_interval_seconds=3600,
+    )
+    now = datetime.now(timezone.utc)
+    contacts.contacts = [make_contact(str(i), f"Contact {i}", now) for i in range(3)]
+    acme = Company(id="9", name="Acme", associated=True)
+    companies.associations = {"1": [acme]}
+    companies.companies = [acme]
+    await sync.sync_all()
+
+    # Contact 2 is merged into contact 1 and the company is deleted
+    del contacts.contacts[2]
+    companies.associations = {}
+    companies.companies = []
+    await sync.sync_all()
+
+    # The backfill counts as a pass, so nothing is removed before the interval
+    assert await mirror.list_ids("123", CONTACTS) == {"0", "1", "2"}
+
+    backfilled_until = await mirror.get_synced_until("123", RECONCILED)
+    await mirror.set_synced_until(
+        "123", RECONCILED, backfilled_until - timedelta(hours=1)
+    )
+    await sync.sync_all()
+
+    assert [c.id for c in await mirror.list_contacts("123")] == ["0", "1"]
+    assert await mirror.list_ids("123", COMPANIES) == set()
+    assert await mirror.get_contact_companies("123", "1") == []
+    assert await mirror.get_synced_until("123", RECONCILED) > backfilled_until
+
+
+@pytest.mark.asyncio
+async def test_sync_stores_every_page_of_associations(mirror, oauth_data):
+    """Test a contact's companies beyond the first association page are kept."""
+
+    def handler(request):
+        if request.method == "GET":
+            start = int(request.url.params["after"])
+            return httpx.Response(
+                200, json={"results": [{"toObjectId": i} for i in range(start, 700)]}
+            )
+        if request.url.path == "/crm/v3/objects/companies/search":
+            return httpx.Response(200, json={"results": []})
+        body = json.loads(request.content)
+        if request.url.path.endswith("/associations/contacts/companies/batch/read"):
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "from": {"id": "1"},
+                            "to": [{"toObjectId": i} for i in range(500)],
+                            "paging": {"next": {"after": "500"}},
+                        }
+                    ]
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"id": item["id"], "properties": {}} for item in body["inputs"]
+                ]
+            },
+        )
+
+    contacts = FakeContactService()
+    contacts.contacts = [make_contact("1", "Contact 1", datetime.now(timezone.utc))]
+    company_service = HubSpotCompanyService(
+        http_client=HubSpotHttpClient(
+            http2=False, warmup=False, transport=httpx.MockTransport(handler)
+        )
+    )
+    sync = CrmSyncService(
+        FakeTokenManager(FakeRepository(oauth_data)),
+        contacts,
+        company_service,
+        mirror,
+    )
+
+    await sync.sync_all()
+
+    assert len(await mirror.get_contact_companies("123", "1")) == 700
+
+
+@pytest.mark.asyncio
+async def test_portals_are_synced_with_bounded_concurrency(mirror, oauth_data):
+    """Test portals are synced side by side, at most ``concurrency`` at once."""
+    repository = FakeRepository(oauth_data)
+    portals = [replace(oauth_data, hub_id=str(hub_id)) for hub_id in range(5)]
+
+    async def list_all():
+        return portals
+
+    repository.list_all = list_all
+    sync = CrmSyncService(
+        FakeTokenManager(repository), None, None, mirror, concurrency=2
+    )
+    running: List[str] = []
+    peak = 0
+    synced: List[str] = []
+
+    async def sync_portal(portal):
+        nonlocal peak
+        running.append(portal.hub_id)
+        peak = max(peak, len(running))
+        await asyncio.sleep(0.01)
+        running.remove(portal.hub_id)
+        if portal.hub_id == "0":
+            raise HubSpotOperationError("unavailable")
+        synced.append(portal.hub_id)
+
+    sync.sync_portal = sync_portal
+    await sync.sync_all()
+
+    assert peak == 2
+    assert sorted(synced) == ["1", "2", "3", "4"]
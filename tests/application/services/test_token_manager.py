@@ -0,0 +1,274 @@
+"""Tests for the token manager."""
+
+import asyncio
+import multiprocessing
+import sys
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services.auth_service import AuthService
+from src.application.services.token_manager import TokenManager
+from src.domain.exceptions import HubSpotAuthenticationError, HubSpotOperationError
+from src.domain.interfaces.repository import IHubSpotOAuthRepository
+from src.domain.services.request_context import current_portal
+from src.domain.types.hubspot import HubSpotOAuthData
+from src.infrastructure.repositories.cached_repository import (
+    CachedHubSpotOAuthRepository,
+)
+from src.infrastructure.repositories.file_repository import FileHubSpotOAuthRepository
+from src.infrastructure.repositories.sqlite_repository import (
+    SqliteHubSpotOAuthRepository,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_oauth_data(access_token: str = "old_access_token", expired: bool = True):
+    """Create sample OAuth data."""
+    return HubSpotOAuthData(
+        hub_id="123",
+        access_token=access_token,
+        refresh_token="old_refresh_token",
+        expires_at=datetime.now() + timedelta(hours=-1 if expired else 1),
+        scopes=["contacts"],
+        installed_at=datetime.now() - timedelta(days=1),
+        user_id="user123",
+        app_id="app123",
+    )
+
+
+@pytest.fixture
+def mock_auth_client():
+    """Create a mock auth client."""
+    client = AsyncMock()
+
+    async def refresh_access_token(refresh_token):
+        await asyncio.sleep(0.01)
+        return {
+            "access_token": "new_access_token",
+            "refresh_token": "new_refresh_token",
+            "expires_in": 1800,
+        }
+
+    client.refresh_access_token.side_effect = refresh_access_token
+    return client
+
+
+@pytest.fixture
+def mock_repository():
+    """Create a mock repository holding an expired token."""
+    repository = AsyncMock(spec=IHubSpotOAuthRepository)
+    repository.get_by_hub_id.return_value = make_oauth_data()
+
+    async def update(data):
+        repository.get_by_hub_id.return_value = data
+
+    repository.update.side_effect = update
+    return repository
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def token_manager(mock_auth_client, mock_repository, clock):
+    """Create a token manager with mocked dependencies."""
+    return TokenManager(
+        AuthService(mock_auth_client, mock_repository),
+        failure_backoff_seconds=30,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_are_coalesced(
+    token_manager, mock_auth_client, mock_repository
+):
+    """Test concurrent refreshes for a portal make a single HubSpot call."""
+    results = await asyncio.gather(
+        *(
+            token_manager.refresh("123", stale_access_token="old_access_token")
+            for _ in range(10)
+        )
+    )
+
+    assert mock_auth_client.refresh_access_token.await_count == 1
+    mock_repository.update.assert_awaited_once()
+    assert {result.access_token for result in results} == {"new_access_token"}
+    assert results[0].refresh_token == "new_refresh_token"
+
+
+@pytest.mark.asyncio
+async def test_late_refresh_reuses_replaced_token(token_manager, mock_auth_client):
+    """Test a refresh for an already replaced token does not refresh again."""
+    await token_manager.refresh("123", stale_access_token="old_access_token")
+    result = await token_manager.refresh("123", stale_access_token="old_access_token")
+
+    assert result.access_token == "new_access_token"
+    assert mock_auth_client.refresh_access_token.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure_backoff(token_manager, mock_auth_client, clock):
+    """Test refreshes fail fast for a while after a failure."""
+    mock_auth_client.refresh_access_token.side_effect = HubSpotAuthenticationError(
+        "Invalid refresh token"
+    )
+
+    with pytest.raises(HubSpotAuthenticationError):
+        await token_manager.refresh("123")
+    with pytest.raises(HubSpotAuthenticationError):
+        await token_manager.refresh("123")
+    assert mock_auth_client.refresh_access_token.await_count == 1
+
+    clock.now += 31
+    with pytest.raises(HubSpotAuthenticationError):
+        await token_manager.refresh("123")
+    assert mock_auth_client.refresh_access_token.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_unknown_portal(token_manager, mock_repository):
+    """Test refreshing a portal without OAuth data fails."""
+    mock_repository.get_by_hub_id.return_value = None
+
+    with pytest.raises(HubSpotOperationError):
+        await token_manager.refresh("123")
+
+
+@pytest.mark.asyncio
+async def test_call_with_token_retries_once_after_401(
+    token_manager, mock_auth_client, mock_repository
+):
+    """Test a 401 triggers a refresh and a single retry."""
+    oauth_data = make_oauth_data(access_token="revoked", expired=False)
+    mock_repository.get_by_hub_id.return_value = oauth_data
+    tokens = []
+
+    async def call(access_token):
+        tokens.append(access_token)
+        if access_token == "revoked":
+            raise HubSpotAuthenticationError("Invalid access token")
+        return "ok"
+
+    assert await token_manager.call_with_token(oauth_data, call) == "ok"
+    assert tokens == ["revoked", "new_access_token"]
+    assert mock_auth_client.refresh_access_token.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_call_with_token_gives_up_after_retry(token_manager):
+    """Test a second 401 is raised to the caller."""
+    call = AsyncMock(side_effect=HubSpotAuthenticationError("Invalid access token"))
+
+    with pytest.raises(HubSpotAuthenticationError):
+        await token_manager.call_with_token(make_oauth_data(expired=False), call)
+    assert call.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_call_with_token_attributes_calls_to_portal(token_manager):
+    """Test calls made with a portal's token run in that portal's context."""
+
+    async def call(access_token):
+        return current_portal()
+
+    oauth_data = make_oauth_data(expired=False)
+
+    assert await token_manager.call_with_token(oauth_data, call) == "123"
+    assert current_portal() is None
+
+
+class RotatingHubSpot:
+    """Fake HubSpot that revokes each refresh token once it has been used."""
+
+    def __init__(self, issued):
+        self.issued = issued
+
+    async def refresh_access_token(self, refresh_token):
+        with self.issued.get_lock():
+            issued = self.issued.value
+            if refresh_token != f"refresh_{issued}":
+                raise HubSpotAuthenticationError("Refresh token has been revoked")
+            self.issued.value = issued + 1
+        # Other workers pile up while the call is in flight
+        await asyncio.sleep(0.05)
+        return {
+            "access_token": f"access_{issued + 1}",
+            "refresh_token": f"refresh_{issued + 1}",
+            "expires_in": 1800,
+        }
+
+
+def open_repository(backend, path):
+    """Open the OAuth repository of a backend at a path."""
+    if backend == "sqlite":
+        return SqliteHubSpotOAuthRepository(database_path=path)
+    return FileHubSpotOAuthRepository(storage_dir=path)
+
+
+def refresh_storm_worker(backend, path, issued, results):
+    """Refresh a portal's expired token from one worker process."""
+
+    async def storm():
+        repository = CachedHubSpotOAuthRepository(open_repository(backend, path))
+        token_manager = TokenManager(AuthService(RotatingHubSpot(issued), repository))
+        refreshed = await asyncio.gather(
+            *(
+                token_manager.refresh("123", stale_access_token="access_0")
+                for _ in range(5)
+            )
+        )
+        return sorted({data.access_token for data in refreshed})
+
+    results.put(asyncio.run(storm()))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires fork and fcntl")
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_refresh_storm_across_processes(tmp_path, backend):
+    """Test workers refreshing one portal at once exchange its token only once."""
+    path = str(tmp_path / ("auth.db" if backend == "sqlite" else "auth"))
+    seed = replace(
+        make_oauth_data(access_token="access_0"), refresh_token="refresh_0"
+    )
+    repository = open_repository(backend, path)
+    asyncio.run(repository.save(seed))
+    repository.close()
+
+    context = multiprocessing.get_context("fork")
+    issued = context.Value("i", 0)
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=refresh_storm_worker, args=(backend, path, issued, results)
+        )
+        for _ in range(8)
+    ]
+    for process in processes:
+        process.start()
+    tokens = [results.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join(timeout=30)
+
+    assert [process.exitcode for process in processes] == [0] * 8
+    assert issued.value == 1
+    assert tokens == [["access_1"]] * 8
+    repository = open_repository(backend, path)
+    stored = asyncio.run(repository.get_by_hub_id("123"))
+    repository.close()
+    assert (stored.refresh_token, stored.version) == ("refresh_1", 1)
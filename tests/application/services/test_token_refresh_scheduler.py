@@ -0,0 +1,199 @@
+"""Tests for the background token refresh scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services.auth_service import AuthService
+from src.application.services.token_manager import TokenManager
+from src.application.services.token_refresh_scheduler import TokenRefreshScheduler
+from src.domain.exceptions import HubSpotAuthenticationError
+from src.domain.types.hubspot import HubSpotOAuthData
+
+
+class InMemoryRepository:
+    """Minimal in-memory OAuth repository."""
+
+    def __init__(self):
+        self.data: Dict[str, HubSpotOAuthData] = {}
+
+    async def save(self, data: HubSpotOAuthData) -> None:
+        self.data[data.hub_id] = data
+
+    async def get_by_hub_id(self, hub_id: str) -> Optional[HubSpotOAuthData]:
+        return self.data.get(hub_id)
+
+    async def update(self, data: HubSpotOAuthData) -> None:
+        self.data[data.hub_id] = data
+
+    async def delete(self, hub_id: str) -> None:
+        self.data.pop(hub_id, None)
+
+    async def list_all(self) -> List[HubSpotOAuthData]:
+        return list(self.data.values())
+
+
+def make_oauth_data(hub_id: str, expires_in: timedelta) -> HubSpotOAuthData:
+    """Create sample OAuth data expiring after ``expires_in``."""
+    return HubSpotOAuthData(
+        hub_id=hub_id,
+        access_token=f"access_{hub_id}",
+        refresh_token=f"refresh_{hub_id}",
+        expires_at=datetime.now() + expires_in,
+        scopes=["contacts"],
+        installed_at=datetime.now(),
+        user_id="user123",
+        app_id="app123",
+    )
+
+
+@pytest.fixture
+def repository():
+    """Create an in-memory repository."""
+    return InMemoryRepository()
+
+
+@pytest.fixture
+def mock_auth_client():
+    """Create a mock auth client issuing 30 minute tokens."""
+    client = AsyncMock()
+    client.refresh_access_token.return_value = {
+        "access_token": "new_access_token",
+        "refresh_token": "new_refresh_token",
+        "expires_in": 1800,
+    }
+    return client
+
+
+@pytest.fixture
+def scheduler(repository, mock_auth_client):
+    """Create a scheduler refreshing tokens 5 minutes before expiry."""
+    token_manager = TokenManager(AuthService(mock_auth_client, repository))
+    return TokenRefreshScheduler(
+        token_manager, margin_seconds=300, concurrency=2, retry_seconds=0.05
+    )
+
+
+async def wait_for(condition, timeout: float = 1.0) -> None:
+    """Wait until ``condition()`` is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_refreshes_tokens_within_margin(scheduler, repository, mock_auth_client):
+    """Test tokens about to expire are refreshed and others left alone."""
+    await repository.save(make_oauth_data("due", timedelta(minutes=2)))
+    await repository.save(make_oauth_data("later", timedelta(minutes=30)))
+
+    scheduler.start()
+    try:
+        await wait_for(lambda: repository.data["due"].access_token == "new_access_token")
+    finally:
+        await scheduler.stop()
+
+    mock_auth_client.refresh_access_token.assert_awaited_once_with("refresh_due")
+    assert repository.data["later"].access_token == "access_later"
+
+
+@pytest.mark.asyncio
+async def test_schedule_wakes_up_scheduler(scheduler, repository):
+    """Test scheduling a due installation wakes the running scheduler."""
+    scheduler.start()
+    try:
+        await asyncio.sleep(0.01)
+        await repository.save(make_oauth_data("new", timedelta(minutes=1)))
+        scheduler.schedule(repository.data["new"])
+
+        await wait_for(lambda: repository.data["new"].access_token == "new_access_token")
+    finally:
+        await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_bounded_concurrency(scheduler, repository, mock_auth_client):
+    """Test no more than ``concurrency`` refreshes run at once."""
+    running = 0
+    peak = 0
+
+    async def refresh_access_token(refresh_token):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return {
+            "access_token": "new_access_token",
+            "refresh_token": "new_refresh_token",
+            "expires_in": 1800,
+        }
+
+    mock_auth_client.refresh_access_token.side_effect = refresh_access_token
+    for i in range(6):
+        await repository.save(make_oauth_data(str(i), timedelta(minutes=1)))
+
+    scheduler.start()
+    try:
+        await wait_for(
+            lambda: all(
+                data.access_token == "new_access_token"
+                for data in repository.data.values()
+            )
+        )
+    finally:
+        await scheduler.stop()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_retried(scheduler, repository, mock_auth_client):
+    """Test a failed refresh is rescheduled."""
+    mock_auth_client.refresh_access_token.side_effect = [
+        HubSpotAuthenticationError("temporary"),
+        {
+            "access_token": "new_access_token",
+            "refresh_token": "new_refresh_token",
+            "expires_in": 1800,
+        },
+    ]
+    scheduler.token_manager.failure_backoff_seconds = 0
+    await repository.save(make_oauth_data("123", timedelta(minutes=1)))
+
+    scheduler.start()
+    try:
+        await wait_for(lambda: repository.data["123"].access_token == "new_access_token")
+    finally:
+        await scheduler.stop()
+
+    assert mock_auth_client.refresh_access_token.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resync_loads_only_installations_due_before_next_resync(
+    scheduler, repository
+):
+    """Test resync lists expiring installations instead of every installation."""
+    cutoffs = []
+
+    async def list_expiring(before):
+        cutoffs.append(before)
+        return [data for data in repository.data.values() if data.expires_at <= before]
+
+    repository.list_expiring = list_expiring
+    repository.list_all = AsyncMock()
+    await repository.save(make_oauth_data("due", timedelta(minutes=5, seconds=30)))
+    await repository.save(make_oauth_data("later", timedelta(minutes=30)))
+
+    await scheduler.resync()
+
+    repository.list_all.assert_not_called()
+    # The margin of 5 minutes plus the resync interval of 60 seconds
+    expected = datetime.now() + timedelta(minutes=6)
+    assert abs(cutoffs[0] - expected) < timedelta(seconds=1)
+    assert list(scheduler._scheduled) == ["due"]
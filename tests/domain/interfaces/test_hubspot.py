@@ -1,14 +1,15 @@
 """Tests for HubSpot interfaces."""
 
 import pytest
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from src.domain.interfaces.hubspot import (
     IHubSpotAuth,
     IHubSpotContactService,
     IHubSpotCompanyService,
 )
-from src.domain.types.hubspot import UserInfo, Company
+from src.domain.types.hubspot import AssociationResult, UserInfo, Company
 from src.infrastructure.hubspot.types import Contact
 
 
@@ -51,6 +52,16 @@ class MockHubSpotContactService(IHubSpotContactService):
             )
         ]
 
+    async def iter_contacts(
+        self, access_token: str, page_size: int = 100, after: Optional[str] = None
+    ) -> AsyncIterator[List[Contact]]:
+        yield await self.get_contacts(access_token, limit=page_size, after=after)
+
+    async def iter_modified_contacts(
+        self, access_token: str, since: datetime, page_size: int = 100
+    ) -> AsyncIterator[List[Contact]]:
+        yield await self.get_contacts(access_token, limit=page_size)
+
 
 class MockHubSpotCompanyService(IHubSpotCompanyService):
     """Mock implementation of IHubSpotCompanyService for testing."""
@@ -60,6 +71,20 @@ class MockHubSpotCompanyService(IHubSpotCompanyService):
     ) -> List[Company]:
         return [Company(id="456", name="Test Company")]
 
+    async def get_companies_page(
+        self,
+        access_token: str,
+        contact_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Company], Optional[str]]:
+        return [Company(id="456", name="Test Company")], None
+
+    async def get_companies_for_contacts(
+        self, access_token: str, contact_ids: List[str]
+    ) -> Dict[str, List[Company]]:
+        return {contact_id: [Company(id="456")] for contact_id in contact_ids}
+
     async def create_association(
         self, access_token: str, contact_id: str, company_id: str
     ) -> None:
@@ -70,6 +95,26 @@ class MockHubSpotCompanyService(IHubSpotCompanyService):
     ) -> None:
         pass
 
+    async def iter_companies(
+        self, access_token: str, page_size: int = 100, fields=None
+    ) -> AsyncIterator[List[Company]]:
+        yield [Company(id="456", name="Test Company")]
+
+    async def iter_modified_companies(
+        self, access_token: str, since: datetime, page_size: int = 100
+    ) -> AsyncIterator[List[Company]]:
+        yield [Company(id="456", name="Test Company")]
+
+    async def create_associations(
+        self, access_token: str, pairs: List[Tuple[str, str]]
+    ) -> List[AssociationResult]:
+        return [AssociationResult(*pair, success=True) for pair in pairs]
+
+    async def remove_associations(
+        self, access_token: str, pairs: List[Tuple[str, str]]
+    ) -> List[AssociationResult]:
+        return [AssociationResult(*pair, success=True) for pair in pairs]
+
 
 @pytest.mark.asyncio
 class TestHubSpotInterfaces:
@@ -114,6 +159,11 @@ class TestHubSpotInterfaces:
         )
         assert len(contacts) == 1
 
+        # Test iter_contacts
+        pages = [page async for page in contact_service.iter_contacts("test-token")]
+        assert len(pages) == 1
+        assert pages[0][0].id == "123"
+
     async def test_company_service_interface(self):
         """Test IHubSpotCompanyService interface methods."""
         company_service = MockHubSpotCompanyService()
@@ -0,0 +1,90 @@
+"""Tests for the adaptive concurrency limit."""
+
+import asyncio
+
+import pytest
+
+from src.domain.services.adaptive_concurrency import (
+    AdaptiveConcurrencyLimit,
+    ConcurrencyLimitExceeded,
+)
+
+
+@pytest.mark.asyncio
+async def test_calls_over_limit_wait_for_a_slot():
+    """Test a call over the limit runs once a slot is released."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=1)
+    await limit.acquire()
+
+    waiter = asyncio.create_task(limit.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert limit.queued == 1
+
+    limit.release()
+    await asyncio.wait_for(waiter, timeout=0.1)
+    assert limit.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_calls():
+    """Test calls are rejected instead of queued beyond ``max_queue``."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=1, max_queue=1)
+    await limit.acquire()
+    waiter = asyncio.create_task(limit.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        await limit.acquire()
+    assert limit.rejected == 1
+    waiter.cancel()
+
+
+@pytest.mark.asyncio
+async def test_wait_is_bounded():
+    """Test a call that waits too long for a slot is rejected."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=1, max_wait_seconds=0.01)
+    await limit.acquire()
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        await limit.acquire()
+    assert limit.queued == 0
+
+
+def test_limit_grows_additively_on_success():
+    """Test fast successful calls raise the limit slowly."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=10)
+
+    for _ in range(10):
+        limit.in_flight += 1
+        limit.release(latency=0.1)
+
+    assert 10.9 < limit.limit < 11.1
+
+
+def test_limit_shrinks_multiplicatively_on_drops():
+    """Test failures and slow calls cut the limit down to the minimum."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=20, min_limit=2, backoff_ratio=0.5)
+    limit.in_flight = 3
+
+    limit.release(latency=0.1)
+    limit.release(latency=0.1, dropped=True)
+    assert int(limit.limit) == 10
+    limit.release(latency=1.0)
+    assert int(limit.limit) == 5
+
+    for _ in range(5):
+        limit.in_flight += 1
+        limit.release(latency=0.1, dropped=True)
+    assert limit.limit == 2
+
+
+def test_release_without_outcome_keeps_limit():
+    """Test a call ending without an outcome only frees its slot."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=10)
+    limit.in_flight = 1
+
+    limit.release()
+
+    assert limit.limit == 10
+    assert limit.in_flight == 0
@@ -0,0 +1,84 @@
+"""Tests for the circuit breaker."""
+
+import pytest
+
+from src.domain.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def trip(breaker: CircuitBreaker, calls: int) -> None:
+    """Record failed calls."""
+    for _ in range(calls):
+        breaker.record(False, breaker.allow())
+
+
+def test_opens_at_failure_rate():
+    """Test the circuit opens once enough calls failed."""
+    breaker = CircuitBreaker(failure_rate=0.5, min_calls=4)
+
+    breaker.record(True, breaker.allow())
+    trip(breaker, 2)
+    assert breaker.state is CircuitState.CLOSED
+    trip(breaker, 1)
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    assert breaker.rejected == 1
+
+
+def test_half_opens_with_limited_probes_and_closes():
+    """Test successful probes close the circuit after the open period."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_calls=1, open_seconds=10, probe_calls=2, clock=clock)
+    trip(breaker, 1)
+
+    clock.now = 10
+    assert breaker.state is CircuitState.HALF_OPEN
+    probes = [breaker.allow(), breaker.allow()]
+    assert probes == [True, True]
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    for probe in probes:
+        breaker.record(True, probe)
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow() is False
+
+
+def test_failed_probe_reopens():
+    """Test a failed probe opens the circuit for another period."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_calls=1, open_seconds=10, clock=clock)
+    trip(breaker, 1)
+
+    clock.now = 10
+    breaker.record(False, breaker.allow())
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_after() == 10
+
+
+def test_cancelled_probe_frees_its_place():
+    """Test a probe ending without an outcome lets another probe through."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_calls=1, probe_calls=1, clock=clock)
+    trip(breaker, 1)
+    clock.now = breaker.open_seconds
+
+    breaker.record(None, breaker.allow())
+
+    assert breaker.allow() is True
@@ -0,0 +1,186 @@
+"""Tests for the response cache."""
+
+import asyncio
+
+import pytest
+
+from src.domain.services.response_cache import ResponseCache, approximate_size
+from src.domain.types.hubspot import Contact
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Loader:
+    """Loader returning a new numbered value on each call."""
+
+    def __init__(self, prefix: str = "value"):
+        self.prefix = prefix
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return f"{self.prefix}{self.calls}"
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Create a cache with a 10 second TTL and 20 seconds of staleness."""
+    return ResponseCache(
+        ttl_seconds=10, stale_seconds=20, max_entries=2, size_of=len, clock=clock
+    )
+
+
+@pytest.mark.asyncio
+async def test_fresh_values_are_served_from_memory(cache):
+    """Test a value is loaded once while fresh."""
+    loader = Loader()
+
+    assert await cache.get_or_load("key", loader) == "value1"
+    assert await cache.get_or_load("key", loader) == "value1"
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_value_is_served_while_revalidating(cache, clock):
+    """Test a stale value is returned immediately and reloaded in the background."""
+    loader = Loader()
+    await cache.get_or_load("key", loader)
+
+    clock.now = 15
+    assert await cache.get_or_load("key", loader) == "value1"
+    await asyncio.sleep(0.01)
+    assert await cache.get_or_load("key", loader) == "value2"
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_value_is_reloaded(cache, clock):
+    """Test a value past its stale window is reloaded before returning."""
+    loader = Loader()
+    await cache.get_or_load("key", loader)
+
+    clock.now = 31
+    assert await cache.get_or_load("key", loader) == "value2"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(cache):
+    """Test concurrent misses for a key call the loader once."""
+    loader = Loader()
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("key", loader) for _ in range(5))
+    )
+
+    assert results == ["value1"] * 5
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(cache):
+    """Test a failed load is retried on the next call."""
+
+    async def failing():
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_load("key", failing)
+    assert await cache.get_or_load("key", Loader()) == "value1"
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(cache):
+    """Test the entry count limit evicts the least recently used key."""
+    await cache.get_or_load("a", Loader("a"))
+    await cache.get_or_load("b", Loader("b"))
+    await cache.get_or_load("a", Loader("unused"))
+    await cache.get_or_load("c", Loader("c"))
+
+    assert len(cache) == 2
+    assert await cache.get_or_load("a", Loader("reloaded")) == "a1"
+    assert await cache.get_or_load("b", Loader("reloaded")) == "reloaded1"
+
+
+@pytest.mark.asyncio
+async def test_memory_cap(clock):
+    """Test entries are evicted to stay under the memory cap."""
+    cache = ResponseCache(max_bytes=10, size_of=len, clock=clock)
+
+    await cache.get_or_load("a", Loader("aaaa"))
+    await cache.get_or_load("b", Loader("bbbb"))
+    await cache.get_or_load("c", Loader("cccc"))
+
+    assert len(cache) == 2
+    assert cache.size == 10
+
+
+@pytest.mark.asyncio
+async def test_invalidate_group(cache):
+    """Test invalidating a group drops every key in it."""
+    loader = Loader()
+    await cache.get_or_load(("contact", 1), loader, group="contact")
+    await cache.get_or_load(("contact", 2), loader, group="contact")
+
+    cache.invalidate_group("contact")
+
+    assert len(cache) == 0
+    assert await cache.get_or_load(("contact", 1), loader, group="contact") == "value3"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_discards_load_in_flight(cache):
+    """Test a load started before an invalidation is not cached."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await release.wait()
+        return "old"
+
+    load = asyncio.create_task(cache.get_or_load("key", slow, group="group"))
+    await started.wait()
+    cache.invalidate_group("group")
+    release.set()
+
+    assert await load == "old"
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_stale_serves_expired_value(cache, clock):
+    """Test an expired value stays available to get_stale until reloaded."""
+    await cache.get_or_load("key", Loader())
+    clock.now = 100
+
+    async def failing_loader():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("key", failing_loader)
+
+    assert cache.get_stale("key") == "value1"
+    assert cache.get_stale("missing") is None
+
+
+def test_approximate_size_counts_slotted_fields():
+    """Test the fields of slotted objects are included in their size."""
+    small = Contact(id="1", name="", email="", phone="")
+    large = Contact(id="1", name="x" * 1000, email="", phone="")
+
+    assert approximate_size(large) - approximate_size(small) >= 1000
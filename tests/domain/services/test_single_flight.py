@@ -0,0 +1,125 @@
+"""Tests for request coalescing."""
+
+import asyncio
+
+import pytest
+
+from src.domain.services.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Test concurrent callers for the same key share a single call."""
+    group = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    waiters = [asyncio.create_task(group.do("key", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["result"] * 5
+    assert calls == 1
+    assert not group.in_flight("key")
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    """Test calls for different keys are not coalesced."""
+    group = SingleFlight()
+
+    async def work(value):
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        group.do("a", lambda: work("a")), group.do("b", lambda: work("b"))
+    )
+
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters():
+    """Test every waiter receives the shared call's exception."""
+    group = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        group.do("key", fail), group.do("key", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others():
+    """Test cancelling one waiter leaves the call running for the rest."""
+    group = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(group.do("key", work))
+    second = asyncio.create_task(group.do("key", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_abandoned_call_is_cancelled():
+    """Test the call is cancelled once every waiter has gone."""
+    group = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiter = asyncio.create_task(group.do("key", work))
+    await started.wait()
+    waiter.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_abandoned_call_completes_when_configured():
+    """Test calls run to completion when cancel_when_abandoned is False."""
+    group = SingleFlight(cancel_when_abandoned=False)
+    started = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.01)
+        finished.set()
+
+    waiter = asyncio.create_task(group.do("key", work))
+    await started.wait()
+    waiter.cancel()
+
+    await asyncio.wait_for(finished.wait(), timeout=1)
@@ -0,0 +1,78 @@
+"""Tests for the prioritised token bucket."""
+
+import asyncio
+
+import pytest
+
+from src.domain.services.token_bucket import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_acquire_is_immediate_while_tokens_remain():
+    """Test callers do not wait while the bucket has tokens."""
+    bucket = TokenBucket(capacity=3, refill_per_second=0.001)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(bucket.acquire() for _ in range(3))), timeout=0.1
+    )
+
+    assert bucket.tokens < 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_by_priority_then_arrival():
+    """Test a lower priority value is served first, ties in arrival order."""
+    bucket = TokenBucket(capacity=1, refill_per_second=100)
+    await bucket.acquire()
+    order = []
+
+    async def take(name, priority):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(take("background-1", 1)),
+        asyncio.create_task(take("interactive-1", 0)),
+        asyncio.create_task(take("background-2", 1)),
+        asyncio.create_task(take("interactive-2", 0)),
+    ]
+    await asyncio.gather(*tasks)
+
+    assert order == ["interactive-1", "interactive-2", "background-1", "background-2"]
+
+
+@pytest.mark.asyncio
+async def test_calibrate_caps_tokens_to_remaining():
+    """Test recalibration never leaves more tokens than the server reports."""
+    bucket = TokenBucket(capacity=100, refill_per_second=10)
+
+    bucket.calibrate(capacity=50, refill_per_second=5, remaining=2)
+
+    assert bucket.capacity == 50
+    assert bucket.tokens < 3
+
+
+@pytest.mark.asyncio
+async def test_pause_holds_back_tokens():
+    """Test no token is handed out while the bucket is paused."""
+    bucket = TokenBucket(capacity=5, refill_per_second=100)
+    bucket.pause(0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(bucket.acquire(), timeout=0.01)
+    await asyncio.wait_for(bucket.acquire(), timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_consume_token():
+    """Test a cancelled waiter is skipped and the next one is served."""
+    bucket = TokenBucket(capacity=1, refill_per_second=50)
+    await bucket.acquire()
+
+    cancelled = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    served = asyncio.create_task(bucket.acquire())
+
+    await asyncio.wait_for(served, timeout=0.5)
+    assert cancelled.cancelled()
@@ -196,3 +196,51 @@ async def test_verify_request_valid():
         method=method, url=url, body=body, timestamp=timestamp, signature=signature
     )
     assert result is True
+
+
+def test_verify_bytes(verifier):
+    """Test the synchronous bytes path accepts a valid signature."""
+    timestamp = str(int(time.time() * 1000)).encode()
+    url = b"https://example.com/contacts%3Fa%3D1"
+    body = b'{"test": "data"}'
+    digest = hmac.new(
+        b"test_secret",
+        b"POST" + b"https://example.com/contacts?a=1" + body + timestamp,
+        hashlib.sha256,
+    ).digest()
+
+    signature = base64.b64encode(digest)
+
+    assert verifier.verify(b"POST", url, body, timestamp, signature)
+    assert not verifier.verify(b"POST", url, body + b" ", timestamp, signature)
+
+
+def test_verify_rejects_malformed_input(verifier):
+    """Test malformed timestamps and signatures are rejected."""
+    timestamp = str(int(time.time() * 1000)).encode()
+
+    assert not verifier.verify(b"GET", b"/", b"", b"not-a-number", b"c2ln")
+    assert not verifier.verify(b"GET", b"/", b"", timestamp, b"not base64!")
+    assert not verifier.verify(b"GET", b"/", b"", timestamp, None)
+
+
+def test_verify_rejects_signature_with_stray_characters(verifier):
+    """Test characters outside base64 are not skipped when decoding."""
+    timestamp = str(int(time.time() * 1000)).encode()
+    digest = hmac.new(b"test_secret", b"GET/" + timestamp, hashlib.sha256).digest()
+    signature = base64.b64encode(digest)
+
+    assert verifier.verify(b"GET", b"/", b"", timestamp, signature)
+    assert not verifier.verify(
+        b"GET", b"/", b"", timestamp, signature[:8] + b"!*" + signature[8:]
+    )
+
+
+def test_url_is_decoded_once(verifier):
+    """Test an encoded percent sign is not decoded a second time."""
+    timestamp = str(int(time.time() * 1000)).encode()
+    digest = hmac.new(b"test_secret", b"GET/a%2Fb" + timestamp, hashlib.sha256).digest()
+
+    signature = base64.b64encode(digest)
+
+    assert verifier.verify(b"GET", b"/a%252Fb", b"", timestamp, signature)
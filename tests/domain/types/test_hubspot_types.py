@@ -1,6 +1,6 @@
 import pytest
 
-from src.domain.types.hubspot import UserInfo, Company
+from src.domain.types.hubspot import Company, Contact, UserInfo
 
 
 class TestUserInfo:
@@ -104,5 +104,31 @@ class TestCompany:
             "id": "123",
         }
 
-        with pytest.raises(TypeError):
+        with pytest.raises(TypeError, match="name"):
             Company.from_dict(data)
+
+    def test_instances_are_slotted(self):
+        """Test instances carry no per-instance __dict__."""
+        company = Company(id="123", name="Test Company")
+
+        assert not hasattr(company, "__dict__")
+        with pytest.raises(AttributeError):
+            company.unknown = True
+
+
+class TestContact:
+    """Test cases for Contact domain type."""
+
+    def test_create_from_dict(self):
+        """Test creating Contact from dictionary."""
+        contact = Contact.from_dict(
+            {"id": "1", "name": "Ann", "email": "a@x.com", "phone": "1", "extra": 1}
+        )
+
+        assert contact == Contact(id="1", name="Ann", email="a@x.com", phone="1")
+        assert contact.properties == {}
+
+    def test_create_from_dict_missing_required_fields(self):
+        """Test the missing fields are named in the error."""
+        with pytest.raises(TypeError, match="email"):
+            Contact.from_dict({"id": "1", "name": "Ann", "phone": "1"})
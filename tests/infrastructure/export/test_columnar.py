@@ -0,0 +1,136 @@
+"""Tests for the columnar exporter."""
+
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from src.domain.types.hubspot import Company, Contact
+from src.infrastructure.export.columnar import ColumnarExporter, open_parquet_writer
+
+COLUMNS = ["id", "name", "email", "jobtitle"]
+
+
+async def pages(count: int, page_size: int = 3):
+    """Yield pages of numbered contacts."""
+    for start in range(0, count, page_size):
+        yield [
+            Contact(
+                id=str(index),
+                name=f"Name, {index}",
+                email=f"{index}@x.com",
+                phone="",
+                properties={"jobtitle": "CTO"} if index % 2 else {},
+            )
+            for index in range(start, min(start + page_size, count))
+        ]
+
+
+async def read(exporter: ColumnarExporter, *args) -> List[bytes]:
+    """Collect the chunks of an export."""
+    return [chunk async for chunk in exporter.stream(*args)]
+
+
+@pytest.fixture
+def exporter():
+    """Create an exporter encoding on a thread pool."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield ColumnarExporter(batch_rows=4, executor=executor)
+
+
+@pytest.mark.asyncio
+async def test_csv_is_streamed_per_batch(exporter):
+    """Test each batch becomes one chunk and the header is written once."""
+    chunks = await read(exporter, pages(10), COLUMNS, "csv")
+
+    # Pages of 3 fill batches of at least 4 rows: 6, then 4
+    assert len(chunks) == 2
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == COLUMNS
+    assert [row[0] for row in rows[1:]] == [str(index) for index in range(10)]
+    assert rows[1] == ["0", "Name, 0", "0@x.com", ""]
+    assert rows[2][3] == "CTO"
+
+
+@pytest.mark.asyncio
+async def test_csv_without_rows_has_header(exporter):
+    """Test an empty export still has its header row."""
+    chunks = await read(exporter, pages(0), COLUMNS, "csv")
+
+    assert b"".join(chunks) == b"id,name,email,jobtitle\r\n"
+
+
+@pytest.mark.asyncio
+async def test_csv_is_encoded_in_worker_processes():
+    """Test batches pickle to and from a process pool that does not fork."""
+    exporter = ColumnarExporter(max_workers=1, batch_rows=2)
+    try:
+        chunks = await read(exporter, pages(5), COLUMNS, "csv")
+        start_method = exporter.executor._mp_context.get_start_method()
+    finally:
+        exporter.close()
+
+    assert b"".join(chunks).count(b"\r\n") == 6
+    assert start_method in ("forkserver", "spawn")
+
+
+@pytest.mark.asyncio
+async def test_companies_are_exported(exporter):
+    """Test companies export their fields like contacts."""
+
+    async def company_pages():
+        yield [Company(id="1", name="Acme", domain="acme.com")]
+
+    chunks = await read(exporter, company_pages(), ["id", "name", "domain"], "csv")
+
+    assert b"".join(chunks) == b"id,name,domain\r\n1,Acme,acme.com\r\n"
+
+
+@pytest.mark.asyncio
+async def test_parquet_has_a_row_group_per_batch(exporter):
+    """Test the Parquet file holds every row, a row group per batch."""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    chunks = await read(exporter, pages(10), COLUMNS, "parquet")
+
+    # One chunk per row group, then the footer
+    assert len(chunks) == 3
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column_names == COLUMNS
+    assert table.column("id").to_pylist() == [str(index) for index in range(10)]
+    assert table.column("jobtitle").to_pylist()[:2] == [None, "CTO"]
+
+
+@pytest.mark.asyncio
+async def test_parquet_is_streamed_as_pages_arrive(exporter):
+    """Test row groups are sent before later pages are fetched."""
+    pytest.importorskip("pyarrow.parquet")
+    fetched = []
+
+    async def counted_pages():
+        async for page in pages(30):
+            fetched.append(len(page))
+            yield page
+
+    stream = exporter.stream(counted_pages(), COLUMNS, "parquet")
+    first_chunk = await anext(stream)
+    await stream.aclose()
+
+    assert first_chunk.startswith(b"PAR1")
+    # The first row group is sent while the third batch is being fetched
+    assert sum(fetched) < 30
+
+
+def test_parquet_writer_needs_pyarrow():
+    """Test Parquet encoding fails clearly without pyarrow."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            open_parquet_writer(["id"], "zstd")
+    else:
+        pytest.skip("pyarrow is installed")
@@ -0,0 +1,340 @@
+"""Tests for the async HubSpot company service."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.domain.exceptions import HubSpotAuthenticationError, HubSpotOperationError
+from src.infrastructure.hubspot.company_service import HubSpotCompanyService
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+
+
+def make_service(handler) -> HubSpotCompanyService:
+    """Create a company service backed by a mock transport."""
+    return HubSpotCompanyService(
+        http_client=HubSpotHttpClient(
+            http2=False, warmup=False, transport=httpx.MockTransport(handler)
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_companies_associated_with_contact():
+    """Test associations are resolved to companies with a batch read."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(
+                200, json={"results": [{"toObjectId": 11}, {"toObjectId": 12}]}
+            )
+        assert json.loads(request.content) == {
+            "properties": ["name", "domain", "industry", "phone"],
+            "inputs": [{"id": "11"}, {"id": "12"}],
+        }
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"id": "11", "properties": {"name": "Acme", "domain": "acme.com"}},
+                    {"id": "12", "properties": {"name": "Globex"}},
+                ]
+            },
+        )
+
+    service = make_service(handler)
+    companies = await service.get_companies_associated_with_contact("token", "1")
+
+    assert [company.id for company in companies] == ["11", "12"]
+    assert companies[0].domain == "acme.com"
+    assert all(company.associated for company in companies)
+    assert requests[0].url.path == "/crm/v4/objects/contacts/1/associations/companies"
+    assert requests[0].url.params["limit"] == "500"
+    assert requests[1].url.path == "/crm/v3/objects/companies/batch/read"
+
+
+def paged_associations(request: httpx.Request, total: int) -> httpx.Response:
+    """Serve ``total`` associations in pages chained by numeric cursors."""
+    start = int(request.url.params.get("after", "0"))
+    end = min(start + int(request.url.params["limit"]), total)
+    body = {"results": [{"toObjectId": i} for i in range(start, end)]}
+    if end < total:
+        body["paging"] = {"next": {"after": str(end)}}
+    return httpx.Response(200, json=body)
+
+
+@pytest.mark.asyncio
+async def test_get_companies_follows_association_pages():
+    """Test every association page is read and companies are read alongside."""
+    events = []
+
+    async def handler(request):
+        if request.method == "GET":
+            await asyncio.sleep(0.01)
+            events.append(("page", request.url.params.get("after")))
+            return paged_associations(request, total=1000)
+        ids = [item["id"] for item in json.loads(request.content)["inputs"]]
+        events.append(("read", ids[0]))
+        return httpx.Response(
+            200, json={"results": [{"id": id, "properties": {}} for id in ids]}
+        )
+
+    service = make_service(handler)
+    companies, after = await service.get_companies_page("token", "1")
+
+    assert [company.id for company in companies] == [str(i) for i in range(1000)]
+    assert after is None
+    pages = [event for event in events if event[0] == "page"]
+    assert pages == [("page", None), ("page", "500")]
+    # The first page's companies are read before the second page arrives
+    assert events.index(("read", "0")) < events.index(("page", "500"))
+    assert len(events) == 12
+
+
+@pytest.mark.asyncio
+async def test_get_companies_page_with_limit():
+    """Test a limit stops paging and returns the cursor of the next page."""
+    requests = []
+
+    def handler(request):
+        if request.method == "GET":
+            requests.append(request)
+            return paged_associations(request, total=1000)
+        ids = [item["id"] for item in json.loads(request.content)["inputs"]]
+        return httpx.Response(
+            200, json={"results": [{"id": id, "properties": {}} for id in ids]}
+        )
+
+    service = make_service(handler)
+    companies, after = await service.get_companies_page(
+        "token", "1", limit=20, after="100"
+    )
+
+    assert [company.id for company in companies] == [str(i) for i in range(100, 120)]
+    assert after == "120"
+    assert len(requests) == 1
+    assert requests[0].url.params["limit"] == "20"
+
+
+@pytest.mark.asyncio
+async def test_get_companies_without_associations():
+    """Test no batch read is made when the contact has no companies."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"results": []})
+
+    service = make_service(handler)
+
+    assert await service.get_companies_associated_with_contact("token", "1") == []
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_companies_for_contacts():
+    """Test companies shared between contacts are read once, in chunks."""
+    company_reads = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        if request.url.path == "/crm/v4/associations/contacts/companies/batch/read":
+            assert body == {"inputs": [{"id": "1"}, {"id": "2"}, {"id": "3"}]}
+            return httpx.Response(
+                207,
+                json={
+                    "results": [
+                        {
+                            "from": {"id": "1"},
+                            "to": [{"toObjectId": i} for i in range(150)],
+                        },
+                        {"from": {"id": "2"}, "to": [{"toObjectId": 7}]},
+                    ],
+                    "errors": [{"status": "error", "context": {"fromObjectId": ["3"]}}],
+                },
+            )
+        company_reads.append([item["id"] for item in body["inputs"]])
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"id": item["id"], "properties": {"name": f"Co {item['id']}"}}
+                    for item in body["inputs"]
+                ]
+            },
+        )
+
+    service = make_service(handler)
+    companies = await service.get_companies_for_contacts("token", ["1", "2", "3", "1"])
+
+    assert list(companies) == ["1", "2", "3"]
+    assert len(companies["1"]) == 150
+    assert [company.name for company in companies["2"]] == ["Co 7"]
+    assert companies["3"] == []
+    assert sorted(len(chunk) for chunk in company_reads) == [50, 100]
+
+
+@pytest.mark.asyncio
+async def test_get_companies_for_contacts_follows_association_pages():
+    """Test a contact whose associations span pages gets all its companies."""
+    pages = []
+
+    def handler(request):
+        if request.method == "GET":
+            assert request.url.path == (
+                "/crm/v4/objects/contacts/1/associations/companies"
+            )
+            pages.append(request.url.params["after"])
+            return paged_associations(request, total=700)
+        body = json.loads(request.content)
+        if request.url.path == "/crm/v4/associations/contacts/companies/batch/read":
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "from": {"id": "1"},
+                            "to": [{"toObjectId": i} for i in range(500)],
+                            "paging": {"next": {"after": "500"}},
+                        },
+                        {"from": {"id": "2"}, "to": [{"toObjectId": 650}]},
+                    ]
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"id": item["id"], "properties": {}} for item in body["inputs"]
+                ]
+            },
+        )
+
+    service = make_service(handler)
+    companies = await service.get_companies_for_contacts("token", ["1", "2"])
+
+    assert [company.id for company in companies["1"]] == [
+        str(i) for i in range(700)
+    ]
+    assert [company.id for company in companies["2"]] == ["650"]
+    assert pages == ["500"]
+
+
+@pytest.mark.asyncio
+async def test_iter_companies_follows_pages():
+    """Test every company is listed with only the requested properties."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        after = request.url.params.get("after")
+        body = {"results": [{"id": "2" if after else "1", "properties": {}}]}
+        if not after:
+            body["paging"] = {"next": {"after": "2"}}
+        return httpx.Response(200, json=body)
+
+    service = make_service(handler)
+    pages = [
+        [company.id for company in page]
+        async for page in service.iter_companies("token", fields=["hs_object_id"])
+    ]
+
+    assert pages == [["1"], ["2"]]
+    assert requests[0].url.path == "/crm/v3/objects/companies"
+    assert requests[0].url.params.get_list("properties") == ["hs_object_id"]
+    assert requests[1].url.params["after"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_create_and_remove_association():
+    """Test association create and remove hit the v4 endpoints."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(204 if request.method == "DELETE" else 200, json={})
+
+    service = make_service(handler)
+    await service.create_association("token", "1", "11")
+    await service.remove_association("token", "1", "11")
+
+    assert requests[0].method == "PUT"
+    assert json.loads(requests[0].content) == [
+        {"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 1}
+    ]
+    assert requests[1].method == "DELETE"
+    assert all(
+        request.url.path == "/crm/v4/objects/contacts/1/associations/companies/11"
+        for request in requests
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_associations_reports_each_pair():
+    """Test pairs missing from a partial batch response are reported failed."""
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            207,
+            json={
+                "results": [{"fromObjectId": 1, "toObjectId": 11}],
+                "errors": [{"message": "Company 12 not found"}],
+            },
+        )
+
+    service = make_service(handler)
+    results = await service.create_associations(
+        "token", [("1", "11"), ("1", "12"), ("1", "11")]
+    )
+
+    assert requests[0]["inputs"][0] == {
+        "from": {"id": "1"},
+        "to": {"id": "11"},
+        "types": [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 1}],
+    }
+    assert [(r.company_id, r.success, r.error) for r in results] == [
+        ("11", True, None),
+        ("12", False, "Company 12 not found"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_remove_associations_in_chunks():
+    """Test pairs are archived in chunks and a failed chunk fails only its pairs."""
+    requests = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append(body)
+        if body["inputs"][0]["from"]["id"] == "0":
+            return httpx.Response(500)
+        return httpx.Response(204)
+
+    service = make_service(handler)
+    pairs = [(str(i // 2), str(i)) for i in range(1500)]
+    results = await service.remove_associations("token", pairs)
+
+    assert len(requests) == 2
+    assert requests[0]["inputs"][0] == {
+        "from": {"id": "0"},
+        "to": [{"id": "0"}, {"id": "1"}],
+    }
+    assert [result.success for result in results] == [False] * 1000 + [True] * 500
+    assert results[0].error.startswith("Failed to remove associations")
+
+
+@pytest.mark.asyncio
+async def test_errors_are_mapped():
+    """Test HTTP errors are mapped to domain exceptions."""
+    service = make_service(lambda request: httpx.Response(401))
+    with pytest.raises(HubSpotAuthenticationError):
+        await service.get_companies_associated_with_contact("token", "1")
+
+    service = make_service(lambda request: httpx.Response(500))
+    with pytest.raises(HubSpotOperationError):
+        await service.create_association("token", "1", "11")
@@ -0,0 +1,139 @@
+"""Tests for the HubSpot contact service."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from src.domain.exceptions import HubSpotAuthenticationError
+from src.infrastructure.hubspot.contact_service import HubSpotContactService
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+
+
+def make_service(handler) -> HubSpotContactService:
+    """Create a contact service backed by a mock transport."""
+    return HubSpotContactService(
+        http_client=HubSpotHttpClient(
+            http2=False, warmup=False, transport=httpx.MockTransport(handler)
+        )
+    )
+
+
+def contacts_page(request: httpx.Request, pages: int = 3) -> httpx.Response:
+    """Serve ``pages`` pages of two contacts each, chained by cursors."""
+    page = int(request.url.params.get("after", "0"))
+    body = {
+        "results": [
+            {
+                "id": f"{page}-{i}",
+                "properties": {"firstname": "Ada", "lastname": str(i), "email": ""},
+            }
+            for i in range(2)
+        ]
+    }
+    if page + 1 < pages:
+        body["paging"] = {"next": {"after": str(page + 1)}}
+    return httpx.Response(200, json=body)
+
+
+@pytest.mark.asyncio
+async def test_get_contacts():
+    """Test a single page of contacts is mapped to domain objects."""
+    service = make_service(contacts_page)
+
+    contacts = await service.get_contacts("token", limit=2)
+
+    assert [contact.id for contact in contacts] == ["0-0", "0-1"]
+    assert contacts[1].name == "Ada 1"
+
+
+@pytest.mark.asyncio
+async def test_iter_contacts_follows_cursors():
+    """Test every page is returned in order."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return contacts_page(request)
+
+    service = make_service(handler)
+    pages = [page async for page in service.iter_contacts("token", page_size=2)]
+
+    assert [[contact.id for contact in page] for page in pages] == [
+        ["0-0", "0-1"],
+        ["1-0", "1-1"],
+        ["2-0", "2-1"],
+    ]
+    assert [request.url.params.get("after") for request in requests] == [
+        None,
+        "1",
+        "2",
+    ]
+    assert all(request.url.params["limit"] == "2" for request in requests)
+
+
+@pytest.mark.asyncio
+async def test_iter_contacts_reads_ahead_and_cancels_on_close():
+    """Test the next page is requested early and abandoned when closed."""
+    requested = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        requested.append(request.url.params.get("after"))
+        if request.url.params.get("after"):
+            await release.wait()
+        return contacts_page(request, pages=100)
+
+    service = make_service(handler)
+    pages = service.iter_contacts("token")
+
+    await anext(pages)
+    await asyncio.sleep(0.01)
+    assert requested == [None, "1"]
+
+    await pages.aclose()
+    await asyncio.sleep(0.01)
+    assert requested == [None, "1"]
+
+
+@pytest.mark.asyncio
+async def test_iter_contacts_invalid_token():
+    """Test a 401 is raised as an authentication error."""
+    service = make_service(lambda request: httpx.Response(401))
+
+    with pytest.raises(HubSpotAuthenticationError):
+        async for _ in service.iter_contacts("token"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_iter_modified_contacts():
+    """Test modified contacts are searched and carry their modification time."""
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "id": "1",
+                        "properties": {
+                            "firstname": "Ada",
+                            "lastmodifieddate": "2024-05-01T10:00:00Z",
+                        },
+                    }
+                ]
+            },
+        )
+
+    service = make_service(handler)
+    since = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    pages = [page async for page in service.iter_modified_contacts("token", since)]
+
+    assert pages[0][0].name == "Ada"
+    assert pages[0][0].properties == {"lastmodifieddate": "2024-05-01T10:00:00Z"}
+    assert "lastmodifieddate" in bodies[0]["properties"]
@@ -0,0 +1,107 @@
+"""Tests for the shared HubSpot HTTP client."""
+
+import httpx
+import pytest
+
+from src.domain.exceptions import HubSpotAuthenticationError, HubSpotOperationError
+from src.infrastructure.hubspot.contact_service import HubSpotContactService
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+
+
+def make_http_client(handler) -> HubSpotHttpClient:
+    """Create a client backed by a mock transport."""
+    return HubSpotHttpClient(
+        http2=False, warmup=False, transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_across_requests():
+    """Test the underlying httpx client is shared between calls."""
+    http_client = make_http_client(lambda request: httpx.Response(200, json={}))
+
+    first = http_client.client
+    await http_client.request("GET", "https://api.hubapi.com/test")
+    await http_client.request("GET", "https://api.hubapi.com/test")
+
+    assert http_client.client is first
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_recreated_after_close():
+    """Test the client is lazily recreated after being closed."""
+    http_client = make_http_client(lambda request: httpx.Response(200, json={}))
+
+    first = http_client.client
+    await http_client.aclose()
+
+    assert http_client.client is not first
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_start_warms_up_connection():
+    """Test start sends a warm-up request to HubSpot."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(404)
+
+    http_client = HubSpotHttpClient(
+        http2=False, warmup=True, transport=httpx.MockTransport(handler)
+    )
+    await http_client.start()
+
+    assert len(requests) == 1
+    assert requests[0].url.host == "api.hubapi.com"
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_contact_service_uses_shared_client():
+    """Test the contact service sends requests through the shared client."""
+
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer token"
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "id": "1",
+                        "properties": {
+                            "firstname": "Ada",
+                            "lastname": "Lovelace",
+                            "email": "ada@example.com",
+                            "phone": "123",
+                        },
+                    }
+                ]
+            },
+        )
+
+    service = HubSpotContactService(http_client=make_http_client(handler))
+    contacts = await service.get_contacts("token")
+
+    assert len(contacts) == 1
+    assert contacts[0].name == "Ada Lovelace"
+    await service.http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_contact_service_maps_errors():
+    """Test HTTP errors are mapped to domain exceptions."""
+    service = HubSpotContactService(
+        http_client=make_http_client(lambda request: httpx.Response(401))
+    )
+    with pytest.raises(HubSpotAuthenticationError):
+        await service.get_contacts("token")
+
+    def raise_connect_error(request):
+        raise httpx.ConnectError("connection refused")
+
+    service = HubSpotContactService(http_client=make_http_client(raise_connect_error))
+    with pytest.raises(HubSpotOperationError):
+        await service.get_contacts("token")
@@ -0,0 +1,73 @@
+"""Tests for HubSpot property helpers."""
+
+import httpx
+import pytest
+
+from src.domain.exceptions import HubSpotAuthenticationError
+from src.infrastructure.hubspot.contact_service import CONTACT_FIELD_PROPERTIES
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+from src.infrastructure.hubspot.properties import (
+    HubSpotPropertyService,
+    extra_properties,
+    resolve_properties,
+)
+
+
+def test_resolve_properties_defaults_to_every_field():
+    """Test no fields requests every domain property."""
+    assert resolve_properties(None, CONTACT_FIELD_PROPERTIES) == [
+        "firstname",
+        "lastname",
+        "email",
+        "phone",
+    ]
+
+
+def test_resolve_properties_for_fields():
+    """Test domain fields are expanded and other fields passed through."""
+    assert resolve_properties(["name", "jobtitle"], CONTACT_FIELD_PROPERTIES) == [
+        "firstname",
+        "lastname",
+        "jobtitle",
+    ]
+
+
+def test_extra_properties():
+    """Test only requested properties that are not domain fields are kept."""
+    properties = {"firstname": "Ada", "jobtitle": "CTO", "city": "London"}
+
+    assert extra_properties(
+        properties, ["name", "jobtitle", "country"], CONTACT_FIELD_PROPERTIES
+    ) == {"jobtitle": "CTO", "country": None}
+    assert extra_properties(properties, None, CONTACT_FIELD_PROPERTIES) == {}
+
+
+def make_service(handler) -> HubSpotPropertyService:
+    """Create a property service backed by a mock transport."""
+    return HubSpotPropertyService(
+        http_client=HubSpotHttpClient(
+            http2=False, warmup=False, transport=httpx.MockTransport(handler)
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_property_names():
+    """Test property names are read from the schema endpoint."""
+
+    def handler(request):
+        assert request.url.path == "/crm/v3/properties/companies"
+        return httpx.Response(200, json={"results": [{"name": "name"}, {"name": "x"}]})
+
+    service = make_service(handler)
+
+    assert await service.get_property_names("token", "companies") == ["name", "x"]
+
+
+@pytest.mark.asyncio
+async def test_get_property_names_invalid_token():
+    """Test a 401 is raised as an authentication error."""
+    service = make_service(lambda request: httpx.Response(401))
+
+    with pytest.raises(HubSpotAuthenticationError):
+        await service.get_property_names("token", "contacts")
@@ -0,0 +1,160 @@
+"""Tests for the per-portal HubSpot rate limiter."""
+
+import httpx
+import pytest
+
+from src.domain.exceptions import HubSpotOperationError
+from src.domain.services.request_context import (
+    Priority,
+    portal_context,
+    priority_context,
+)
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+from src.infrastructure.hubspot.rate_limiter import HubSpotRateLimiter
+
+URL = "https://api.hubapi.com/crm/v3/objects/contacts"
+
+
+def make_http_client(handler, rate_limiter, max_retries=3) -> HubSpotHttpClient:
+    """Create a rate-limited client backed by a mock transport."""
+    return HubSpotHttpClient(
+        http2=False,
+        warmup=False,
+        transport=httpx.MockTransport(handler),
+        rate_limiter=rate_limiter,
+        max_retries=max_retries,
+    )
+
+
+@pytest.mark.asyncio
+async def test_buckets_are_per_portal():
+    """Test each portal gets its own bucket, keyed by the portal context."""
+    limiter = HubSpotRateLimiter()
+    http_client = make_http_client(lambda request: httpx.Response(200), limiter)
+
+    with portal_context("hub-1"):
+        await http_client.request("GET", URL)
+    with portal_context("hub-2"):
+        await http_client.request("GET", URL)
+
+    assert limiter.bucket("hub-1") is not limiter.bucket("hub-2")
+    assert limiter.metrics()["portals"] == 2
+    assert limiter.metrics()["lanes"]["interactive"]["requests"] == 2
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bucket_is_calibrated_from_headers():
+    """Test the rate-limit headers of a response resize the portal's bucket."""
+    limiter = HubSpotRateLimiter(max_requests=100, interval_seconds=10)
+    headers = {
+        "X-HubSpot-RateLimit-Max": "190",
+        "X-HubSpot-RateLimit-Interval-Milliseconds": "10000",
+        "X-HubSpot-RateLimit-Remaining": "4",
+    }
+    http_client = make_http_client(
+        lambda request: httpx.Response(200, headers=headers), limiter
+    )
+
+    with portal_context("hub-1"):
+        await http_client.request("GET", URL)
+
+    bucket = limiter.bucket("hub-1")
+    assert bucket.capacity == 190
+    assert bucket.refill_per_second == pytest.approx(19)
+    assert bucket.tokens < 5
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_processes_share_the_limits():
+    """Test limiters in several processes together keep to a portal's limits."""
+    now = 0.0
+    limiters = [
+        HubSpotRateLimiter(max_requests=100, processes=4, clock=lambda: now)
+        for _ in range(4)
+    ]
+    headers = {
+        "X-HubSpot-RateLimit-Max": "190",
+        "X-HubSpot-RateLimit-Interval-Milliseconds": "10000",
+        "X-HubSpot-RateLimit-Remaining": "40",
+    }
+
+    assert sum(limiter.bucket("hub-1").tokens for limiter in limiters) == 100
+    for limiter in limiters:
+        limiter.observe("hub-1", httpx.Response(200, headers=headers))
+
+    buckets = [limiter.bucket("hub-1") for limiter in limiters]
+    assert sum(bucket.capacity for bucket in buckets) == 190
+    assert sum(bucket.refill_per_second for bucket in buckets) == pytest.approx(19)
+    assert sum(bucket.tokens for bucket in buckets) == 40
+
+
+def test_process_share_is_at_least_one_request():
+    """Test a portal can still be called with more processes than requests."""
+    limiter = HubSpotRateLimiter(max_requests=10, processes=20)
+
+    assert limiter.bucket("hub-1").capacity == 1
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_is_retried_after_retry_after():
+    """Test a 429 pauses the portal for Retry-After and is then retried."""
+    limiter = HubSpotRateLimiter()
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.05"}),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    http_client = make_http_client(lambda request: responses.pop(0), limiter)
+
+    with portal_context("hub-1"):
+        response = await http_client.request("GET", URL)
+
+    assert response.status_code == 200
+    assert limiter.throttled == 1
+    lane = limiter.metrics()["lanes"]["interactive"]
+    assert lane["requests"] == 2
+    assert lane["wait_seconds_max"] >= 0.05
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_throttled_response_returned_after_retries():
+    """Test the last 429 is returned once the retries are used up."""
+    limiter = HubSpotRateLimiter(backoff_seconds=0.001)
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429)
+
+    http_client = make_http_client(handler, limiter, max_retries=2)
+
+    response = await http_client.request("GET", URL)
+
+    assert response.status_code == 429
+    assert calls == 3
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_background_requests_keep_out_of_daily_reserve():
+    """Test background work fails fast once the daily allowance is reserved."""
+    limiter = HubSpotRateLimiter(daily_reserve=10)
+    http_client = make_http_client(
+        lambda request: httpx.Response(
+            200, headers={"X-HubSpot-RateLimit-Daily-Remaining": "10"}
+        ),
+        limiter,
+    )
+
+    with portal_context("hub-1"):
+        await http_client.request("GET", URL)
+        with priority_context(Priority.BACKGROUND):
+            with pytest.raises(HubSpotOperationError):
+                await http_client.request("GET", URL)
+        response = await http_client.request("GET", URL)
+
+    assert response.status_code == 200
+    await http_client.aclose()
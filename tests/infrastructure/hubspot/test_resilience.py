@@ -0,0 +1,87 @@
+"""Tests for the HubSpot upstream guard."""
+
+import httpx
+import pytest
+
+from src.domain.exceptions import HubSpotUnavailableError
+from src.domain.services.circuit_breaker import CircuitBreaker
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+from src.infrastructure.hubspot.resilience import (
+    HubSpotUpstreamGuard,
+    endpoint_family,
+)
+
+CONTACTS_URL = "https://api.hubapi.com/crm/v3/objects/contacts"
+COMPANIES_URL = "https://api.hubapi.com/crm/v3/objects/companies/1"
+
+
+def test_endpoint_family():
+    """Test URLs are grouped by object type or API."""
+    assert endpoint_family(CONTACTS_URL + "/search") == "crm/objects/contacts"
+    assert (
+        endpoint_family(
+            "https://api.hubapi.com/crm/v4/associations/contacts/companies/batch/read"
+        )
+        == "crm/associations"
+    )
+    assert endpoint_family("https://api.hubapi.com/oauth/v1/token") == "oauth"
+
+
+@pytest.mark.asyncio
+async def test_failing_family_is_cut_off_alone():
+    """Test 5xx responses open one family's circuit without touching others."""
+    guard = HubSpotUpstreamGuard(
+        new_breaker=lambda: CircuitBreaker(min_calls=2, open_seconds=30)
+    )
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if "contacts" in request.url.path:
+            return httpx.Response(503)
+        return httpx.Response(200, json={})
+
+    http_client = HubSpotHttpClient(
+        http2=False,
+        warmup=False,
+        transport=httpx.MockTransport(handler),
+        upstream_guard=guard,
+    )
+
+    for _ in range(2):
+        await http_client.request("GET", CONTACTS_URL)
+    with pytest.raises(HubSpotUnavailableError) as error:
+        await http_client.request("GET", CONTACTS_URL)
+    response = await http_client.request("GET", COMPANIES_URL)
+
+    assert error.value.retry_after > 0
+    assert response.status_code == 200
+    assert len(calls) == 3
+    metrics = guard.metrics()
+    assert metrics["crm/objects/contacts"]["circuit"] == "open"
+    assert metrics["crm/objects/companies"]["circuit"] == "closed"
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_shrink_the_limit():
+    """Test connection failures count as drops and free their slot."""
+    guard = HubSpotUpstreamGuard()
+
+    def handler(request):
+        raise httpx.ConnectError("connection refused")
+
+    http_client = HubSpotHttpClient(
+        http2=False,
+        warmup=False,
+        transport=httpx.MockTransport(handler),
+        upstream_guard=guard,
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        await http_client.request("GET", CONTACTS_URL)
+
+    limit = guard.limit("crm/objects/contacts")
+    assert limit.limit < 20
+    assert limit.in_flight == 0
+    await http_client.aclose()
@@ -0,0 +1,70 @@
+"""Tests for HubSpot last-modified searches."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.infrastructure.hubspot.search import (
+    SEARCH_RESULT_CAP,
+    iter_modified,
+    parse_hubspot_datetime,
+)
+
+
+def test_parse_hubspot_datetime():
+    """Test HubSpot's UTC timestamps are parsed as aware datetimes."""
+    assert parse_hubspot_datetime("2024-05-01T10:00:00.500Z") == datetime(
+        2024, 5, 1, 10, 0, 0, 500000, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_modified_follows_pages():
+    """Test pages are requested oldest first from the given time."""
+    bodies = []
+
+    async def search(body):
+        bodies.append(body)
+        if "after" in body:
+            return {"results": [{"id": "2"}]}
+        return {"results": [{"id": "1"}], "paging": {"next": {"after": "1"}}}
+
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pages = [
+        page async for page in iter_modified(search, "lastmodifieddate", since, [])
+    ]
+
+    assert pages == [[{"id": "1"}], [{"id": "2"}]]
+    assert bodies[0]["filterGroups"][0]["filters"][0] == {
+        "propertyName": "lastmodifieddate",
+        "operator": "GTE",
+        "value": "1704067200000",
+    }
+    assert bodies[0]["sorts"] == [
+        {"propertyName": "lastmodifieddate", "direction": "ASCENDING"}
+    ]
+    assert bodies[1]["after"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_iter_modified_restarts_at_result_cap():
+    """Test the search restarts from the last modification at the cap."""
+    bodies = []
+
+    async def search(body):
+        bodies.append(body)
+        if len(bodies) == 1:
+            return {
+                "results": [
+                    {"id": "1", "properties": {"modified": "2024-01-02T00:00:00Z"}}
+                ],
+                "paging": {"next": {"after": str(SEARCH_RESULT_CAP)}},
+            }
+        return {"results": [{"id": "2"}]}
+
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pages = [page async for page in iter_modified(search, "modified", since, [])]
+
+    assert len(pages) == 2
+    assert "after" not in bodies[1]
+    assert bodies[1]["filterGroups"][0]["filters"][0]["value"] == "1704153600000"
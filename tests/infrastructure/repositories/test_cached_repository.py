@@ -0,0 +1,194 @@
+"""Tests for the caching repository decorator."""
+
+import json
+import os
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.types.hubspot import HubSpotOAuthData
+from src.infrastructure.repositories.cached_repository import (
+    CachedHubSpotOAuthRepository,
+)
+from src.infrastructure.repositories.file_repository import FileHubSpotOAuthRepository
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def file_repository(tmp_path):
+    """Create a file repository with a temporary directory."""
+    return FileHubSpotOAuthRepository(storage_dir=str(tmp_path))
+
+
+@pytest.fixture
+def repository(file_repository, clock):
+    """Create a cached repository in front of the file repository."""
+    return CachedHubSpotOAuthRepository(
+        file_repository,
+        revalidate_seconds=5.0,
+        negative_ttl_seconds=10.0,
+        negative_max_entries=2,
+        clock=clock,
+    )
+
+
+def make_oauth_data(hub_id: str = "123", access_token: str = "token"):
+    """Create sample OAuth data."""
+    return HubSpotOAuthData(
+        hub_id=hub_id,
+        access_token=access_token,
+        refresh_token="refresh",
+        expires_at=datetime.now() + timedelta(hours=1),
+        scopes=["contacts"],
+        installed_at=datetime.now(),
+        user_id="user123",
+        app_id="app123",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_is_served_from_memory(repository, file_repository):
+    """Test repeated reads do not hit the wrapped repository."""
+    await file_repository.save(make_oauth_data())
+    file_repository.get_by_hub_id = AsyncMock(wraps=file_repository.get_by_hub_id)
+
+    first = await repository.get_by_hub_id("123")
+    second = await repository.get_by_hub_id("123")
+
+    assert first is second
+    file_repository.get_by_hub_id.assert_called_once_with("123")
+
+
+@pytest.mark.asyncio
+async def test_write_through(repository, file_repository):
+    """Test save, update and delete keep the cache and storage in sync."""
+    await repository.save(make_oauth_data())
+    assert (await file_repository.get_by_hub_id("123")).access_token == "token"
+
+    await repository.update(
+        replace(make_oauth_data(access_token="new_token"), version=1)
+    )
+    assert (await repository.get_by_hub_id("123")).access_token == "new_token"
+    assert (await file_repository.get_by_hub_id("123")).access_token == "new_token"
+
+    await repository.delete("123")
+    assert await repository.get_by_hub_id("123") is None
+    assert await file_repository.get_by_hub_id("123") is None
+
+
+@pytest.mark.asyncio
+async def test_external_edit_is_detected(repository, file_repository, clock):
+    """Test entries are reloaded when the file changes on disk."""
+    await repository.save(make_oauth_data())
+    assert (await repository.get_by_hub_id("123")).access_token == "token"
+
+    # Another process rewrites the file
+    file_path = file_repository._get_file_path("123")
+    with open(file_path, "w") as f:
+        json.dump(make_oauth_data(access_token="external").to_dict(), f)
+    os.utime(file_path, ns=(0, 1))
+
+    # Still trusted until the revalidation interval passes
+    assert (await repository.get_by_hub_id("123")).access_token == "token"
+
+    clock.now += 6
+    assert (await repository.get_by_hub_id("123")).access_token == "external"
+
+
+@pytest.mark.asyncio
+async def test_negative_cache(repository, file_repository, clock):
+    """Test unknown hub IDs are remembered until the TTL expires."""
+    file_repository.get_by_hub_id = AsyncMock(return_value=None)
+
+    assert await repository.get_by_hub_id("missing") is None
+    assert await repository.get_by_hub_id("missing") is None
+    assert file_repository.get_by_hub_id.await_count == 1
+
+    clock.now += 11
+    assert await repository.get_by_hub_id("missing") is None
+    assert file_repository.get_by_hub_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_cache_is_bounded(repository, file_repository):
+    """Test the negative cache evicts the oldest hub IDs."""
+    file_repository.get_by_hub_id = AsyncMock(return_value=None)
+
+    for hub_id in ("a", "b", "c"):
+        await repository.get_by_hub_id(hub_id)
+    await repository.get_by_hub_id("a")
+
+    assert file_repository.get_by_hub_id.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_save_clears_negative_entry(repository):
+    """Test a new installation is visible right after it is saved."""
+    assert await repository.get_by_hub_id("123") is None
+
+    await repository.save(make_oauth_data())
+
+    assert (await repository.get_by_hub_id("123")) is not None
+
+
+@pytest.mark.asyncio
+async def test_preload(repository, file_repository):
+    """Test preload caches every installation."""
+    await file_repository.save(make_oauth_data("1"))
+    await file_repository.save(make_oauth_data("2"))
+
+    assert await repository.preload() == 2
+
+    file_repository.get_by_hub_id = AsyncMock()
+    assert (await repository.get_by_hub_id("1")).hub_id == "1"
+    assert (await repository.get_by_hub_id("2")).hub_id == "2"
+    file_repository.get_by_hub_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lock_drops_cached_entry(repository, file_repository):
+    """Test reads under the lock see data written by another process."""
+    await repository.save(make_oauth_data())
+    await repository.get_by_hub_id("123")
+    # Another process refreshes the token
+    await file_repository.update(
+        replace(make_oauth_data(access_token="refreshed"), version=1)
+    )
+
+    async with repository.lock("123"):
+        assert (await repository.get_by_hub_id("123")).access_token == "refreshed"
+
+
+@pytest.mark.asyncio
+async def test_list_expiring_uses_wrapped_repository(repository, file_repository):
+    """Test expiring installations come from the wrapped repository and are cached."""
+    await file_repository.save(make_oauth_data("1"))
+    await file_repository.save(
+        replace(make_oauth_data("2"), expires_at=datetime.now() + timedelta(days=1))
+    )
+
+    installations = await repository.list_expiring(
+        datetime.now() + timedelta(hours=2)
+    )
+
+    assert [data.hub_id for data in installations] == ["1"]
+    file_repository.get_by_hub_id = AsyncMock()
+    assert (await repository.get_by_hub_id("1")).hub_id == "1"
+    file_repository.get_by_hub_id.assert_not_called()
@@ -3,11 +3,15 @@
 import os
 import json
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
 
-from src.infrastructure.repositories.file_repository import FileHubSpotOAuthRepository
+from src.infrastructure.repositories.file_repository import (
+    LOCK_SUFFIX,
+    FileHubSpotOAuthRepository,
+)
 from src.domain.types.hubspot import HubSpotOAuthData
-from src.domain.exceptions import HubSpotOperationError
+from src.domain.exceptions import HubSpotOperationError, StaleOAuthDataError
 
 
 @pytest.fixture
@@ -72,6 +76,7 @@ async def test_update(repository, sample_oauth_data):
         installed_at=datetime.now(),
         user_id="user123",
         app_id="app123",
+        version=1,
     )
     await repository.update(updated_data)
 
@@ -144,3 +149,161 @@ async def test_save_permission_error(repository, tmp_path):
                 app_id="app123",
             )
         )
+
+
+@pytest.mark.asyncio
+async def test_list_all(repository, sample_oauth_data):
+    """Test listing every stored installation."""
+    await repository.save(sample_oauth_data)
+    sample_oauth_data.hub_id = "456"
+    await repository.save(sample_oauth_data)
+
+    installations = await repository.list_all()
+
+    assert sorted(data.hub_id for data in installations) == ["123", "456"]
+
+
+@pytest.mark.asyncio
+async def test_list_all_parses_only_changed_files(
+    repository, sample_oauth_data, monkeypatch
+):
+    """Test listing again only parses files written since the last listing."""
+    await repository.save(sample_oauth_data)
+    await repository.save(replace(sample_oauth_data, hub_id="456"))
+    await repository.list_all()
+    loaded = []
+    load = repository._load
+
+    def counting_load(file_path):
+        loaded.append(file_path)
+        return load(file_path)
+
+    monkeypatch.setattr(repository, "_load", counting_load)
+
+    await repository.update(replace(sample_oauth_data, access_token="new", version=1))
+    await repository.delete("456")
+    loaded.clear()
+    installations = await repository.list_all()
+
+    assert [data.access_token for data in installations] == ["new"]
+    assert loaded == [repository._get_file_path("123")]
+
+
+@pytest.mark.asyncio
+async def test_list_expiring(repository, sample_oauth_data):
+    """Test only installations expiring before the cutoff are listed."""
+    now = datetime.now()
+    await repository.save(replace(sample_oauth_data, expires_at=now))
+    await repository.save(
+        replace(sample_oauth_data, hub_id="456", expires_at=now - timedelta(hours=1))
+    )
+    await repository.save(
+        replace(sample_oauth_data, hub_id="789", expires_at=now + timedelta(hours=1))
+    )
+
+    installations = await repository.list_expiring(now)
+
+    assert [data.hub_id for data in installations] == ["456", "123"]
+
+
+@pytest.mark.asyncio
+async def test_files_are_sharded(repository, sample_oauth_data, tmp_path):
+    """Test OAuth data is stored in a hashed subdirectory."""
+    await repository.save(sample_oauth_data)
+
+    file_path = repository._get_file_path(sample_oauth_data.hub_id)
+    assert os.path.dirname(file_path) != str(tmp_path)
+    assert os.path.exists(file_path)
+    assert not os.path.exists(os.path.join(tmp_path, "hubspot_auth_123.json"))
+
+
+@pytest.mark.asyncio
+async def test_write_is_compact_and_leaves_no_temp_files(
+    repository, sample_oauth_data
+):
+    """Test files are written compactly without leftover temporary files."""
+    await repository.save(sample_oauth_data)
+    await repository.update(replace(sample_oauth_data, version=1))
+
+    file_path = repository._get_file_path(sample_oauth_data.hub_id)
+    with open(file_path) as f:
+        content = f.read()
+    assert "\n" not in content and ", " not in content
+    file_names = [
+        file_name
+        for file_name in os.listdir(os.path.dirname(file_path))
+        if not file_name.endswith(LOCK_SUFFIX)
+    ]
+    assert file_names == [os.path.basename(file_path)]
+
+
+@pytest.mark.asyncio
+async def test_legacy_file_is_read_and_migrated(
+    repository, sample_oauth_data, tmp_path
+):
+    """Test files from the unsharded layout are read and moved on write."""
+    legacy_path = os.path.join(tmp_path, "hubspot_auth_123.json")
+    with open(legacy_path, "w") as f:
+        json.dump(sample_oauth_data.to_dict(), f, indent=2)
+
+    retrieved_data = await repository.get_by_hub_id("123")
+    assert retrieved_data is not None
+    assert retrieved_data.access_token == sample_oauth_data.access_token
+
+    await repository.update(replace(sample_oauth_data, version=1))
+
+    assert not os.path.exists(legacy_path)
+    assert os.path.exists(repository._get_file_path("123"))
+    assert [data.hub_id for data in await repository.list_all()] == ["123"]
+
+
+@pytest.mark.asyncio
+async def test_stale_update_is_rejected(repository, sample_oauth_data):
+    """Test an update based on an older version does not overwrite a newer one."""
+    await repository.save(sample_oauth_data)
+    await repository.update(
+        replace(sample_oauth_data, access_token="first", version=1)
+    )
+
+    with pytest.raises(StaleOAuthDataError):
+        await repository.update(
+            replace(sample_oauth_data, access_token="second", version=1)
+        )
+
+    retrieved_data = await repository.get_by_hub_id("123")
+    assert (retrieved_data.access_token, retrieved_data.version) == ("first", 1)
+
+
+@pytest.mark.asyncio
+async def test_save_supersedes_stored_version(repository, sample_oauth_data):
+    """Test a reinstall replaces the stored data with a newer version."""
+    await repository.save(sample_oauth_data)
+    await repository.update(replace(sample_oauth_data, version=1))
+
+    await repository.save(replace(sample_oauth_data, access_token="reinstalled"))
+
+    retrieved_data = await repository.get_by_hub_id("123")
+    assert (retrieved_data.access_token, retrieved_data.version) == (
+        "reinstalled",
+        2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_lock_excludes_other_holders(tmp_path):
+    """Test the refresh lock of a hub ID is held by one repository at a time."""
+    repository = FileHubSpotOAuthRepository(storage_dir=str(tmp_path))
+    other = FileHubSpotOAuthRepository(
+        storage_dir=str(tmp_path), lock_timeout_seconds=0.1
+    )
+
+    async with repository.lock("123"):
+        with pytest.raises(HubSpotOperationError):
+            async with other.lock("123"):
+                pass
+        # Other hub IDs are not affected
+        async with other.lock("456"):
+            pass
+
+    async with other.lock("123"):
+        pass
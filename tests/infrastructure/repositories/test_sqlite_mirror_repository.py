@@ -0,0 +1,138 @@
+"""Tests for the SQLite CRM mirror repository."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.types.hubspot import Company, Contact
+from src.infrastructure.repositories.sqlite_mirror_repository import (
+    SqliteCrmMirrorRepository,
+)
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """Create a mirror with a temporary database."""
+    mirror = SqliteCrmMirrorRepository(database_path=str(tmp_path / "mirror.db"))
+    yield mirror
+    mirror.close()
+
+
+def make_contact(contact_id: str, name: str = "Ada") -> Contact:
+    """Create a sample contact."""
+    return Contact(
+        id=contact_id,
+        name=name,
+        email=f"{contact_id}@example.com",
+        phone="",
+        properties={"lastmodifieddate": "2024-05-01T10:00:00Z"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_in_id_order(mirror):
+    """Test contacts are listed per portal with a cursor and limit."""
+    await mirror.upsert_contacts("1", [make_contact(i) for i in ["3", "1", "2"]])
+    await mirror.upsert_contacts("2", [make_contact("9")])
+
+    first = await mirror.list_contacts("1", limit=2)
+    rest = await mirror.list_contacts("1", limit=2, after=first[-1].id)
+
+    assert [contact.id for contact in first] == ["1", "2"]
+    assert [contact.id for contact in rest] == ["3"]
+    assert first[0] == make_contact("1")
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_in_numeric_id_order(mirror):
+    """Test IDs of different lengths are paged in numeric, not text, order."""
+    await mirror.upsert_contacts("1", [make_contact(i) for i in ["10", "9", "101"]])
+
+    first = await mirror.list_contacts("1", limit=2)
+    rest = await mirror.list_contacts("1", limit=2, after=first[-1].id)
+
+    assert [contact.id for contact in first] == ["9", "10"]
+    assert [contact.id for contact in rest] == ["101"]
+    with pytest.raises(ValueError):
+        await mirror.list_contacts("1", after="next")
+
+
+@pytest.mark.asyncio
+async def test_upsert_replaces_contacts(mirror):
+    """Test storing a contact again replaces it."""
+    await mirror.upsert_contacts("1", [make_contact("1")])
+    await mirror.upsert_contacts("1", [make_contact("1", name="Grace")])
+
+    assert [contact.name for contact in await mirror.list_contacts("1")] == ["Grace"]
+
+
+@pytest.mark.asyncio
+async def test_replace_contact_companies(mirror):
+    """Test a contact's companies are replaced and returned in order."""
+    await mirror.upsert_companies(
+        "1", [Company(id="a", name="Acme"), Company(id="b", name="Globex")]
+    )
+    await mirror.replace_contact_companies("1", {"7": ["a", "b"]})
+    await mirror.replace_contact_companies("1", {"7": ["b"], "8": ["a"]})
+
+    companies = await mirror.get_contact_companies("1", "7")
+
+    assert [company.id for company in companies] == ["b"]
+    assert companies[0].associated
+    assert [c.id for c in await mirror.get_contact_companies("1", "8")] == ["a"]
+    assert await mirror.get_contact_companies("2", "7") == []
+
+
+@pytest.mark.asyncio
+async def test_get_contact_companies_page(mirror):
+    """Test a contact's companies are paged in order with a cursor."""
+    await mirror.upsert_companies(
+        "1", [Company(id=company_id, name="Acme") for company_id in "abc"]
+    )
+    await mirror.replace_contact_companies("1", {"7": ["c", "a", "b"]})
+
+    first, after = await mirror.get_contact_companies_page("1", "7", limit=2)
+    rest, last = await mirror.get_contact_companies_page(
+        "1", "7", limit=2, after=after
+    )
+
+    assert [company.id for company in first] == ["c", "a"]
+    assert [company.id for company in rest] == ["b"]
+    assert last is None
+    with pytest.raises(ValueError):
+        await mirror.get_contact_companies_page("1", "7", after="next")
+
+
+@pytest.mark.asyncio
+async def test_delete_objects(mirror):
+    """Test deleting contacts and companies removes their associations."""
+    await mirror.upsert_contacts("1", [make_contact(i) for i in ["7", "8"]])
+    await mirror.upsert_contacts("2", [make_contact("7")])
+    await mirror.upsert_companies(
+        "1", [Company(id="a", name="Acme"), Company(id="b", name="Globex")]
+    )
+    await mirror.replace_contact_companies("1", {"7": ["a", "b"], "8": ["a"]})
+
+    await mirror.delete_objects("1", "contacts", {"7"})
+    await mirror.delete_objects("1", "companies", ["a"])
+
+    assert await mirror.list_ids("1", "contacts") == {"8"}
+    assert await mirror.list_ids("2", "contacts") == {"7"}
+    assert await mirror.list_ids("1", "companies") == {"b"}
+    assert await mirror.get_contact_companies("1", "7") == []
+    assert await mirror.get_contact_companies("1", "8") == []
+    # The removed company no longer holds a position in the association table
+    await mirror.upsert_companies("1", [Company(id="a", name="Acme")])
+    assert await mirror.get_contact_companies("1", "8") == []
+
+
+@pytest.mark.asyncio
+async def test_synced_until(mirror):
+    """Test the sync watermark is stored per portal and object type."""
+    synced_until = datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+
+    assert await mirror.get_synced_until("1", "contacts") is None
+    await mirror.set_synced_until("1", "contacts", synced_until)
+
+    assert await mirror.get_synced_until("1", "contacts") == synced_until
+    assert await mirror.get_synced_until("1", "companies") is None
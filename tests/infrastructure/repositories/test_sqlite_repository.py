@@ -0,0 +1,242 @@
+"""Tests for SQLite-based repository implementation."""
+
+import sqlite3
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.exceptions import HubSpotOperationError, StaleOAuthDataError
+from src.domain.types.hubspot import HubSpotOAuthData
+from src.infrastructure.repositories.file_repository import FileHubSpotOAuthRepository
+from src.infrastructure.repositories.migrate_to_sqlite import main, migrate
+from src.infrastructure.repositories.sqlite_repository import (
+    SqliteHubSpotOAuthRepository,
+)
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    """Path of a temporary database."""
+    return str(tmp_path / "auth.db")
+
+
+@pytest.fixture
+def repository(database_path):
+    """Create a repository instance with a temporary database."""
+    repository = SqliteHubSpotOAuthRepository(database_path=database_path)
+    yield repository
+    repository.close()
+
+
+def make_oauth_data(hub_id: str = "123", expires_in: timedelta = timedelta(hours=1)):
+    """Create sample OAuth data."""
+    return HubSpotOAuthData(
+        hub_id=hub_id,
+        access_token="test_access_token",
+        refresh_token="test_refresh_token",
+        expires_at=datetime.now() + expires_in,
+        scopes=["contacts", "companies"],
+        installed_at=datetime.now(),
+        user_id="user123",
+        app_id="app123",
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_and_get(repository):
+    """Test saving and retrieving OAuth data."""
+    data = make_oauth_data()
+    await repository.save(data)
+
+    assert await repository.get_by_hub_id("123") == data
+
+
+@pytest.mark.asyncio
+async def test_get_nonexistent(repository):
+    """Test retrieving non-existent data."""
+    assert await repository.get_by_hub_id("nonexistent") is None
+
+
+@pytest.mark.asyncio
+async def test_update(repository):
+    """Test updating OAuth data."""
+    await repository.save(make_oauth_data())
+
+    await repository.update(
+        replace(make_oauth_data(), access_token="new_token", version=1)
+    )
+
+    stored = await repository.get_by_hub_id("123")
+    assert (stored.access_token, stored.version) == ("new_token", 1)
+
+
+@pytest.mark.asyncio
+async def test_update_nonexistent(repository):
+    """Test updating non-existent data."""
+    with pytest.raises(HubSpotOperationError, match="No OAuth data found"):
+        await repository.update(make_oauth_data())
+
+
+@pytest.mark.asyncio
+async def test_stale_update_is_rejected(repository):
+    """Test an update based on an older version does not overwrite a newer one."""
+    await repository.save(make_oauth_data())
+    await repository.update(replace(make_oauth_data(), access_token="first", version=1))
+
+    with pytest.raises(StaleOAuthDataError):
+        await repository.update(
+            replace(make_oauth_data(), access_token="second", version=1)
+        )
+
+    stored = await repository.get_by_hub_id("123")
+    assert (stored.access_token, stored.version) == ("first", 1)
+
+
+@pytest.mark.asyncio
+async def test_save_supersedes_stored_version(repository):
+    """Test a reinstall replaces the stored data with a newer version."""
+    await repository.save(make_oauth_data())
+    await repository.update(replace(make_oauth_data(), version=1))
+
+    await repository.save(replace(make_oauth_data(), access_token="reinstalled"))
+
+    stored = await repository.get_by_hub_id("123")
+    assert (stored.access_token, stored.version) == ("reinstalled", 2)
+
+
+@pytest.mark.asyncio
+async def test_version_column_added_to_existing_database(database_path):
+    """Test a database created before versioning gains the column."""
+    connection = sqlite3.connect(database_path)
+    connection.execute(
+        "CREATE TABLE hubspot_oauth (hub_id TEXT PRIMARY KEY, "
+        "access_token TEXT NOT NULL, refresh_token TEXT NOT NULL, "
+        "expires_at TEXT NOT NULL, scopes TEXT NOT NULL, "
+        "installed_at TEXT NOT NULL, user_id TEXT NOT NULL, app_id TEXT NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO hubspot_oauth VALUES ('123', 'a', 'r', "
+        "'2024-01-01T00:00:00.000000', '[]', '2024-01-01T00:00:00.000000', "
+        "'u', 'app')"
+    )
+    connection.commit()
+    connection.close()
+
+    repository = SqliteHubSpotOAuthRepository(database_path=database_path)
+    try:
+        assert (await repository.get_by_hub_id("123")).version == 0
+    finally:
+        repository.close()
+
+
+@pytest.mark.asyncio
+async def test_lock_excludes_other_holders(database_path):
+    """Test the refresh lock of a hub ID is held by one repository at a time."""
+    repository = SqliteHubSpotOAuthRepository(database_path=database_path)
+    other = SqliteHubSpotOAuthRepository(
+        database_path=database_path, lock_timeout_seconds=0.1
+    )
+    try:
+        async with repository.lock("123"):
+            with pytest.raises(HubSpotOperationError):
+                async with other.lock("123"):
+                    pass
+            # Other hub IDs are not affected
+            async with other.lock("456"):
+                pass
+
+        async with other.lock("123"):
+            pass
+    finally:
+        repository.close()
+        other.close()
+
+
+@pytest.mark.asyncio
+async def test_delete(repository):
+    """Test deleting OAuth data."""
+    await repository.save(make_oauth_data())
+
+    await repository.delete("123")
+
+    assert await repository.get_by_hub_id("123") is None
+
+
+@pytest.mark.asyncio
+async def test_list_all_and_expiring(repository):
+    """Test listing all installations and those expiring soon."""
+    await repository.save(make_oauth_data("2", timedelta(minutes=5)))
+    await repository.save(make_oauth_data("1", timedelta(hours=2)))
+    await repository.save(make_oauth_data("3", timedelta(minutes=1)))
+
+    assert [data.hub_id for data in await repository.list_all()] == ["1", "2", "3"]
+
+    expiring = await repository.list_expiring(datetime.now() + timedelta(minutes=10))
+    assert [data.hub_id for data in expiring] == ["3", "2"]
+
+
+def test_schema_uses_wal_and_expiry_index(repository, database_path):
+    """Test the database runs in WAL mode with an index on expires_at."""
+    connection = sqlite3.connect(database_path)
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT hub_id FROM hubspot_oauth WHERE expires_at <= ?",
+            ("2024-01-01T00:00:00.000000",),
+        ).fetchall()
+    finally:
+        connection.close()
+    assert "idx_hubspot_oauth_expires_at" in str(plan)
+
+
+@pytest.mark.asyncio
+async def test_writes_are_visible_to_other_connections(repository, database_path):
+    """Test a second repository on the same file, as another worker would open."""
+    other = SqliteHubSpotOAuthRepository(database_path=database_path)
+    try:
+        await repository.save(make_oauth_data())
+        await other.update(
+            replace(make_oauth_data(), access_token="from_other", version=1)
+        )
+
+        assert (await repository.get_by_hub_id("123")).access_token == "from_other"
+    finally:
+        other.close()
+
+
+@pytest.mark.asyncio
+async def test_connections_reopened_after_fork(repository):
+    """Test a forked worker opens its own connections instead of the parent's."""
+    await repository.save(make_oauth_data())
+    pool = repository._pool
+    inherited = list(pool._pool.queue)
+    pool._pid = -1  # As if the pool had been opened by a parent process
+
+    assert (await repository.get_by_hub_id("123")).hub_id == "123"
+    assert pool._inherited == inherited
+    assert not set(pool._pool.queue) & set(inherited)
+
+
+@pytest.mark.asyncio
+async def test_migrate_from_files(tmp_path, repository):
+    """Test importing file-based OAuth data."""
+    source = FileHubSpotOAuthRepository(storage_dir=str(tmp_path / "auth"))
+    await source.save(make_oauth_data("1"))
+    await source.save(make_oauth_data("2"))
+
+    assert await migrate(source, repository) == 2
+    assert await migrate(source, repository) == 2
+    assert [data.hub_id for data in await repository.list_all()] == ["1", "2"]
+    source.close()
+
+
+def test_migration_command(tmp_path, capsys):
+    """Test the command line entry point."""
+    storage_dir = tmp_path / "auth"
+    database_path = tmp_path / "auth.db"
+    FileHubSpotOAuthRepository(storage_dir=str(storage_dir))._write(make_oauth_data())
+
+    main(["--storage-dir", str(storage_dir), "--database", str(database_path)])
+
+    assert "Imported 1 installation(s)" in capsys.readouterr().out
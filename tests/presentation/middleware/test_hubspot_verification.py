@@ -0,0 +1,111 @@
+"""Tests for the HubSpot signature verification middleware."""
+
+import base64
+import hashlib
+import hmac
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.domain.services.verification import HubSpotRequestVerifier
+from src.presentation.middleware.hubspot_verification import (
+    HubSpotVerificationMiddleware,
+)
+
+inner_app = FastAPI()
+
+
+@inner_app.post("/contacts/echo")
+async def echo(request: Request):
+    return {"body": (await request.body()).decode()}
+
+
+@inner_app.get("/healthcheck")
+async def healthcheck():
+    return {"status": "healthy"}
+
+
+@pytest.fixture
+def client():
+    """Create a client for an app wrapped in the middleware."""
+    middleware = HubSpotVerificationMiddleware(inner_app, max_body_size=64)
+    middleware.verifier = HubSpotRequestVerifier("test_secret")
+    return TestClient(middleware)
+
+
+def sign(method: str, url: str, body: bytes, timestamp: str) -> str:
+    """Compute a v3 signature."""
+    digest = hmac.new(
+        b"test_secret",
+        method.encode() + url.encode() + body + timestamp.encode(),
+        hashlib.sha256,
+    ).digest()
+    return base64.b64encode(digest).decode()
+
+
+def signed_headers(body: bytes, url: str = "http://testserver/contacts/echo"):
+    """Create valid signature headers for a POST to ``url``."""
+    timestamp = str(int(time.time() * 1000))
+    return {
+        "X-HubSpot-Request-Timestamp": timestamp,
+        "X-HubSpot-Signature-v3": sign("POST", url, body, timestamp),
+    }
+
+
+def test_other_routes_are_not_verified(client):
+    """Test requests outside /contacts pass through."""
+    response = client.get("/healthcheck")
+    assert response.status_code == 200
+
+
+def test_valid_signature_replays_body(client):
+    """Test a signed request reaches the route with its body intact."""
+    body = b'{"name": "test"}'
+    response = client.post("/contacts/echo", content=body, headers=signed_headers(body))
+
+    assert response.status_code == 200
+    assert response.json() == {"body": body.decode()}
+
+
+def test_chunked_body_is_verified(client):
+    """Test a body streamed in several chunks is signed and replayed in full."""
+    chunks = [b"first,", b"second,", b"third"]
+    body = b"".join(chunks)
+
+    response = client.post(
+        "/contacts/echo", content=iter(chunks), headers=signed_headers(body)
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"body": body.decode()}
+
+
+def test_invalid_signature(client):
+    """Test a request with a wrong signature is rejected."""
+    headers = signed_headers(b"original")
+    response = client.post("/contacts/echo", content=b"tampered", headers=headers)
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid request"}
+
+
+def test_missing_headers(client):
+    """Test a request without signature headers is rejected."""
+    response = client.post("/contacts/echo", content=b"body")
+    assert response.status_code == 401
+
+
+def test_body_too_large(client):
+    """Test bodies over the limit are rejected, with or without Content-Length."""
+    body = b"x" * 65
+    response = client.post("/contacts/echo", content=body, headers=signed_headers(body))
+    assert response.status_code == 413
+
+    response = client.post(
+        "/contacts/echo",
+        content=iter([body[:40], body[40:]]),
+        headers=signed_headers(body),
+    )
+    assert response.status_code == 413
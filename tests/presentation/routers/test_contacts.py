@@ -0,0 +1,407 @@
+"""Tests for the contacts router."""
+
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.services.crm_sync import CONTACTS, CrmSyncService
+from src.domain.exceptions import HubSpotUnavailableError
+from src.domain.services.response_cache import ResponseCache
+from src.domain.types.hubspot import (
+    AssociationResult,
+    Company,
+    Contact,
+    HubSpotOAuthData,
+)
+from src.infrastructure.config import get_settings
+from src.infrastructure.export.columnar import ColumnarExporter
+from src.infrastructure.hubspot.contact_service import HubSpotContactService
+from src.infrastructure.hubspot.http_client import HubSpotHttpClient
+from src.infrastructure.hubspot.properties import HubSpotPropertyService
+from src.infrastructure.repositories.sqlite_mirror_repository import (
+    SqliteCrmMirrorRepository,
+)
+from src.presentation import dependencies
+from src.presentation.dependencies import get_oauth_data
+from src.presentation.routers import contacts
+
+
+def contacts_page(request: httpx.Request) -> httpx.Response:
+    """Serve two pages of contacts and the contact property schema."""
+    if request.url.path == "/crm/v3/properties/contacts":
+        return httpx.Response(
+            200, json={"results": [{"name": "email"}, {"name": "jobtitle"}]}
+        )
+    if request.url.params.get("after"):
+        return httpx.Response(
+            200, json={"results": [{"id": "2", "properties": {"firstname": "Bo"}}]}
+        )
+    return httpx.Response(
+        200,
+        json={
+            "results": [
+                {
+                    "id": "1",
+                    "properties": {
+                        "firstname": "Al",
+                        "email": "al@x.com",
+                        "jobtitle": "CTO",
+                    },
+                }
+            ],
+            "paging": {"next": {"after": "1"}},
+        },
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a client for the contacts router with a mocked HubSpot."""
+    dependencies.init_services(get_settings())
+    contacts.init_services(get_settings(), dependencies.token_manager)
+    http_client = HubSpotHttpClient(
+        http2=False, warmup=False, transport=httpx.MockTransport(contacts_page)
+    )
+    monkeypatch.setattr(
+        contacts, "contact_service", HubSpotContactService(http_client=http_client)
+    )
+    monkeypatch.setattr(
+        contacts, "property_service", HubSpotPropertyService(http_client=http_client)
+    )
+    monkeypatch.setattr(contacts, "property_schema_cache", ResponseCache())
+    monkeypatch.setattr(contacts, "response_cache", None)
+    monkeypatch.setattr(contacts, "crm_sync", None)
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(
+        contacts, "columnar_exporter", ColumnarExporter(executor=executor)
+    )
+    app = FastAPI()
+    app.include_router(contacts.router)
+    app.dependency_overrides[get_oauth_data] = lambda: HubSpotOAuthData(
+        hub_id="123",
+        access_token="token",
+        refresh_token="refresh",
+        expires_at=datetime.now() + timedelta(hours=1),
+        scopes=["contacts"],
+        installed_at=datetime.now(),
+        user_id="user",
+        app_id="app",
+    )
+    yield TestClient(app)
+    contacts.close_services()
+    dependencies.close_services()
+    executor.shutdown()
+
+
+def test_export_ndjson(client):
+    """Test every page is streamed as newline-delimited JSON."""
+    response = client.get("/contacts/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == ["1", "2"]
+    assert lines[0]["email"] == "al@x.com"
+
+
+def test_export_csv(client):
+    """Test contacts are streamed as CSV with a header row."""
+    response = client.get("/contacts/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "id,name,email,phone",
+        "1,Al,al@x.com,",
+        "2,Bo,,",
+    ]
+
+
+def test_get_contacts_with_fields(client):
+    """Test only the requested fields and custom properties are returned."""
+    response = client.get("/contacts", params={"fields": "email, jobtitle"})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": "1", "email": "al@x.com", "jobtitle": "CTO"}]
+
+
+def test_get_contacts_with_unknown_field(client):
+    """Test a field missing from the portal's schema is rejected."""
+    response = client.get("/contacts", params={"fields": "name,shoesize"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Unknown fields: shoesize"}
+
+
+def test_export_csv_with_fields(client):
+    """Test the CSV columns follow the requested fields."""
+    response = client.get(
+        "/contacts/export", params={"format": "csv", "fields": "name,jobtitle"}
+    )
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == ["id,name,jobtitle", "1,Al,CTO", "2,Bo,"]
+
+
+def test_batch_read_contact_companies(client, monkeypatch):
+    """Test companies of several contacts are returned by contact ID."""
+
+    class CompanyService:
+        async def get_companies_for_contacts(self, access_token, contact_ids, fields):
+            return {
+                contact_id: [Company(id="9", name="Acme", associated=True)]
+                for contact_id in contact_ids
+            }
+
+    monkeypatch.setattr(contacts, "company_service", CompanyService())
+
+    response = client.post(
+        "/contacts/companies:batchRead",
+        params={"fields": "name"},
+        json={"contact_ids": ["1", "2"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": {
+            "1": [{"id": "9", "associated": True, "name": "Acme"}],
+            "2": [{"id": "9", "associated": True, "name": "Acme"}],
+        }
+    }
+
+
+def test_batch_read_requires_contact_ids(client):
+    """Test an empty batch is rejected."""
+    response = client.post("/contacts/companies:batchRead", json={"contact_ids": []})
+
+    assert response.status_code == 422
+
+
+def test_batch_add_company_associations(client, monkeypatch):
+    """Test the outcome of each pair is returned."""
+
+    class CompanyService:
+        async def create_associations(self, access_token, pairs):
+            return [
+                AssociationResult(contact_id, company_id, company_id != "bad", None)
+                for contact_id, company_id in pairs
+            ]
+
+    monkeypatch.setattr(contacts, "company_service", CompanyService())
+
+    response = client.post(
+        "/contacts/companies/associations:batch",
+        json={
+            "pairs": [
+                {"contact_id": "1", "company_id": "9"},
+                {"contact_id": "1", "company_id": "bad"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == [
+        "success",
+        "error",
+    ]
+
+
+def test_get_contact_companies_page(client, monkeypatch):
+    """Test limit and after are passed through and the next cursor returned."""
+    calls = []
+
+    class CompanyService:
+        async def get_companies_page(self, **kwargs):
+            calls.append(kwargs)
+            return [Company(id="9", name="Acme", associated=True)], "next"
+
+    monkeypatch.setattr(contacts, "company_service", CompanyService())
+
+    response = client.get("/contacts/1/companies", params={"limit": 1, "after": "a"})
+
+    assert response.status_code == 200
+    assert [company["id"] for company in response.json()] == ["9"]
+    assert response.headers["X-Next-After"] == "next"
+    assert calls[0]["limit"] == 1
+    assert calls[0]["after"] == "a"
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    """Enable a CRM mirror backed by a temporary database."""
+    mirror = SqliteCrmMirrorRepository(database_path=str(tmp_path / "mirror.db"))
+    sync = CrmSyncService(contacts.token_manager, None, None, mirror)
+    monkeypatch.setattr(contacts, "crm_sync", sync)
+    yield mirror
+    mirror.close()
+
+
+def test_get_contacts_from_mirror_when_disabled(client):
+    """Test mirror reads are rejected when the mirror is disabled."""
+    response = client.get("/contacts", params={"source": "mirror"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_from_mirror(client, mirror):
+    """Test contacts are served from the mirror once it is backfilled."""
+    response = client.get("/contacts", params={"source": "mirror"})
+    assert response.status_code == 503
+
+    await mirror.upsert_contacts(
+        "123", [Contact(id="5", name="Mirrored", email="m@x.com", phone="")]
+    )
+    await mirror.set_synced_until("123", CONTACTS, datetime.now(timezone.utc))
+    response = client.get("/contacts", params={"source": "mirror"})
+
+    assert response.status_code == 200
+    assert [contact["name"] for contact in response.json()] == ["Mirrored"]
+    invalid = client.get("/contacts", params={"source": "mirror", "after": "x"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_contact_companies_from_mirror_in_pages(client, mirror):
+    """Test mirrored companies are paged with the same cursor header as live."""
+    await mirror.upsert_companies(
+        "123", [Company(id=company_id, name="Acme") for company_id in "abc"]
+    )
+    await mirror.replace_contact_companies("123", {"1": ["c", "a", "b"]})
+    await mirror.set_synced_until("123", CONTACTS, datetime.now(timezone.utc))
+    params = {"source": "mirror", "limit": 2}
+
+    first = client.get("/contacts/1/companies", params=params)
+    rest = client.get(
+        "/contacts/1/companies",
+        params={**params, "after": first.headers["X-Next-After"]},
+    )
+    invalid = client.get("/contacts/1/companies", params={**params, "after": "x"})
+
+    assert [company["id"] for company in first.json()] == ["c", "a"]
+    assert [company["id"] for company in rest.json()] == ["b"]
+    assert "X-Next-After" not in rest.headers
+    assert invalid.status_code == 400
+
+
+def test_cached_contacts_served_while_hubspot_unavailable(client, monkeypatch):
+    """Test an open circuit serves the last cached page, else a 503."""
+    cache = ResponseCache(ttl_seconds=0, stale_seconds=0)
+    monkeypatch.setattr(contacts, "response_cache", cache)
+    assert client.get("/contacts/").status_code == 200
+
+    async def shed(*args, **kwargs):
+        raise HubSpotUnavailableError("circuit open", retry_after=12.5)
+
+    monkeypatch.setattr(contacts.contact_service, "get_contacts", shed)
+
+    response = client.get("/contacts/")
+    assert response.status_code == 200
+    assert response.json()[0]["id"] == "1"
+
+    response = client.get("/contacts/?limit=5")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "13"
+
+
+def test_fast_json_responses_match_default(client, monkeypatch):
+    """Test the fast JSON path returns the same documents and headers."""
+
+    class CompanyService:
+        async def get_companies_page(self, **kwargs):
+            return [Company(id="9", name="Ünïcode", associated=True)], "next"
+
+    monkeypatch.setattr(contacts, "company_service", CompanyService())
+    paths = ["/contacts/", "/contacts/?fields=email", "/contacts/1/companies?limit=1"]
+    default = [client.get(path) for path in paths]
+
+    monkeypatch.setattr(contacts, "fast_json_responses", True)
+    fast = [client.get(path) for path in paths]
+
+    for default_response, fast_response in zip(default, fast):
+        assert fast_response.status_code == 200
+        assert fast_response.headers["content-type"] == "application/json"
+        assert fast_response.json() == default_response.json()
+    assert fast[2].headers["X-Next-After"] == "next"
+    lines = client.get("/contacts/export").text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["1", "2"]
+
+
+def test_fast_json_path_keeps_unprojected_models(monkeypatch):
+    """Test only the fast JSON path hands unprojected models to the serializer."""
+    contact = Contact(id="1", name="Al", email="al@x.com", phone="")
+    assert contacts.present(contact, None) == contact.to_dict()
+
+    monkeypatch.setattr(contacts, "fast_json_responses", True)
+
+    assert contacts.present(contact, None) is contact
+    assert contacts.present(contact, ["email"]) == {"id": "1", "email": "al@x.com"}
+
+
+def test_export_parquet(client):
+    """Test every contact is downloaded as a Parquet file."""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = client.get(
+        "/contacts/export", params={"format": "parquet", "fields": "email"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert "contacts.parquet" in response.headers["content-disposition"]
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.to_pydict() == {"id": ["1", "2"], "email": ["al@x.com", ""]}
+
+
+def test_export_companies_columnar_csv(client, monkeypatch):
+    """Test every company of the portal is downloaded as a CSV file."""
+
+    listed = []
+
+    class CompanyService:
+        async def iter_companies(self, access_token, page_size, fields):
+            listed.append(fields)
+            yield [Company(id="9", name="Acme", domain="acme.com")]
+
+    monkeypatch.setattr(contacts, "company_service", CompanyService())
+
+    response = client.get("/contacts/companies/export")
+    projected = client.get("/contacts/companies/export", params={"fields": "domain"})
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "id,name,domain,industry,phone",
+        "9,Acme,acme.com,,",
+    ]
+    assert projected.text.splitlines() == ["id,domain", "9,acme.com"]
+    assert listed == [None, ["domain"]]
+
+
+def test_export_parquet_without_pyarrow(client, monkeypatch):
+    """Test Parquet exports are refused when pyarrow is missing."""
+    monkeypatch.setattr(contacts, "parquet_available", lambda: False)
+
+    response = client.get("/contacts/export", params={"format": "parquet"})
+
+    assert response.status_code == 400
+
+
+def test_close_services_shuts_down_sdk_company_service(monkeypatch):
+    settings = get_settings().model_copy(
+        update={"HUBSPOT_COMPANY_BACKEND": "sdk", "HUBSPOT_COALESCE_READS": True}
+    )
+    monkeypatch.setattr(contacts, "sdk_company_service", None)
+    monkeypatch.setattr(contacts, "company_service", None)
+
+    dependencies.init_services(settings)
+    contacts.init_services(settings, dependencies.token_manager)
+    executor = contacts.sdk_company_service._executor
+    contacts.close_services()
+    dependencies.close_services()
+
+    assert executor._shutdown
@@ -0,0 +1,37 @@
+"""Tests for the fast JSON responses."""
+
+import json
+
+import pytest
+
+from src.domain.types.hubspot import Company, Contact
+from src.presentation import responses
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def serializer(request, monkeypatch):
+    """Run a test with orjson, if installed, and with the standard library."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(responses, "orjson", None)
+    elif responses.orjson is None:
+        pytest.skip("orjson is not installed")
+
+
+def test_dumps_serializes_domain_types_by_to_dict(serializer):
+    """Test contacts and companies are serialized like their to_dict."""
+    contact = Contact(id="1", name="Ann Ö", email="a@x.com", phone="1")
+    company = Company(id="2", name="Acme", properties={"hidden": True})
+
+    document = responses.dumps({"contacts": [contact], "company": company})
+
+    assert json.loads(document) == {
+        "contacts": [contact.to_dict()],
+        "company": company.to_dict(),
+    }
+    assert "Ö".encode() in document
+
+
+def test_dumps_rejects_unknown_types(serializer):
+    """Test values without a JSON form raise TypeError."""
+    with pytest.raises(TypeError):
+        responses.dumps({"value": object()})
@@ -0,0 +1,144 @@
+"""Tests for the production server entry point."""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from src.infrastructure.config import get_settings
+from src.presentation import serve
+from src.presentation.serve import WorkerSupervisor, build_config, default_workers
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def free_port() -> int:
+    """Find a port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_build_config_from_settings():
+    settings = get_settings().model_copy(
+        update={
+            "SERVER_PORT": 9000,
+            "SERVER_BACKLOG": 512,
+            "SERVER_KEEPALIVE_SECONDS": 15,
+            "SERVER_LIMIT_CONCURRENCY": 200,
+            "SERVER_GRACEFUL_SHUTDOWN_SECONDS": 10,
+        }
+    )
+
+    config = build_config(settings, host="127.0.0.1")
+
+    assert (config.host, config.port) == ("127.0.0.1", 9000)
+    assert config.backlog == 512
+    assert config.timeout_keep_alive == 15
+    assert config.limit_concurrency == 200
+    assert config.timeout_graceful_shutdown == 10
+
+
+def test_default_workers():
+    assert default_workers() >= 1
+
+
+def test_one_worker_runs_background_tasks(tmp_path, monkeypatch):
+    """Test one worker gets the background tasks and its replacement too."""
+
+    def record_settings(config, sock):
+        background = get_settings().SERVER_BACKGROUND_TASKS
+        (tmp_path / str(os.getpid())).write_text(str(background))
+        return 0
+
+    def background_of(pid):
+        os.waitpid(pid, 0)
+        return (tmp_path / str(pid)).read_text() == "True"
+
+    monkeypatch.setattr(serve, "run_worker", record_settings)
+    supervisor = WorkerSupervisor(None, None, workers=3)
+    for _ in range(3):
+        supervisor._spawn()
+    first = supervisor.background_pid
+    workers = {pid: background_of(pid) for pid in supervisor.pids}
+
+    assert workers == {pid: pid == first for pid in workers}
+
+    # Replacing another worker leaves the background tasks where they are
+    supervisor._reaped(next(pid for pid in workers if pid != first))
+    supervisor._spawn()
+    assert supervisor.background_pid == first
+
+    # The background worker's replacement takes them over
+    supervisor._reaped(first)
+    supervisor._spawn()
+    replacements = {
+        pid: background_of(pid) for pid in supervisor.pids if pid not in workers
+    }
+
+    assert supervisor.background_pid in replacements
+    assert replacements == {
+        pid: pid == supervisor.background_pid for pid in replacements
+    }
+
+
+def test_workers_share_the_rate_limit(tmp_path, monkeypatch):
+    """Test each worker is told how many processes share HubSpot's limits."""
+
+    def record_settings(config, sock):
+        processes = get_settings().HUBSPOT_RATE_LIMIT_PROCESSES
+        (tmp_path / str(os.getpid())).write_text(str(processes))
+        return 0
+
+    monkeypatch.setattr(serve, "run_worker", record_settings)
+    # Two servers of three workers each
+    monkeypatch.setenv("HUBSPOT_RATE_LIMIT_PROCESSES", "2")
+    get_settings.cache_clear()
+    supervisor = WorkerSupervisor(None, None, workers=3)
+    supervisor._spawn()
+    (pid,) = supervisor.pids
+    os.waitpid(pid, 0)
+    get_settings.cache_clear()
+
+    assert (tmp_path / str(pid)).read_text() == "6"
+
+
+def test_serve_workers_and_stop_on_sigterm(tmp_path):
+    """Test two forked workers serve requests and exit cleanly on SIGTERM."""
+    port = free_port()
+    env = {
+        **os.environ,
+        "OAUTH_STORAGE_DIR": str(tmp_path / "auth"),
+        "HUBSPOT_HTTP_WARMUP": "false",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.presentation.serve"]
+        + ["--host", "127.0.0.1", "--port", str(port), "--workers", "2"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/healthcheck")
+                break
+            except httpx.TransportError:
+                assert time.monotonic() < deadline, "server did not start"
+                time.sleep(0.2)
+        assert response.json() == {"status": "healthy"}
+    finally:
+        process.send_signal(signal.SIGTERM)
+        _, log = process.communicate(timeout=30)
+
+    assert process.returncode == 0
+    assert log.count("Application shutdown complete") == 2
+    assert log.count("Started background tasks") == 1
@@ -0,0 +1,60 @@
+"""Tests for the cost of starting a worker."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Seconds importing the app may take in a fresh interpreter
+IMPORT_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_SECONDS", "2.0"))
+
+ROOT = Path(__file__).resolve().parents[2]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import src.presentation.api
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_app() -> dict:
+    """Import the app in a fresh interpreter and report what it cost."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_app_within_budget():
+    # Best of three, so a busy machine does not fail the test
+    seconds = min(import_app()["seconds"] for _ in range(3))
+    assert seconds < IMPORT_BUDGET_SECONDS
+
+
+def test_import_app_defers_heavy_dependencies():
+    modules = set(import_app()["modules"])
+    assert "hubspot" not in modules
+    assert "jinja2" not in modules
+
+
+def test_import_app_reads_no_settings_and_opens_no_files(tmp_path):
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith(("HUBSPOT_", "OAUTH_"))
+    }
+    env["PYTHONPATH"] = str(ROOT)
+    subprocess.run(
+        [sys.executable, "-c", "import src.presentation.api"],
+        cwd=tmp_path,
+        env=env,
+        check=True,
+    )
+    assert list(tmp_path.iterdir()) == []